@@ -37,7 +37,7 @@ setup(
         "teaser.examples.examplefiles",
     ],
     package_data={
-        "teaser.data.input.inputdata": ["*.json"],
+        "teaser.data.input.inputdata": ["*.json", "*.json.pickle"],
         "teaser.data.input.inputdata.weatherdata": [
             "DEU_BW_Mannheim_107290_TRY2010_12_Jahr_BBSR.mos",
             "ASHRAE140.mos",
@@ -81,4 +81,7 @@ setup(
         "Topic :: Utilities",
     ],
     install_requires=["mako", "pytest", "pandas", "numpy"],
+    entry_points={
+        "console_scripts": ["teaser-precompile=teaser.data.precompile:main"]
+    },
 )
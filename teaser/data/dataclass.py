@@ -3,8 +3,26 @@ import os
 import sys
 import teaser.logic.utilities as utils
 import json
+import copy
+import pickle
+import hashlib
+import bisect
 import collections
 
+MaterialPrototype = collections.namedtuple(
+    "MaterialPrototype",
+    [
+        "material_id",
+        "name",
+        "density",
+        "thermal_conduc",
+        "heat_capac",
+        "solar_absorp",
+        "thickness_default",
+        "thickness_list",
+    ],
+)
+
 v = sys.version_info
 if v >= (2, 7):
     try:
@@ -12,6 +30,153 @@ if v >= (2, 7):
     except NameError:
         FileNotFoundError = IOError
 
+_binding_registry = {}
+
+PICKLE_PROTOCOL = 4
+
+
+def get_compiled_path(path):
+    """Return the path of the compiled cache of a JSON file.
+
+    Parameters
+    ----------
+    path : str
+        Full path to the JSON file
+
+    Returns
+    ----------
+    compiled_path : str
+        Full path to the compiled cache, next to the JSON file
+    """
+    return path + ".pickle"
+
+
+def is_compiled_directory(path):
+    """Return True if compiled caches are used for a JSON file.
+
+    Compiled caches are pickled, loading them can run arbitrary code. They
+    are therefore only written and used for the input data shipped with
+    TEASER (teaser/data/input/inputdata), not next to JSON files of users.
+
+    Parameters
+    ----------
+    path : str
+        Full path to the JSON file
+
+    Returns
+    ----------
+    compiled : bool
+        True if the JSON file is in teaser/data/input/inputdata
+    """
+    directory = os.path.realpath(
+        utils.get_full_path(os.path.join("data", "input", "inputdata"))
+    )
+    return os.path.dirname(os.path.realpath(path)) == directory
+
+
+def compile_json_binding(path):
+    """Write the compiled cache of a JSON file.
+
+    The cache holds the parsed binding together with the SHA-256 hash of
+    the JSON file. load_json_binding() only uses the cache if the hash
+    matches the current content of the JSON file.
+
+    Parameters
+    ----------
+    path : str
+        Full path to the JSON file in teaser/data/input/inputdata (see
+        is_compiled_directory())
+
+    Returns
+    ----------
+    compiled_path : str
+        Full path to the written compiled cache
+    """
+    if not is_compiled_directory(path):
+        raise ValueError(
+            "Compiled caches are only used for TEASER input data, not for "
+            "{}".format(path)
+        )
+    with open(path, "rb") as f:
+        raw = f.read()
+    binding = json.loads(raw.decode("utf-8"), object_pairs_hook=collections.OrderedDict)
+    compiled_path = get_compiled_path(path)
+    with open(compiled_path, "wb") as f:
+        pickle.dump(
+            {"sha256": hashlib.sha256(raw).hexdigest(), "binding": binding},
+            f,
+            protocol=PICKLE_PROTOCOL,
+        )
+    return compiled_path
+
+
+def _load_compiled_binding(path, raw):
+    """Return the binding of a fresh compiled cache or None.
+
+    Any error while loading the cache (e.g. a newer pickle protocol or a
+    broken file) returns None, so the JSON file is parsed instead.
+    """
+    if not is_compiled_directory(path):
+        return None
+    compiled_path = get_compiled_path(path)
+    if not os.path.isfile(compiled_path):
+        return None
+    try:
+        with open(compiled_path, "rb") as f:
+            compiled = pickle.load(f)
+        if compiled["sha256"] != hashlib.sha256(raw).hexdigest():
+            return None
+        return compiled["binding"]
+    except Exception:
+        return None
+
+
+def load_json_binding(path):
+    """Load a JSON file into a binding shared within the process.
+
+    Parsed bindings are stored with the full path, modification time and
+    size of the file as key, so each file is only parsed once as long as it
+    does not change. If a compiled cache of the file exists (see
+    compile_json_binding()) and matches the content of the file, it is
+    loaded instead of parsing the JSON (only for the input data of TEASER,
+    see is_compiled_directory()). The returned binding is shared by
+    all DataClass instances and must not be modified, use
+    DataClass.writable_binding() before changing a binding.
+
+    Parameters
+    ----------
+    path : str
+        Full path to the JSON file
+
+    Returns
+    ----------
+    binding : collections.OrderedDict
+        Ordered dictionary of the JSON file
+    """
+    path = os.path.abspath(path)
+    stat = os.stat(path)
+    key = (path, stat.st_mtime_ns, stat.st_size)
+    try:
+        return _binding_registry[key]
+    except KeyError:
+        pass
+    with open(path, "rb") as f:
+        raw = f.read()
+    binding = _load_compiled_binding(path, raw)
+    if binding is None:
+        binding = json.loads(
+            raw.decode("utf-8"), object_pairs_hook=collections.OrderedDict
+        )
+    for old_key in [old_key for old_key in _binding_registry if old_key[0] == path]:
+        del _binding_registry[old_key]
+    _binding_registry[key] = binding
+    return binding
+
+
+def clear_binding_registry():
+    """Delete all shared bindings, files are parsed again on next load."""
+    _binding_registry.clear()
+
 
 class DataClass(object):
     """Class for JSON data.
@@ -43,11 +208,34 @@ class DataClass(object):
         Full path to UseConditions.json. Default is
         teaser/data/input/inputdata/UseConditions.json
 
+    Notes
+    -----
+    Type elements are looked up with an index on element_bind (element
+    class, construction type and sorted building age groups). The index is
+    built on first use and invalidated whenever element_bind is replaced,
+    reloaded or changed by save_type_element and delete_type_element. If
+    you change element_bind in place, call invalidate_element_index().
+
+    Bindings loaded from JSON files are shared by all DataClass instances of
+    the process (see load_json_binding()) and are treated as read-only.
+    Functions changing a binding (e.g. save_type_element) first call
+    writable_binding(), which replaces the shared binding with a private
+    copy. Do the same before changing a binding in place.
+
+    Materials are looked up by id directly in material_bind and by name with
+    a name to id index. For each id a read-only prototype of the converted
+    Material attributes is cached, which is copied to new Material
+    instances. Both are invalidated whenever material_bind is replaced,
+    reloaded or changed by save_material_template. If you change
+    material_bind in place, call invalidate_material_index().
+
     """
 
     def __init__(self, used_statistic="iwu"):
         """Construct DataClass."""
         self.used_statistic = used_statistic
+        self._shared_bindings = set()
+        self._element_index = None
         self.element_bind = None
         if self.used_statistic == "iwu":
             self.path_tb = utils.get_full_path(
@@ -70,6 +258,8 @@ class DataClass(object):
             self.load_tb_binding()
         elif self.used_statistic is None:
             pass
+        self._material_names = None
+        self._material_prototypes = {}
         self.material_bind = None
         self.path_mat = utils.get_full_path(
             "data/input/inputdata/MaterialTemplates.json"
@@ -85,30 +275,188 @@ class DataClass(object):
         if self.path_tb.endswith("json"):
             if os.path.isfile(self.path_tb):
                 try:
-                    with open(self.path_tb, "r+") as f:
-                        self.element_bind = json.load(
-                            f, object_pairs_hook=collections.OrderedDict
-                        )
+                    self.element_bind = load_json_binding(self.path_tb)
+                    self._shared_bindings.add("element_bind")
                 except json.decoder.JSONDecodeError:
                     print("Your TypeElements file seems to be broken.")
             else:
-                with open(self.path_tb, "w") as f:
+                with open(self.path_tb, "w"):
                     self.element_bind = collections.OrderedDict()
                     self.element_bind["version"] = "0.7"
 
+    def writable_binding(self, name):
+        """Return a binding that can be changed in place.
+
+        If the binding is shared with other DataClass instances, it is
+        replaced by a private copy first (copy-on-write).
+
+        Parameters
+        ----------
+        name : str
+            Name of the binding ('element_bind', 'material_bind' or
+            'conditions_bind')
+
+        Returns
+        ----------
+        binding : collections.OrderedDict
+            Binding owned by this DataClass
+        """
+        if name in self._shared_bindings:
+            setattr(self, name, copy.deepcopy(getattr(self, name)))
+        return getattr(self, name)
+
+    def invalidate_element_index(self):
+        """Invalidate the index of type elements.
+
+        The index is built again on the next call of find_type_elements().
+        """
+        self._element_index = None
+
+    def _build_element_index(self):
+        """Build the index of type elements.
+
+        The index maps the element class name (part of the key before the
+        first underscore) and the construction type to a list of
+        (begin of building age group, end of building age group, position,
+        key) tuples, sorted by begin of the building age group.
+        """
+        index = {}
+        for position, (key, element_in) in enumerate(self.element_bind.items()):
+            if key == "version":
+                continue
+            age_group = element_in["building_age_group"]
+            classes = index.setdefault(key.split("_")[0], {})
+            entries = classes.setdefault(element_in["construction_type"], [])
+            entries.append((age_group[0], age_group[1], position, key))
+        for classes in index.values():
+            for entries in classes.values():
+                entries.sort()
+        self._element_index = index
+
+    def find_type_elements(self, element_type, year, construction):
+        """Find type elements for element class, year and construction.
+
+        Parameters
+        ----------
+        element_type : str
+            Class name of the building element, e.g. 'OuterWall'. Like in
+            the JSON files, all keys starting with this name are considered
+        year : int
+            Year of construction
+        construction : str
+            Construction type, code list ('heavy', 'light', tabula, ...)
+
+        Returns
+        ----------
+        elements : list
+            List of (key, element) tuples of element_bind, in the order of
+            element_bind
+        """
+        if self._element_index is None:
+            self._build_element_index()
+
+        found = []
+        for class_name, classes in self._element_index.items():
+            if not class_name.startswith(element_type):
+                continue
+            entries = classes.get(construction)
+            if not entries:
+                continue
+            stop = bisect.bisect_right(entries, (year, float("inf")))
+            for begin, end, position, key in entries[:stop]:
+                if year <= end:
+                    found.append((position, key))
+        found.sort()
+        return [(key, self.element_bind[key]) for position, key in found]
+
+    def invalidate_material_index(self):
+        """Invalidate the name index and prototypes of materials."""
+        self._material_names = None
+        self._material_prototypes = {}
+
+    def find_material_id(self, mat_name):
+        """Find the material id for a material name.
+
+        If several materials share the same name, the id of the last one in
+        material_bind is returned.
+
+        Parameters
+        ----------
+        mat_name : str
+            Code list for Material
+
+        Returns
+        ----------
+        mat_id : str
+            id of the material in material_bind, None if the name is unknown
+        """
+        if self._material_names is None:
+            self._material_names = {}
+            for mat_id, mat in self.material_bind.items():
+                if mat_id != "version":
+                    self._material_names[mat["name"]] = mat_id
+        return self._material_names.get(mat_name)
+
+    def get_material_prototype(self, mat_id):
+        """Return the read-only attributes of a material template.
+
+        The JSON values of the material are converted once with the setters
+        of Material and cached per id.
+
+        Parameters
+        ----------
+        mat_id : str
+            id of material from JSON
+
+        Returns
+        ----------
+        prototype : MaterialPrototype
+            Named tuple of the Material attributes, None if the id is unknown
+        """
+        try:
+            return self._material_prototypes[mat_id]
+        except KeyError:
+            pass
+        if mat_id == "version" or mat_id not in self.material_bind:
+            return None
+
+        from teaser.logic.buildingobjects.buildingphysics.material import Material
+
+        mat = self.material_bind[mat_id]
+        material = Material()
+        material.material_id = mat_id
+        material.name = mat["name"]
+        material.density = mat["density"]
+        material.thermal_conduc = mat["thermal_conduc"]
+        material.heat_capac = mat["heat_capac"]
+        material.solar_absorp = mat["solar_absorp"]
+        material.thickness_default = mat["thickness_default"]
+        material.thickness_list = mat["thickness_list"]
+
+        prototype = MaterialPrototype(
+            material_id=material.material_id,
+            name=material.name,
+            density=material.density,
+            thermal_conduc=material.thermal_conduc,
+            heat_capac=material.heat_capac,
+            solar_absorp=material.solar_absorp,
+            thickness_default=material.thickness_default,
+            thickness_list=tuple(material.thickness_list),
+        )
+        self._material_prototypes[mat_id] = prototype
+        return prototype
+
     def load_uc_binding(self):
         """Load UseConditions json into binding classes."""
         if self.path_uc.endswith("json"):
             if os.path.isfile(self.path_uc):
                 try:
-                    with open(self.path_uc, "r+") as f:
-                        self.conditions_bind = json.load(
-                            f, object_pairs_hook=collections.OrderedDict
-                        )
+                    self.conditions_bind = load_json_binding(self.path_uc)
+                    self._shared_bindings.add("conditions_bind")
                 except json.decoder.JSONDecodeError:
                     raise IOError("Your UseConditions.json file seems to be broken.")
             else:
-                with open(self.path_uc, "w") as f:
+                with open(self.path_uc, "w"):
                     self.conditions_bind = collections.OrderedDict()
                     self.conditions_bind["version"] = "0.7"
 
@@ -117,13 +465,40 @@ class DataClass(object):
         if self.path_mat.endswith("json"):
             if os.path.isfile(self.path_mat):
                 try:
-                    with open(self.path_mat, "r+") as f:
-                        self.material_bind = json.load(
-                            f, object_pairs_hook=collections.OrderedDict
-                        )
+                    self.material_bind = load_json_binding(self.path_mat)
+                    self._shared_bindings.add("material_bind")
                 except json.decoder.JSONDecodeError:
                     print("Your Materials file seems to be broken.")
             else:
-                with open(self.path_mat, "w") as f:
+                with open(self.path_mat, "w"):
                     self.material_bind = collections.OrderedDict()
                     self.material_bind["version"] = "0.7"
+
+    @property
+    def element_bind(self):
+        return self._element_bind
+
+    @element_bind.setter
+    def element_bind(self, value):
+        self._element_bind = value
+        self._shared_bindings.discard("element_bind")
+        self.invalidate_element_index()
+
+    @property
+    def material_bind(self):
+        return self._material_bind
+
+    @material_bind.setter
+    def material_bind(self, value):
+        self._material_bind = value
+        self._shared_bindings.discard("material_bind")
+        self.invalidate_material_index()
+
+    @property
+    def conditions_bind(self):
+        return self._conditions_bind
+
+    @conditions_bind.setter
+    def conditions_bind(self, value):
+        self._conditions_bind = value
+        self._shared_bindings.discard("conditions_bind")
@@ -32,26 +32,18 @@ def load_type_element(element, year, construction, data_class):
         but the user can individually change that.
 
     """
-    element_binding = data_class.element_bind
-
-    for key, element_in in element_binding.items():
-        if key != "version":
-            if (
-                element_in["building_age_group"][0]
-                <= year
-                <= element_in["building_age_group"][1]
-                and element_in["construction_type"] == construction
-                and key.startswith(type(element).__name__)
-            ):
-                _set_basic_data(element=element, element_in=element_in)
-                for id, layer_in in element_in["layer"].items():
-                    layer = Layer(element)
-                    layer.id = id
-                    layer.thickness = layer_in["thickness"]
-                    material = Material(layer)
-                    mat_input.load_material_id(
-                        material, layer_in["material"]["material_id"], data_class
-                    )
+    for key, element_in in data_class.find_type_elements(
+        element_type=type(element).__name__, year=year, construction=construction
+    ):
+        _set_basic_data(element=element, element_in=element_in)
+        for id, layer_in in element_in["layer"].items():
+            layer = Layer(element)
+            layer.id = id
+            layer.thickness = layer_in["thickness"]
+            material = Material(layer)
+            mat_input.load_material_id(
+                material, layer_in["material"]["material_id"], data_class
+            )
 
 
 def _set_basic_data(element, element_in):
@@ -67,7 +59,7 @@ def _set_basic_data(element, element_in):
         json string of input data
 
     """
-    element.building_age_group = element_in["building_age_group"]
+    element.building_age_group = list(element_in["building_age_group"])
     element.construction_type = element_in["construction_type"]
     element.inner_radiation = element_in["inner_radiation"]
     element.inner_convection = element_in["inner_convection"]
@@ -23,26 +23,17 @@ def load_material(material, mat_name, data_class):
         but the user can individually change that.
 
     """
-    binding = data_class.material_bind
-
-    for id, mat in binding.items():
-        if id != "version":
-            if mat["name"] == mat_name:
-
-                material.material_id = id
-                material.name = mat["name"]
-                material.density = mat["density"]
-                material.thermal_conduc = mat["thermal_conduc"]
-                material.heat_capac = mat["heat_capac"]
-                material.solar_absorp = mat["solar_absorp"]
-                material.thickness_default = mat["thickness_default"]
-                material.thickness_list = mat["thickness_list"]
+    mat_id = data_class.find_material_id(mat_name)
+    if mat_id is not None:
+        load_material_id(material=material, mat_id=mat_id, data_class=data_class)
 
 
 def load_material_id(material, mat_id, data_class):
     """Material loader with id as identification.
 
-    Loads Material specified in the JSON by given material_id.
+    Loads Material specified in the JSON by given material_id. The values
+    are copied from the prototype of the material cached in data_class (see
+    DataClass.get_material_prototype()).
 
     Parameters
     ----------
@@ -58,17 +49,16 @@ def load_material_id(material, mat_id, data_class):
         but the user can individually change that.
 
     """
-    binding = data_class.material_bind
-
-    for id, mat in binding.items():
-        if id != "version":
-            if id == mat_id:
-
-                material.material_id = id
-                material.name = mat["name"]
-                material.density = mat["density"]
-                material.thermal_conduc = mat["thermal_conduc"]
-                material.heat_capac = mat["heat_capac"]
-                material.solar_absorp = mat["solar_absorp"]
-                material.thickness_default = mat["thickness_default"]
-                material.thickness_list = mat["thickness_list"]
+    prototype = data_class.get_material_prototype(mat_id)
+    if prototype is None:
+        return
+
+    material.material_id = prototype.material_id
+    material._name = prototype.name
+    material._density = prototype.density
+    material._heat_capac = prototype.heat_capac
+    material._solar_absorp = prototype.solar_absorp
+    material._thickness_default = prototype.thickness_default
+    material._thickness_list = list(prototype.thickness_list)
+    # setter is used to update the parent building element
+    material.thermal_conduc = prototype.thermal_conduc
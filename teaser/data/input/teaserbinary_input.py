@@ -0,0 +1,315 @@
+"""Load Projects in the compact binary TEASER file format.
+
+See teaser.data.output.teaserbinary_output for the layout of the files.
+Files are memory mapped, only the columns and rows of the requested
+buildings are read.
+"""
+
+import json
+import collections
+import numpy as np
+import teaser.data.output.teaserbinary_output as binary_out
+import teaser.data.output.teaserjson_output as tjson_out
+import teaser.data.input.teaserjson_input as tjson_in
+
+
+def load_teaser_binary(path, project, names=None):
+    """Load a project from a binary file.
+
+    Parameters
+    ----------
+    path: string
+        path of the binary file
+    project: Project()
+        Teaser instance of Project()
+    names: list
+        names of the buildings to load, default is None which loads all
+        buildings
+    """
+    with BinaryProjectFile(path) as binary_file:
+        tjson_in.set_project_data_teaser(project, binary_file.project_data)
+        for bldg_name, bldg_in in binary_file.iter_building_data(names=names):
+            tjson_in.load_building_teaser(project, bldg_name, bldg_in)
+
+
+def convert_binary_to_json(binary_path, json_path, compact=False):
+    """Convert a binary file to teaserjson without loss.
+
+    Parameters
+    ----------
+    binary_path: string
+        path of the binary file
+    json_path: string
+        path of the teaserjson file
+    compact: bool
+        if True, the file is written without indentation, default is False
+    """
+    with BinaryProjectFile(binary_path) as binary_file:
+        prj_out = collections.OrderedDict(
+            [("project", collections.OrderedDict(binary_file.project_data))]
+        )
+        with open(json_path, "w") as f:
+            for chunk in tjson_out.iter_json_chunks(
+                prj_out, binary_file.iter_building_data(), compact=compact
+            ):
+                f.write(chunk)
+
+
+class BinaryProjectFile(object):
+    """Memory mapped binary project file.
+
+    Parameters
+    ----------
+    path: string
+        path of the binary file
+
+    Attributes
+    ----------
+    project_data: collections.OrderedDict
+        project data without buildings (as in teaserjson)
+    building_names: list
+        names of all buildings in the file
+    """
+
+    def __init__(self, path):
+        self._data = np.memmap(path, dtype=np.uint8, mode="r")
+        header = binary_out.HEADER.unpack(
+            self._data[: binary_out.HEADER.size].tobytes()
+        )
+        magic, version, reserved, header_length = header
+        if magic != binary_out.MAGIC:
+            raise ValueError("{} is not a binary TEASER project".format(path))
+        if version > binary_out.SCHEMA_VERSION:
+            raise ValueError(
+                "Schema version {} of {} is not supported, update TEASER".format(
+                    version, path
+                )
+            )
+        header_end = binary_out.HEADER.size + header_length
+        self._header = json.loads(
+            self._data[binary_out.HEADER.size:header_end].tobytes().decode("utf-8"),
+            object_pairs_hook=collections.OrderedDict,
+        )
+        self._data_start = binary_out._align(header_end)
+        self._strings = {}
+        self._string_offsets = self._get_array(self._header["strings"]["offsets"])
+        self._string_data = self._get_array(self._header["strings"]["data"])
+        self._tables = self._header["tables"]
+
+        self.project_data = self._header["project"]
+        self.building_names = self.get_column("buildings", binary_out.KEY)
+        self._zone_start = self._get_start("buildings")
+        self._element_start = self._get_start("zones")
+        self._constructions = None
+
+    def close(self):
+        """Release the memory map of the file."""
+        self._data = None
+        self._string_offsets = None
+        self._string_data = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def get_column(self, table, name, start=0, stop=None):
+        """Read the values of a column.
+
+        Parameters
+        ----------
+        table: string
+            name of the table, see teaserbinary_output.TABLES
+        name: string
+            name of the column
+        start: int
+            first row to read, default is 0
+        stop: int
+            row after the last row to read, default is None for all rows
+
+        Returns
+        -------
+        values: list
+            value of each row, None for missing values
+        """
+        for column in self._tables[table]["columns"]:
+            if column["name"] == name:
+                return [
+                    None if value is binary_out._MISSING else value
+                    for value in self._read_column(column, start, stop)
+                ]
+        if not self._tables[table]["rows"]:
+            return []
+        raise KeyError("Column {} not in table {}".format(name, table))
+
+    def iter_building_data(self, names=None):
+        """Yield the data of buildings.
+
+        Parameters
+        ----------
+        names: list
+            names of the buildings, default is None for all buildings
+
+        Yields
+        ------
+        bldg_name: string
+            name of the building
+        bldg_in: collection.OrderedDict
+            data of the building, as in teaserjson
+        """
+        if names is not None:
+            names = set(names)
+        for index, bldg_name in enumerate(self.building_names):
+            if names is None or bldg_name in names:
+                yield bldg_name, self.get_building_data(index)
+
+    def get_building_data(self, index):
+        """Read the data of one building.
+
+        Parameters
+        ----------
+        index: int
+            index of the building
+
+        Returns
+        -------
+        bldg_in: collection.OrderedDict
+            data of the building, as in teaserjson
+        """
+        bldg_in = self._read_rows("buildings", index, index + 1)[0]
+        del bldg_in[binary_out.KEY]
+        zone_count = bldg_in.pop(binary_out.COUNT)
+        zone_start = self._zone_start[index]
+        zones = self._read_rows("zones", zone_start, zone_start + zone_count)
+        element_start = self._element_start[zone_start]
+        elements = self._read_rows(
+            "elements",
+            element_start,
+            self._element_start[zone_start + zone_count],
+        )
+        constructions = self._get_constructions()
+
+        bldg_in["thermal_zones"] = collections.OrderedDict()
+        elements = iter(elements)
+        for zone_in in zones:
+            zone_name = zone_in.pop(binary_out.KEY)
+            element_count = zone_in.pop(binary_out.COUNT)
+            for element_list in binary_out.ELEMENT_LISTS:
+                zone_in[element_list] = collections.OrderedDict()
+            for i in range(element_count):
+                element_in = next(elements)
+                element_list = binary_out.ELEMENT_LISTS[element_in.pop(binary_out.LIST)]
+                element_name = element_in.pop(binary_out.KEY)
+                layers = constructions[element_in.pop(binary_out.CONSTRUCTION)]
+                element_in["layer"] = collections.OrderedDict(
+                    (layer_id, _copy(layer_in)) for layer_id, layer_in in layers
+                )
+                zone_in[element_list][element_name] = element_in
+            bldg_in["thermal_zones"][zone_name] = zone_in
+        return bldg_in
+
+    def _get_constructions(self):
+        """Read all constructions with their layers and materials."""
+        if self._constructions is None:
+            materials = self._read_rows("materials")
+            layers = iter(self._read_rows("layers"))
+            self._constructions = []
+            for construction in self._read_rows("constructions"):
+                construction_layers = []
+                for i in range(construction[binary_out.COUNT]):
+                    layer_in = next(layers)
+                    layer_id = layer_in.pop(binary_out.KEY)
+                    if layer_in.get("material") is not None:
+                        layer_in["material"] = materials[layer_in["material"]]
+                    construction_layers.append((layer_id, layer_in))
+                self._constructions.append(construction_layers)
+        return self._constructions
+
+    def _get_start(self, table):
+        """Return the first row of the children of each row of table."""
+        counts = self.get_column(table, binary_out.COUNT)
+        start = np.zeros(len(counts) + 1, dtype=np.int64)
+        start[1:] = np.cumsum(counts, dtype=np.int64)
+        return start.tolist()
+
+    def _read_rows(self, table, start=0, stop=None):
+        """Read rows of a table as dicts, nested records are restored."""
+        if stop is None:
+            stop = self._tables[table]["rows"]
+        rows = [collections.OrderedDict() for i in range(stop - start)]
+        records = binary_out.RECORDS[table]
+        for column in self._tables[table]["columns"]:
+            name = column["name"]
+            record, dot, sub_name = name.partition(".")
+            nested = dot and record in records
+            for row, value in zip(rows, self._read_column(column, start, stop)):
+                if value is binary_out._MISSING:
+                    continue
+                if nested:
+                    if record not in row:
+                        row[record] = collections.OrderedDict()
+                    row[record][sub_name] = value
+                else:
+                    row[name] = value
+        return rows
+
+    def _read_column(self, column, start, stop):
+        """Read the values of a column, missing values are _MISSING."""
+        arrays = column["arrays"]
+        values = self._get_array(arrays["data"])[start:stop].tolist()
+        kind = column["kind"]
+        if kind == "bool":
+            values = [bool(value) for value in values]
+        elif kind == "number" and "is_int" in arrays:
+            is_int = self._get_array(arrays["is_int"])[start:stop].tolist()
+            values = [
+                int(value) if flag else value for value, flag in zip(values, is_int)
+            ]
+        elif kind == "str":
+            values = [self._get_string(code) for code in values]
+        elif kind == "json":
+            values = [json.loads(self._get_string(code)) for code in values]
+        if "state" in arrays:
+            state = self._get_array(arrays["state"])[start:stop].tolist()
+            values = [
+                value
+                if flag == binary_out.VALUE
+                else None
+                if flag == binary_out.NULL
+                else binary_out._MISSING
+                for value, flag in zip(values, state)
+            ]
+        return values
+
+    def _get_string(self, code):
+        """Return a string of the string pool."""
+        try:
+            return self._strings[code]
+        except KeyError:
+            pass
+        start, stop = self._string_offsets[code], self._string_offsets[code + 1]
+        value = self._string_data[start:stop].tobytes().decode("utf-8")
+        self._strings[code] = value
+        return value
+
+    def _get_array(self, array):
+        """Return an array of the file as read-only view of the memory map."""
+        dtype = np.dtype(array["dtype"])
+        if not array["length"]:
+            return np.zeros(0, dtype=dtype)
+        return np.frombuffer(
+            self._data,
+            dtype=dtype,
+            count=array["length"],
+            offset=self._data_start + array["offset"],
+        )
+
+
+def _copy(value):
+    """Copy nested dicts of a layer, so loaded buildings share no data."""
+    if isinstance(value, dict):
+        return collections.OrderedDict(
+            (key, _copy(item)) for key, item in value.items()
+        )
+    return value
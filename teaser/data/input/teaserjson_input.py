@@ -27,14 +27,32 @@ from teaser.logic.buildingobjects.buildingphysics.ceiling import Ceiling
 from teaser.logic.buildingobjects.buildingphysics.floor import Floor
 from teaser.logic.buildingobjects.buildingphysics.window import Window
 from teaser.logic.buildingobjects.buildingphysics.door import Door
+import re
 import json
 import collections
+from json.decoder import scanstring
 
 
-def load_teaser_json(path, project):
+_BUILDING_CLASS = {
+    "Office": {"method": "bmvbs", "teaser_class": Office},
+    "Institute": {"method": "bmvbs", "teaser_class": Institute},
+    "Institute4": {"method": "bmvbs", "teaser_class": Institute4},
+    "Institute8": {"method": "bmvbs", "teaser_class": Institute8},
+    "Building": {"method": "undefined", "teaser_class": Building},
+    "SingleFamilyDwelling": {"method": "iwu", "teaser_class": SingleFamilyDwelling},
+    "SingleFamilyHouse": {"method": "tabula_de", "teaser_class": SingleFamilyHouse},
+    "TerracedHouse": {"method": "tabula_de", "teaser_class": TerracedHouse},
+    "MultiFamilyHouse": {"method": "tabula_de", "teaser_class": MultiFamilyHouse},
+    "ApartmentBlock": {"method": "tabula_de", "teaser_class": ApartmentBlock},
+}
+
+
+def load_teaser_json(path, project, names=None, lazy=False):
     """Load a project from json.
 
-    TEASERs internal file format to store information.
+    TEASERs internal file format to store information. The file is parsed
+    building by building, so the parsed data of only one building is held
+    in memory at a time.
 
     Parameters
     ----------
@@ -44,211 +62,267 @@ def load_teaser_json(path, project):
     project: Project()
         Teaser instance of Project()
 
+    names: list
+        names of the buildings to load, default is None which loads all
+        buildings
+
+    lazy: bool
+        if True, buildings are created on first access of project.buildings
+        (see LazyBuildings), default is False
+
 
     """
-    __building_class = {
-        "Office": {"method": "bmvbs", "teaser_class": Office},
-        "Institute": {"method": "bmvbs", "teaser_class": Institute},
-        "Institute4": {"method": "bmvbs", "teaser_class": Institute4},
-        "Institute8": {"method": "bmvbs", "teaser_class": Institute8},
-        "Building": {"method": "undefined", "teaser_class": Building},
-        "SingleFamilyDwelling": {"method": "iwu", "teaser_class": SingleFamilyDwelling},
-        "SingleFamilyHouse": {"method": "tabula_de", "teaser_class": SingleFamilyHouse},
-        "TerracedHouse": {"method": "tabula_de", "teaser_class": TerracedHouse},
-        "MultiFamilyHouse": {"method": "tabula_de", "teaser_class": MultiFamilyHouse},
-        "ApartmentBlock": {"method": "tabula_de", "teaser_class": ApartmentBlock},
-    }
-    with open(path, "r+") as f:
-        prj_in = json.load(f, object_pairs_hook=collections.OrderedDict)
-
-    project.name = prj_in["project"]["name"]
-    project.weather_file_path = prj_in["project"]["weather_file_path"]
-    project.number_of_elements_calc = prj_in["project"]["number_of_elements_calc"]
-    project.merge_windows_calc = prj_in["project"]["merge_windows_calc"]
-    project.used_library_calc = prj_in["project"]["used_library_calc"]
-    project.modelica_info.start_time = prj_in["project"]["modelica_info"]["start_time"]
-    project.modelica_info.stop_time = prj_in["project"]["modelica_info"]["stop_time"]
-    project.modelica_info.interval_output = prj_in["project"]["modelica_info"][
-        "interval_output"
-    ]
-    project.modelica_info.current_solver = prj_in["project"]["modelica_info"][
-        "current_solver"
-    ]
-    project.modelica_info.equidistant_output = prj_in["project"]["modelica_info"][
+    buildings = None
+    if lazy:
+        if not isinstance(project.buildings, LazyBuildings):
+            project.buildings = LazyBuildings(project, project.buildings)
+        buildings = project.buildings
+    for bldg_name, bldg_in, bldg_text in _iter_building_data(
+        path, project, names=names, keep_text=lazy
+    ):
+        if lazy:
+            buildings.add_unloaded(bldg_name, bldg_text)
+        else:
+            load_building_teaser(project, bldg_name, bldg_in)
+
+
+def iter_buildings(path, project, names=None):
+    """Load the buildings of a json file one by one.
+
+    Sets the project data of the file and yields each building. The
+    buildings have project as parent, but are not kept in project.buildings,
+    so buildings that are no longer used by the caller are freed (e.g. to
+    calculate and export large projects building by building).
+
+    Parameters
+    ----------
+    path: string
+        path of teaserjson file
+    project: Project()
+        Teaser instance of Project()
+    names: list
+        names of the buildings to load, default is None which loads all
+        buildings
+
+    Yields
+    ------
+    bldg: Building()
+        loaded building
+    """
+    for bldg_name, bldg_in, bldg_text in _iter_building_data(
+        path, project, names=names
+    ):
+        bldg = load_building_teaser(project, bldg_name, bldg_in)
+        if project.buildings and project.buildings[-1] is bldg:
+            project.buildings.pop()
+        yield bldg
+
+
+def set_project_data_teaser(project, prj_in):
+    """Set the project data (without buildings) of a project.
+
+    Helper function.
+
+    Parameters
+    ----------
+    project: Project()
+        Teaser instance of Project()
+    prj_in: collection.OrderedDict
+        OrderedDict of the project
+    """
+    project.name = prj_in["name"]
+    project.weather_file_path = prj_in["weather_file_path"]
+    project.number_of_elements_calc = prj_in["number_of_elements_calc"]
+    project.merge_windows_calc = prj_in["merge_windows_calc"]
+    project.used_library_calc = prj_in["used_library_calc"]
+    project.modelica_info.start_time = prj_in["modelica_info"]["start_time"]
+    project.modelica_info.stop_time = prj_in["modelica_info"]["stop_time"]
+    project.modelica_info.interval_output = prj_in["modelica_info"]["interval_output"]
+    project.modelica_info.current_solver = prj_in["modelica_info"]["current_solver"]
+    project.modelica_info.equidistant_output = prj_in["modelica_info"][
         "equidistant_output"
     ]
-    project.modelica_info.results_at_events = prj_in["project"]["modelica_info"][
+    project.modelica_info.results_at_events = prj_in["modelica_info"][
         "results_at_events"
     ]
-    project.modelica_info.version = prj_in["project"]["modelica_info"]["version"]
-
-    for bldg_name, bldg_in in prj_in["project"]["buildings"].items():
-        bl_class = __building_class[bldg_in["classification"]["class"]]["teaser_class"]
-        bldg = bl_class(parent=project)
-        bldg.name = bldg_name
-        bldg.street_name = bldg_in["street_name"]
-        bldg.city = bldg_in["city"]
-        bldg.year_of_construction = bldg_in["year_of_construction"]
-        bldg.year_of_retrofit = bldg_in["year_of_retrofit"]
-        bldg.number_of_floors = bldg_in["number_of_floors"]
-        bldg.height_of_floors = bldg_in["height_of_floors"]
-        # bldg.net_leased_area = bldg_in["net_leased_area"]
-        bldg.outer_area = bldg_in["outer_area"]
-        bldg.window_area = bldg_in["window_area"]
+    project.modelica_info.version = prj_in["modelica_info"]["version"]
 
-        try:
-            bldg.central_ahu = BuildingAHU(parent=bldg)
-            bldg.central_ahu.heating = bldg_in["central_ahu"]["heating"]
-            bldg.central_ahu.cooling = bldg_in["central_ahu"]["cooling"]
-            bldg.central_ahu.dehumidification = bldg_in["central_ahu"][
-                "dehumidification"
-            ]
-            bldg.central_ahu.humidification = bldg_in["central_ahu"]["humidification"]
-            bldg.central_ahu.heat_recovery = bldg_in["central_ahu"]["heat_recovery"]
-            bldg.central_ahu.by_pass_dehumidification = bldg_in["central_ahu"][
-                "by_pass_dehumidification"
-            ]
-            bldg.central_ahu.efficiency_recovery = bldg_in["central_ahu"][
-                "efficiency_recovery"
-            ]
-            bldg.central_ahu.efficiency_recovery_false = bldg_in["central_ahu"][
-                "efficiency_recovery_false"
-            ]
-            bldg.central_ahu.min_relative_humidity_profile = bldg_in["central_ahu"][
-                "min_relative_humidity_profile"
-            ]
-            bldg.central_ahu.max_relative_humidity_profile = bldg_in["central_ahu"][
-                "max_relative_humidity_profile"
-            ]
-            bldg.central_ahu.v_flow_profile = bldg_in["central_ahu"]["v_flow_profile"]
-            bldg.central_ahu.temperature_profile = bldg_in["central_ahu"][
-                "temperature_profile"
-            ]
-        except KeyError:
-            pass
-
-        for tz_name, zone_in in bldg_in["thermal_zones"].items():
-            tz = ThermalZone(parent=bldg)
-            tz.name = tz_name
-            tz.area = zone_in["area"]
-            tz.volume = zone_in["volume"]
-            tz.use_conditions = UseConditions(parent=tz)
-            tz.use_conditions.usage = zone_in["use_conditions"]["usage"]
-            tz.use_conditions.typical_length = zone_in["use_conditions"][
-                "typical_length"
-            ]
-            tz.use_conditions.typical_width = zone_in["use_conditions"]["typical_width"]
-            tz.use_conditions.with_heating = zone_in["use_conditions"]["with_heating"]
-            tz.use_conditions.with_cooling = zone_in["use_conditions"]["with_cooling"]
-            tz.use_conditions.with_ideal_thresholds = zone_in["use_conditions"][
-                "with_ideal_thresholds"
-            ]
-            tz.use_conditions.T_threshold_heating = zone_in["use_conditions"][
-                "T_threshold_heating"
-            ]
-            tz.use_conditions.T_threshold_cooling = zone_in["use_conditions"][
-                "T_threshold_cooling"
-            ]
-            tz.use_conditions.fixed_heat_flow_rate_persons = zone_in["use_conditions"][
-                "fixed_heat_flow_rate_persons"
-            ]
-            tz.use_conditions.activity_degree_persons = zone_in["use_conditions"][
-                "activity_degree_persons"
-            ]
-            tz.use_conditions.persons = zone_in["use_conditions"]["persons"]
-            tz.use_conditions.internal_gains_moisture_no_people = zone_in[
-                "use_conditions"
-            ]["internal_gains_moisture_no_people"]
-            tz.use_conditions.ratio_conv_rad_persons = zone_in["use_conditions"][
-                "ratio_conv_rad_persons"
-            ]
-            tz.use_conditions.machines = zone_in["use_conditions"]["machines"]
-            tz.use_conditions.ratio_conv_rad_machines = zone_in["use_conditions"][
-                "ratio_conv_rad_machines"
-            ]
-            tz.use_conditions.lighting_power = zone_in["use_conditions"][
-                "lighting_power"
-            ]
-            tz.use_conditions.ratio_conv_rad_lighting = zone_in["use_conditions"][
-                "ratio_conv_rad_lighting"
-            ]
-            tz.use_conditions.use_constant_infiltration = zone_in["use_conditions"][
-                "use_constant_infiltration"
-            ]
-            tz.use_conditions.infiltration_rate = zone_in["use_conditions"][
-                "infiltration_rate"
-            ]
-            tz.use_conditions.max_user_infiltration = zone_in["use_conditions"][
-                "max_user_infiltration"
-            ]
-            tz.use_conditions.max_overheating_infiltration = zone_in["use_conditions"][
-                "max_overheating_infiltration"
-            ]
-            tz.use_conditions.max_summer_infiltration = zone_in["use_conditions"][
-                "max_summer_infiltration"
-            ]
-            tz.use_conditions.winter_reduction_infiltration = zone_in["use_conditions"][
-                "winter_reduction_infiltration"
-            ]
-            tz.use_conditions.min_ahu = zone_in["use_conditions"]["min_ahu"]
-            tz.use_conditions.max_ahu = zone_in["use_conditions"]["max_ahu"]
-            tz.use_conditions.with_ahu = zone_in["use_conditions"]["with_ahu"]
-            tz.use_conditions.heating_profile = zone_in["use_conditions"][
-                "heating_profile"
-            ]
-            tz.use_conditions.cooling_profile = zone_in["use_conditions"][
-                "cooling_profile"
-            ]
-            tz.use_conditions.persons_profile = zone_in["use_conditions"][
-                "persons_profile"
-            ]
-            tz.use_conditions.machines_profile = zone_in["use_conditions"][
-                "machines_profile"
-            ]
-            tz.use_conditions.lighting_profile = zone_in["use_conditions"][
-                "lighting_profile"
-            ]
-
-            for wall_name, wall_in in zone_in["outer_walls"].items():
-                out_wall = OuterWall(parent=tz)
-                out_wall.name = wall_name
-                set_basic_data_teaser(wall_in, out_wall)
-                set_layer_data_teaser(wall_in, out_wall)
-            for door_name, door_in in zone_in["doors"].items():
-                door = Door(parent=tz)
-                door.name = door_name
-                set_basic_data_teaser(door_in, door)
-                set_layer_data_teaser(door_in, door)
-            for roof_name, roof_in in zone_in["rooftops"].items():
-                roof = Rooftop(parent=tz)
-                roof.name = roof_name
-                set_basic_data_teaser(roof_in, roof)
-                set_layer_data_teaser(roof_in, roof)
-            for gf_name, gf_in in zone_in["ground_floors"].items():
-                gf = GroundFloor(parent=tz)
-                gf.name = gf_name
-                set_basic_data_teaser(gf_in, gf)
-                set_layer_data_teaser(gf_in, gf)
-            for win_name, win_in in zone_in["windows"].items():
-                win = Window(parent=tz)
-                win.name = win_name
-                set_basic_data_teaser(win_in, win)
-                set_layer_data_teaser(win_in, win)
-            for iw_name, iw_in in zone_in["inner_walls"].items():
-                in_wall = InnerWall(parent=tz)
-                in_wall.name = iw_name
-                set_basic_data_teaser(iw_in, in_wall)
-                set_layer_data_teaser(iw_in, in_wall)
-            for fl_name, fl_in in zone_in["floors"].items():
-                floor = Floor(parent=tz)
-                floor.name = fl_name
-                set_basic_data_teaser(fl_in, floor)
-                set_layer_data_teaser(fl_in, floor)
-            for cl_name, cl_in in zone_in["ceilings"].items():
-                ceil = Ceiling(parent=tz)
-                ceil.name = cl_name
-                set_basic_data_teaser(cl_in, ceil)
-                set_layer_data_teaser(cl_in, ceil)
+
+def load_building_teaser(project, bldg_name, bldg_in):
+    """Create a building of a project from json data.
+
+    Helper function.
+
+    Parameters
+    ----------
+    project: Project()
+        Teaser instance of Project(), parent of the building
+    bldg_name: string
+        name of the building
+    bldg_in: collection.OrderedDict
+        OrderedDict of the building
+
+    Returns
+    -------
+    bldg: Building()
+        loaded building, appended to project.buildings
+    """
+    bl_class = _BUILDING_CLASS[bldg_in["classification"]["class"]]["teaser_class"]
+    bldg = bl_class(parent=project)
+    bldg.name = bldg_name
+    bldg.street_name = bldg_in["street_name"]
+    bldg.city = bldg_in["city"]
+    bldg.year_of_construction = bldg_in["year_of_construction"]
+    bldg.year_of_retrofit = bldg_in["year_of_retrofit"]
+    bldg.number_of_floors = bldg_in["number_of_floors"]
+    bldg.height_of_floors = bldg_in["height_of_floors"]
+    # bldg.net_leased_area = bldg_in["net_leased_area"]
+    bldg.outer_area = bldg_in["outer_area"]
+    bldg.window_area = bldg_in["window_area"]
+
+    try:
+        bldg.central_ahu = BuildingAHU(parent=bldg)
+        bldg.central_ahu.heating = bldg_in["central_ahu"]["heating"]
+        bldg.central_ahu.cooling = bldg_in["central_ahu"]["cooling"]
+        bldg.central_ahu.dehumidification = bldg_in["central_ahu"]["dehumidification"]
+        bldg.central_ahu.humidification = bldg_in["central_ahu"]["humidification"]
+        bldg.central_ahu.heat_recovery = bldg_in["central_ahu"]["heat_recovery"]
+        bldg.central_ahu.by_pass_dehumidification = bldg_in["central_ahu"][
+            "by_pass_dehumidification"
+        ]
+        bldg.central_ahu.efficiency_recovery = bldg_in["central_ahu"][
+            "efficiency_recovery"
+        ]
+        bldg.central_ahu.efficiency_recovery_false = bldg_in["central_ahu"][
+            "efficiency_recovery_false"
+        ]
+        bldg.central_ahu.min_relative_humidity_profile = bldg_in["central_ahu"][
+            "min_relative_humidity_profile"
+        ]
+        bldg.central_ahu.max_relative_humidity_profile = bldg_in["central_ahu"][
+            "max_relative_humidity_profile"
+        ]
+        bldg.central_ahu.v_flow_profile = bldg_in["central_ahu"]["v_flow_profile"]
+        bldg.central_ahu.temperature_profile = bldg_in["central_ahu"][
+            "temperature_profile"
+        ]
+    except KeyError:
+        pass
+
+    for tz_name, zone_in in bldg_in["thermal_zones"].items():
+        tz = ThermalZone(parent=bldg)
+        tz.name = tz_name
+        tz.area = zone_in["area"]
+        tz.volume = zone_in["volume"]
+        tz.use_conditions = UseConditions(parent=tz)
+        tz.use_conditions.usage = zone_in["use_conditions"]["usage"]
+        tz.use_conditions.typical_length = zone_in["use_conditions"]["typical_length"]
+        tz.use_conditions.typical_width = zone_in["use_conditions"]["typical_width"]
+        tz.use_conditions.with_heating = zone_in["use_conditions"]["with_heating"]
+        tz.use_conditions.with_cooling = zone_in["use_conditions"]["with_cooling"]
+        tz.use_conditions.with_ideal_thresholds = zone_in["use_conditions"][
+            "with_ideal_thresholds"
+        ]
+        tz.use_conditions.T_threshold_heating = zone_in["use_conditions"][
+            "T_threshold_heating"
+        ]
+        tz.use_conditions.T_threshold_cooling = zone_in["use_conditions"][
+            "T_threshold_cooling"
+        ]
+        tz.use_conditions.fixed_heat_flow_rate_persons = zone_in["use_conditions"][
+            "fixed_heat_flow_rate_persons"
+        ]
+        tz.use_conditions.activity_degree_persons = zone_in["use_conditions"][
+            "activity_degree_persons"
+        ]
+        tz.use_conditions.persons = zone_in["use_conditions"]["persons"]
+        tz.use_conditions.internal_gains_moisture_no_people = zone_in[
+            "use_conditions"
+        ]["internal_gains_moisture_no_people"]
+        tz.use_conditions.ratio_conv_rad_persons = zone_in["use_conditions"][
+            "ratio_conv_rad_persons"
+        ]
+        tz.use_conditions.machines = zone_in["use_conditions"]["machines"]
+        tz.use_conditions.ratio_conv_rad_machines = zone_in["use_conditions"][
+            "ratio_conv_rad_machines"
+        ]
+        tz.use_conditions.lighting_power = zone_in["use_conditions"]["lighting_power"]
+        tz.use_conditions.ratio_conv_rad_lighting = zone_in["use_conditions"][
+            "ratio_conv_rad_lighting"
+        ]
+        tz.use_conditions.use_constant_infiltration = zone_in["use_conditions"][
+            "use_constant_infiltration"
+        ]
+        tz.use_conditions.infiltration_rate = zone_in["use_conditions"][
+            "infiltration_rate"
+        ]
+        tz.use_conditions.max_user_infiltration = zone_in["use_conditions"][
+            "max_user_infiltration"
+        ]
+        tz.use_conditions.max_overheating_infiltration = zone_in["use_conditions"][
+            "max_overheating_infiltration"
+        ]
+        tz.use_conditions.max_summer_infiltration = zone_in["use_conditions"][
+            "max_summer_infiltration"
+        ]
+        tz.use_conditions.winter_reduction_infiltration = zone_in["use_conditions"][
+            "winter_reduction_infiltration"
+        ]
+        tz.use_conditions.min_ahu = zone_in["use_conditions"]["min_ahu"]
+        tz.use_conditions.max_ahu = zone_in["use_conditions"]["max_ahu"]
+        tz.use_conditions.with_ahu = zone_in["use_conditions"]["with_ahu"]
+        tz.use_conditions.heating_profile = zone_in["use_conditions"]["heating_profile"]
+        tz.use_conditions.cooling_profile = zone_in["use_conditions"]["cooling_profile"]
+        tz.use_conditions.persons_profile = zone_in["use_conditions"]["persons_profile"]
+        tz.use_conditions.machines_profile = zone_in["use_conditions"][
+            "machines_profile"
+        ]
+        tz.use_conditions.lighting_profile = zone_in["use_conditions"][
+            "lighting_profile"
+        ]
+
+        for wall_name, wall_in in zone_in["outer_walls"].items():
+            out_wall = OuterWall(parent=tz)
+            out_wall.name = wall_name
+            set_basic_data_teaser(wall_in, out_wall)
+            set_layer_data_teaser(wall_in, out_wall)
+        for door_name, door_in in zone_in["doors"].items():
+            door = Door(parent=tz)
+            door.name = door_name
+            set_basic_data_teaser(door_in, door)
+            set_layer_data_teaser(door_in, door)
+        for roof_name, roof_in in zone_in["rooftops"].items():
+            roof = Rooftop(parent=tz)
+            roof.name = roof_name
+            set_basic_data_teaser(roof_in, roof)
+            set_layer_data_teaser(roof_in, roof)
+        for gf_name, gf_in in zone_in["ground_floors"].items():
+            gf = GroundFloor(parent=tz)
+            gf.name = gf_name
+            set_basic_data_teaser(gf_in, gf)
+            set_layer_data_teaser(gf_in, gf)
+        for win_name, win_in in zone_in["windows"].items():
+            win = Window(parent=tz)
+            win.name = win_name
+            set_basic_data_teaser(win_in, win)
+            set_layer_data_teaser(win_in, win)
+        for iw_name, iw_in in zone_in["inner_walls"].items():
+            in_wall = InnerWall(parent=tz)
+            in_wall.name = iw_name
+            set_basic_data_teaser(iw_in, in_wall)
+            set_layer_data_teaser(iw_in, in_wall)
+        for fl_name, fl_in in zone_in["floors"].items():
+            floor = Floor(parent=tz)
+            floor.name = fl_name
+            set_basic_data_teaser(fl_in, floor)
+            set_layer_data_teaser(fl_in, floor)
+        for cl_name, cl_in in zone_in["ceilings"].items():
+            ceil = Ceiling(parent=tz)
+            ceil.name = cl_name
+            set_basic_data_teaser(cl_in, ceil)
+            set_layer_data_teaser(cl_in, ceil)
+
+    return bldg
 
 
 def set_basic_data_teaser(wall_in, element):
@@ -319,3 +393,281 @@ def set_layer_data_teaser(wall_in, element):
         layer.material.heat_capac = layer_in["material"]["heat_capac"]
         layer.material.solar_absorp = layer_in["material"]["solar_absorp"]
         layer.material.ir_emissivity = layer_in["material"]["ir_emissivity"]
+
+
+class LazyBuildings(list):
+    """List of buildings that creates buildings on first access.
+
+    Used as project.buildings by load_teaser_json(lazy=True). The list holds
+    the json data of each building that was not accessed yet and replaces it
+    by the building on first access (indexing, iteration, pop). Adding and
+    removing buildings works as for a list.
+
+    Parameters
+    ----------
+    project: Project()
+        Teaser instance of Project(), parent of the buildings
+    buildings: list
+        buildings that are already loaded
+    """
+
+    def __init__(self, project, buildings=()):
+        super(LazyBuildings, self).__init__(buildings)
+        self._project = project
+        self._loading = None
+
+    def add_unloaded(self, bldg_name, bldg_text):
+        """Append a building that is created on first access.
+
+        Parameters
+        ----------
+        bldg_name: string
+            name of the building
+        bldg_text: string
+            json text of the building
+        """
+        list.append(self, _UnloadedBuilding(bldg_name, bldg_text))
+
+    def is_loaded(self, index):
+        """Check if the building at index was created already."""
+        return not isinstance(list.__getitem__(self, index), _UnloadedBuilding)
+
+    def load_all(self):
+        """Create all buildings that were not accessed yet."""
+        for index in range(list.__len__(self)):
+            self._load(index)
+
+    def append(self, bldg):
+        if self._loading is None:
+            list.append(self, bldg)
+        else:
+            list.__setitem__(self, self._loading, bldg)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._load(i) for i in range(*index.indices(len(self)))]
+        return self._load(index)
+
+    def __iter__(self):
+        index = 0
+        while index < list.__len__(self):
+            yield self._load(index)
+            index += 1
+
+    def __reversed__(self):
+        index = list.__len__(self) - 1
+        while index >= 0:
+            if index < list.__len__(self):
+                yield self._load(index)
+            index -= 1
+
+    def pop(self, index=-1):
+        self._load(index)
+        return list.pop(self, index)
+
+    def __reduce_ex__(self, protocol):
+        return list, (list(self),)
+
+    def _load(self, index):
+        """Return the building at index, create it if necessary."""
+        item = list.__getitem__(self, index)
+        if not isinstance(item, _UnloadedBuilding):
+            return item
+        if index < 0:
+            index += list.__len__(self)
+        bldg_in = json.loads(item.text, object_pairs_hook=collections.OrderedDict)
+        self._loading = index
+        try:
+            return load_building_teaser(self._project, item.name, bldg_in)
+        finally:
+            self._loading = None
+
+
+class _UnloadedBuilding(object):
+    """Json data of a building in LazyBuildings."""
+
+    __slots__ = ("name", "text")
+
+    def __init__(self, name, text):
+        self.name = name
+        self.text = text
+
+    def __repr__(self):
+        return "<unloaded building {}>".format(self.name)
+
+
+class _Scanner(object):
+    """Incremental parser of a json document.
+
+    Objects are read member by member with members(), the value of each
+    member is then either parsed with value(), skipped with skip() or read
+    with members().
+    """
+
+    _whitespace = re.compile(r"[ \t\n\r]*")
+    _string = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"', re.DOTALL)
+    _plain = re.compile(r'[^"\[\]{}]*')
+    _scalar = re.compile(r"[^,:\[\]{}\s]*")
+
+    def __init__(self, text):
+        self.text = text
+        self.index = 0
+        self.decoder = json.JSONDecoder(object_pairs_hook=collections.OrderedDict)
+
+    def members(self):
+        """Yield the keys of the object at the current position.
+
+        After each key, the value of the member has to be read before the
+        next key is requested.
+        """
+        self._expect("{")
+        if self._peek() == "}":
+            self.index += 1
+            return
+        while True:
+            self._expect('"')
+            key, self.index = scanstring(self.text, self.index)
+            self._expect(":")
+            self._skip()
+            yield key
+            if self._next() == "}":
+                return
+            self.index -= 1
+            self._expect(",")
+
+    def value(self):
+        """Parse the value at the current position."""
+        self._skip()
+        value, self.index = self.decoder.raw_decode(self.text, self.index)
+        return value
+
+    def skip(self):
+        """Skip the value at the current position without parsing it.
+
+        Only strings and brackets are matched, the content of the value is
+        not validated and no objects are created.
+        """
+        text = self.text
+        char = self._peek()
+        if char == '"':
+            self._skip_string()
+            return
+        if char not in ("{", "["):
+            self.index = self._scalar.match(text, self.index).end()
+            return
+        depth = 0
+        while True:
+            self.index = self._plain.match(text, self.index).end()
+            char = text[self.index:self.index + 1]
+            if char == '"':
+                self._skip_string()
+            elif char in ("{", "["):
+                depth += 1
+                self.index += 1
+            elif char in ("}", "]"):
+                depth -= 1
+                self.index += 1
+                if depth == 0:
+                    return
+            else:
+                raise ValueError("Unterminated value in teaserjson file")
+
+    def _skip_string(self):
+        match = self._string.match(self.text, self.index)
+        if match is None:
+            raise ValueError(
+                "Unterminated string at char {} of teaserjson file".format(self.index)
+            )
+        self.index = match.end()
+
+    def _skip(self):
+        self.index = self._whitespace.match(self.text, self.index).end()
+
+    def _peek(self):
+        self._skip()
+        return self.text[self.index:self.index + 1]
+
+    def _next(self):
+        char = self._peek()
+        self.index += 1
+        return char
+
+    def _expect(self, char):
+        if self._next() != char:
+            raise ValueError(
+                "Expecting '{}' at char {} of teaserjson file".format(
+                    char, self.index - 1
+                )
+            )
+
+
+def _iter_building_data(path, project, names=None, keep_text=False):
+    """Parse a json file building by building.
+
+    Sets the project data of the file with set_project_data_teaser() before
+    the first building is yielded. Buildings that are not in names are
+    skipped without parsing them.
+
+    Parameters
+    ----------
+    path: string
+        path of teaserjson file
+    project: Project()
+        Teaser instance of Project()
+    names: list
+        names of the buildings to yield, default is None for all buildings
+    keep_text: bool
+        if True, buildings are not parsed and the json text of each building
+        is yielded instead (e.g. to parse it on first access, see
+        LazyBuildings)
+
+    Yields
+    ------
+    bldg_name: string
+        name of the building
+    bldg_in: collection.OrderedDict
+        OrderedDict of the building, None if keep_text is True
+    bldg_text: string
+        json text of the building, None if keep_text is False
+    """
+    if names is not None:
+        names = set(names)
+    with open(path, "r") as f:
+        scanner = _Scanner(f.read())
+
+    prj_in = collections.OrderedDict()
+    project_set = False
+    deferred = []
+    for key in scanner.members():
+        if key != "project":
+            scanner.skip()
+            continue
+        for prj_key in scanner.members():
+            if prj_key != "buildings":
+                prj_in[prj_key] = scanner.value()
+                continue
+            # buildings are yielded while parsing if the project data
+            # precedes them (as in all files written by TEASER)
+            if "modelica_info" in prj_in:
+                set_project_data_teaser(project, prj_in)
+                project_set = True
+            for bldg_name in scanner.members():
+                if names is not None and bldg_name not in names:
+                    scanner.skip()
+                    continue
+                if keep_text:
+                    start = scanner.index
+                    scanner.skip()
+                    bldg_in = None
+                    bldg_text = scanner.text[start:scanner.index]
+                else:
+                    bldg_in = scanner.value()
+                    bldg_text = None
+                if project_set:
+                    yield bldg_name, bldg_in, bldg_text
+                else:
+                    deferred.append((bldg_name, bldg_in, bldg_text))
+    if not project_set:
+        set_project_data_teaser(project, prj_in)
+    for item in deferred:
+        yield item
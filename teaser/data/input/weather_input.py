@@ -0,0 +1,386 @@
+"""Load weather files in the Modelica table format (.mos).
+
+Weather files of TEASER (see Project.weather_file_path) are text files of
+Modelica.Blocks.Tables.CombiTable1Ds, as written by the weather data
+converter of IBPSA/AixLib: the declaration of the table (e.g. "double
+tab1(8760,30)"), comment lines (starting with "#") with the EPW records
+(e.g. LOCATION) and one documentation line per column (e.g. "#C2 Dry bulb
+temperature in Celsius at indicated time") and the rows of the table.
+
+Parsing the numeric table takes much longer than reading a binary array.
+The table is therefore stored once as NumPy file next to the weather file
+(see get_sidecar_path()) and memory mapped by later loads, so all processes
+that use the same weather file share its pages. The name of the sidecar
+contains the SHA-256 hash of the content of the weather file, so a changed
+weather file never uses the sidecar of its old content (independent of
+modification times). If the sidecar can not be written (e.g. read-only
+installation) the table is kept in memory.
+"""
+
+import os
+import re
+import hashlib
+import collections
+import numpy as np
+
+SIDECAR_EXTENSION = ".npy"
+
+SIDECAR_HASH_LENGTH = 20
+
+COLUMNS = [
+    "time",
+    "t_dry_bulb",
+    "t_dew_point",
+    "relative_humidity",
+    "pressure",
+    "extraterrestrial_horizontal",
+    "extraterrestrial_direct_normal",
+    "horizontal_infrared",
+    "global_horizontal",
+    "direct_normal",
+    "diffuse_horizontal",
+    "global_horizontal_illuminance",
+    "direct_normal_illuminance",
+    "diffuse_horizontal_illuminance",
+    "zenith_luminance",
+    "wind_direction",
+    "wind_speed",
+    "total_sky_cover",
+    "opaque_sky_cover",
+    "visibility",
+    "ceiling_height",
+    "present_weather_observation",
+    "present_weather_codes",
+    "precipitable_water",
+    "aerosol_optical_depth",
+    "snow_depth",
+    "days_since_last_snowfall",
+    "albedo",
+    "liquid_precipitation_depth",
+    "liquid_precipitation_quantity",
+]
+
+Location = collections.namedtuple(
+    "Location",
+    [
+        "city",
+        "state",
+        "country",
+        "source",
+        "wmo",
+        "latitude",
+        "longitude",
+        "time_zone",
+        "elevation",
+    ],
+)
+
+_declaration = re.compile(r"^\s*(?:double|float)\s+(\w+)\s*\(\s*(\d+)\s*,\s*(\d+)\s*\)")
+
+_column_doc = re.compile(r"^C(\d+)\s+(.*)$")
+
+_weather_registry = {}
+
+
+def get_sidecar_path(path):
+    """Return the path of the NumPy sidecar of a weather file.
+
+    Parameters
+    ----------
+    path : str
+        Full path to the weather file
+
+    Returns
+    ----------
+    sidecar_path : str
+        Full path to the sidecar of the current content of the weather file,
+        next to the weather file (e.g. "weather.mos.<hash>.npy")
+    """
+    sha256 = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            sha256.update(block)
+    return "{}.{}{}".format(
+        path, sha256.hexdigest()[:SIDECAR_HASH_LENGTH], SIDECAR_EXTENSION
+    )
+
+
+def load_weather(path, sidecar=True):
+    """Load a weather file into WeatherData shared within the process.
+
+    Loaded weather files are stored with the full path, modification time
+    and size of the file as key, so each file is only read once as long as
+    it does not change.
+
+    Parameters
+    ----------
+    path : str
+        Full path to the weather file (.mos)
+    sidecar : bool
+        If True (default), the table is read from (or written to) the NumPy
+        sidecar of the weather file and memory mapped
+
+    Returns
+    ----------
+    weather : WeatherData
+        Header and table of the weather file
+    """
+    path = os.path.abspath(path)
+    stat = os.stat(path)
+    key = (path, stat.st_mtime_ns, stat.st_size, sidecar)
+    try:
+        return _weather_registry[key]
+    except KeyError:
+        pass
+    weather = WeatherData(path, sidecar=sidecar)
+    for old_key in [old_key for old_key in _weather_registry if old_key[0] == path]:
+        del _weather_registry[old_key]
+    _weather_registry[key] = weather
+    return weather
+
+
+def clear_weather_registry():
+    """Delete all shared weather data, files are read again on next load."""
+    _weather_registry.clear()
+
+
+def parse_header(path):
+    """Parse the header of a weather file.
+
+    Parameters
+    ----------
+    path : str
+        Full path to the weather file
+
+    Returns
+    ----------
+    header : dict
+        "records": collections.OrderedDict of the EPW records (e.g.
+        "LOCATION") with the list of their fields, "columns": list of the
+        documentation of each column, "table_name", "shape": (rows,
+        columns) of the table and "data_line": index of the first line
+        after the declaration of the table
+    """
+    records = collections.OrderedDict()
+    columns = {}
+    declaration = None
+    with open(path, "r", encoding="latin-1") as f:
+        for number, line in enumerate(f):
+            line = line.strip()
+            if line.startswith("#"):
+                content = line[1:].strip()
+                match = _column_doc.match(content)
+                if match:
+                    columns[int(match.group(1))] = match.group(2).strip()
+                elif "," in content:
+                    name, fields = content.split(",", 1)
+                    records[name.strip()] = [
+                        field.strip() for field in fields.split(",")
+                    ]
+                continue
+            if not line:
+                continue
+            match = _declaration.match(line)
+            if match is None or declaration is not None:
+                break
+            declaration = match
+            data_line = number + 1
+    if declaration is None:
+        raise ValueError("No table declaration in weather file {}".format(path))
+    shape = (int(declaration.group(2)), int(declaration.group(3)))
+    return {
+        "records": records,
+        "columns": [columns.get(column, "") for column in range(1, shape[1] + 1)],
+        "table_name": declaration.group(1),
+        "shape": shape,
+        "data_line": data_line,
+    }
+
+
+def parse_table(path, header=None):
+    """Parse the numeric table of a weather file.
+
+    Comment lines after the declaration are skipped, the table ends at the
+    end of the file or at the declaration of a further table.
+
+    Parameters
+    ----------
+    path : str
+        Full path to the weather file
+    header : dict
+        Header of the file as returned by parse_header(), default is None,
+        which parses the header
+
+    Returns
+    ----------
+    table : np.array
+        Values of the table, one row per time step
+    """
+    if header is None:
+        header = parse_header(path)
+    rows = []
+    with open(path, "r", encoding="latin-1") as f:
+        for number, line in enumerate(f):
+            if number < header["data_line"]:
+                continue
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            if _declaration.match(line):
+                break
+            rows.append(line)
+    values = np.array(" ".join(rows).replace(",", " ").split(), dtype=float)
+    if values.size != header["shape"][0] * header["shape"][1]:
+        raise ValueError(
+            "Table {} of weather file {} has {} values, expected {}x{}".format(
+                header["table_name"], path, values.size, *header["shape"]
+            )
+        )
+    return values.reshape(header["shape"])
+
+
+class WeatherData(object):
+    """Weather data of a weather file in the Modelica table format.
+
+    Use load_weather() to share loaded weather files within a process.
+
+    Parameters
+    ----------
+    path : str
+        Full path to the weather file (.mos)
+    sidecar : bool
+        If True (default), the table is read from (or written to) the NumPy
+        sidecar of the weather file and memory mapped
+
+    Attributes
+    ----------
+    path : str
+        Full path to the weather file
+    records : collections.OrderedDict
+        EPW records of the header (e.g. "DESIGN CONDITIONS") with the list of
+        their fields
+    location : Location
+        City, state, country, source, WMO number, latitude [deg], longitude
+        [deg], time zone [h] and elevation [m] of the LOCATION record, None
+        if the header has no LOCATION record
+    column_docs : list
+        Documentation of each column of the header (e.g. "Dry bulb
+        temperature in Celsius at indicated time")
+    table_name : str
+        Name of the table (e.g. "tab1")
+    table : np.array
+        Values of the table, one row per time step, read-only
+    """
+
+    def __init__(self, path, sidecar=True):
+
+        self.path = os.path.abspath(path)
+        header = parse_header(self.path)
+        self.records = header["records"]
+        self.column_docs = header["columns"]
+        self.table_name = header["table_name"]
+        self.location = None
+        if "LOCATION" in self.records:
+            self.location = _get_location(self.records["LOCATION"])
+        if sidecar:
+            self.table = _load_sidecar(self.path, header)
+        else:
+            self.table = parse_table(self.path, header)
+            self.table.setflags(write=False)
+
+    def get_column(self, name):
+        """Returns the values of a column.
+
+        Parameters
+        ----------
+        name : str
+            Name of the column (see COLUMNS)
+
+        Returns
+        ----------
+        values : np.array
+            Value for each time step, in the units of the weather file (see
+            column_docs)
+        """
+        return self.table[:, COLUMNS.index(name)]
+
+    def get_t_outdoor(self):
+        """Returns the outdoor air temperature.
+
+        Returns
+        ----------
+        t_outdoor : np.array [K]
+            Dry bulb temperature for each time step
+        """
+        return self.get_column("t_dry_bulb") + 273.15
+
+    def get_t_sky(self):
+        """Returns the black body sky temperature.
+
+        The temperature is calculated from the horizontal infrared radiation,
+        as in IBPSA (BoundaryConditions.SkyTemperature.BlackBody).
+
+        Returns
+        ----------
+        t_sky : np.array [K]
+            Black body sky temperature for each time step
+        """
+        return (
+            np.maximum(self.get_column("horizontal_infrared"), 0.0) / 5.6697e-8
+        ) ** 0.25
+
+
+def _get_location(fields):
+    """Returns the Location of the fields of a LOCATION record."""
+    fields = list(fields) + [""] * (len(Location._fields) - len(fields))
+    values = fields[:5]
+    for field in fields[5:9]:
+        try:
+            values.append(float(field))
+        except ValueError:
+            values.append(None)
+    return Location(*values)
+
+
+def _load_sidecar(path, header):
+    """Returns the table of the sidecar, which is written if it is missing."""
+    sidecar_path = get_sidecar_path(path)
+    try:
+        table = np.load(sidecar_path, mmap_mode="r")
+        if table.shape == header["shape"] and table.dtype == np.float64:
+            return table
+    except (OSError, ValueError):
+        pass
+    table = parse_table(path, header)
+    temp_path = "{}.{}.tmp".format(sidecar_path, os.getpid())
+    try:
+        with open(temp_path, "wb") as f:
+            np.save(f, table)
+        os.replace(temp_path, sidecar_path)
+    except OSError:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        table.setflags(write=False)
+        return table
+    _remove_old_sidecars(path, sidecar_path)
+    return np.load(sidecar_path, mmap_mode="r")
+
+
+def _remove_old_sidecars(path, sidecar_path):
+    """Deletes sidecars of earlier contents of a weather file."""
+    directory, name = os.path.split(path)
+    pattern = re.compile(
+        re.escape(name)
+        + r"\.[0-9a-f]{%d}" % SIDECAR_HASH_LENGTH
+        + re.escape(SIDECAR_EXTENSION)
+        + "$"
+    )
+    for other in os.listdir(directory or "."):
+        other_path = os.path.join(directory, other)
+        if pattern.match(other) and other_path != sidecar_path:
+            try:
+                os.remove(other_path)
+            except OSError:
+                pass
@@ -1,13 +1,33 @@
 """This module contains function for AixLib model generation"""
 
 import os
+import hashlib
 import warnings
-from mako.template import Template
-from mako.lookup import TemplateLookup
 import teaser.logic.utilities as utilities
-
-
-def export_multizone(buildings, prj, path=None):
+import teaser.data.output.template_cache as template_cache
+import teaser.data.output.export_manifest as export_manifest
+import teaser.data.output.sinks as sinks
+import teaser.logic.parallel as parallel
+
+SHARED_PACKAGE = "SharedData"
+
+_TABLE_FILES = [
+    ("file_set_t_heat", "Tset"),
+    ("file_set_t_cool", "Tset"),
+    ("file_ahu", "AHU"),
+    ("file_internal_gains", "InternalGains"),
+]
+
+
+def export_multizone(
+        buildings,
+        prj,
+        path=None,
+        workers=None,
+        executor=None,
+        deduplicate=False,
+        incremental=False,
+        sink=None):
     """Exports models for AixLib library
 
     Exports a building for
@@ -22,7 +42,19 @@ def export_multizone(buildings, prj, path=None):
     old options please contact us.
 
     This function uses Mako Templates specified in
-    data.output.modelicatemplates.AixLib
+    data.output.modelicatemplates.AixLib, compiled templates are shared
+    with other exports (see data.output.template_cache)
+
+    With deduplicate=True, boundary condition tables and zone records are
+    identified by a hash of their content. Each unique table and record is
+    written once into the package SharedData of the project and all
+    building models refer to it, instead of one copy per building in
+    <bldg> and <bldg>/<bldg>_DataBase.
+
+    With incremental=True, only buildings that changed since the last
+    incremental export into path are exported (see
+    data.output.export_manifest). Packages of buildings that are no longer
+    part of buildings are deleted.
 
     Parameters
     ----------
@@ -37,50 +69,27 @@ def export_multizone(buildings, prj, path=None):
     path : string
         if the Files should not be stored in default output path of TEASER,
         an alternative path can be specified as a full path
+    workers : int
+        number of worker processes to export the buildings in parallel,
+        default is None which exports all buildings sequentially
+    executor : concurrent.futures.Executor
+        user defined executor to export the buildings in parallel (instead
+        of a new ProcessPoolExecutor with workers processes)
+    deduplicate : bool
+        if True, identical tables and zone records of all buildings are
+        shared in the package SharedData, default is False
+    incremental : bool
+        if True, unchanged buildings of the last incremental export are not
+        exported again, default is False
+    sink : teaser.data.output.sinks.DirectorySink
+        target of all files (e.g. an ArchiveSink), default is None, which
+        writes to the file system
 
-    Attributes
-    ----------
-
-    lookup : TemplateLookup object
-        Instance of mako.TemplateLookup to store general functions for templates
-    zone_template_1 : Template object
-        Template for ThermalZoneRecord using 1 element model
-    zone_template_2 : Template object
-        Template for ThermalZoneRecord using 2 element model
-    zone_template_3 : Template object
-        Template for ThermalZoneRecord using 3 element model
-    zone_template_4 : Template object
-        Template for ThermalZoneRecord using 4 element model
-    model_template : Template object
-        Template for MultiZone model
     """
-
-    lookup = TemplateLookup(directories=[utilities.get_full_path(
-        os.path.join('data', 'output', 'modelicatemplate'))])
-    zone_template_1 = Template(
-        filename=utilities.get_full_path(
-            "data/output/modelicatemplate/AixLib"
-            "/AixLib_ThermalZoneRecord_OneElement"),
-        lookup=lookup)
-    zone_template_2 = Template(
-        filename=utilities.get_full_path(
-            "data/output/modelicatemplate/AixLib"
-            "/AixLib_ThermalZoneRecord_TwoElement"),
-        lookup=lookup)
-    zone_template_3 = Template(
-        filename=utilities.get_full_path(
-            "data/output/modelicatemplate/AixLib"
-            "/AixLib_ThermalZoneRecord_ThreeElement"),
-        lookup=lookup)
-    zone_template_4 = Template(
-        filename=utilities.get_full_path(
-            "data/output/modelicatemplate/AixLib"
-            "/AixLib_ThermalZoneRecord_FourElement"),
-        lookup=lookup)
-    model_template = Template(
-        filename=utilities.get_full_path(
-            "data/output/modelicatemplate/AixLib/AixLib_Multizone"),
-        lookup=lookup)
+    if sink is None:
+        sink = sinks.DirectorySink()
+    if incremental and not sink.local:
+        raise ValueError("Incremental export is only possible into a directory")
 
     uses = [
         'Modelica(version="' + prj.modelica_info.version + '")',
@@ -89,39 +98,26 @@ def export_multizone(buildings, prj, path=None):
         path=path,
         name=prj.name,
         uses=uses,
-        within=None)
+        within=None,
+        sink=sink)
     _help_package_order(
         path=path,
         package_list=buildings,
         addition=None,
-        extra=None)
+        extra=SHARED_PACKAGE if deduplicate else None,
+        sink=sink)
 
-    for i, bldg in enumerate(buildings):
+    shared_path = os.path.join(path, SHARED_PACKAGE)
+    if deduplicate:
+        sink.makedirs(shared_path)
 
-        ass_error = "You chose IBPSA calculation, " \
-                    "but want to export AixLib models, " \
-                    "this is not possible"
+    ass_error = "You chose IBPSA calculation, " \
+                "but want to export AixLib models, " \
+                "this is not possible"
 
-        assert bldg.used_library_calc == 'AixLib', ass_error
+    for i, bldg in enumerate(buildings):
 
-        bldg_path = os.path.join(path, bldg.name)
-        utilities.create_path(utilities.get_full_path(bldg_path))
-        utilities.create_path(utilities.get_full_path(
-            os.path.join(bldg_path,
-                         bldg.name + "_DataBase")))
-        bldg.library_attr.modelica_set_temp(path=bldg_path)
-        bldg.library_attr.modelica_set_temp_cool(path=bldg_path)
-        bldg.library_attr.modelica_AHU_boundary(
-            path=bldg_path)
-        bldg.library_attr.modelica_gains_boundary(
-            path=bldg_path)
-
-        _help_package(path=bldg_path, name=bldg.name, within=bldg.parent.name)
-        _help_package_order(
-            path=bldg_path,
-            package_list=[bldg],
-            addition=None,
-            extra=bldg.name + "_DataBase")
+        assert bldg.used_library_calc == 'AixLib', ass_error
 
         if bldg.building_id is None:
             bldg.building_id = i
@@ -135,47 +131,319 @@ def export_multizone(buildings, prj, path=None):
                                                "the project list.")
                 bldg.building_id = i
 
-        out_file = open(utilities.get_full_path
-                        (os.path.join(bldg_path, bldg.name + ".mo")), 'w')
+    if incremental:
+        manifest, hashes, outdated = export_manifest.get_outdated_buildings(
+            path=path,
+            buildings=buildings,
+            sink=sink,
+            library="AixLib",
+            deduplicate=deduplicate)
+    else:
+        export_manifest.delete_manifest(path, sink=sink)
+        manifest, hashes, outdated = {}, {}, buildings
+
+    results = _export_buildings(
+        buildings=outdated,
+        export=_export_building,
+        workers=workers,
+        executor=executor,
+        sink=sink,
+        prj_name=prj.name,
+        path=path,
+        deduplicate=deduplicate)
+
+    shared_files = {}
+    for bldg in buildings:
+        if bldg.name in manifest:
+            shared_files[bldg.name] = manifest[bldg.name].get("shared_files", [])
+    for bldg, files in zip(outdated, results):
+        shared_files[bldg.name] = files
+
+    if deduplicate:
+        _help_shared_package(
+            path=shared_path,
+            prj_name=prj.name,
+            shared_files=set(
+                file_name
+                for bldg in buildings
+                for file_name in shared_files[bldg.name]),
+            sink=sink)
+
+    if incremental:
+        sink.flush()
+        export_manifest.save_manifest(
+            path=path,
+            sink=sink,
+            manifest={
+                bldg.name: {
+                    "hash": hashes[bldg.name],
+                    "shared_files": shared_files[bldg.name]}
+                for bldg in buildings})
+        sink.flush()
 
-        out_file.write(model_template.render_unicode(
-            bldg=bldg,
-            weather=bldg.parent.weather_file_path,
-            modelica_info=bldg.parent.modelica_info))
-        out_file.close()
+    print("Exports can be found here:")
+    print(path)
 
-        zone_path = os.path.join(bldg_path, bldg.name + "_DataBase")
 
-        for zone in bldg.thermal_zones:
+def _export_buildings(buildings, export, workers, executor, sink, **kwargs):
+    """Exports several buildings in this process or in worker processes
 
-            out_file = open(utilities.get_full_path(os.path.join(
-                zone_path, bldg.name + '_' + zone.name + '.mo')), 'w')
-            if type(zone.model_attr).__name__ == "OneElement":
-                out_file.write(zone_template_1.render_unicode(zone=zone))
-            elif type(zone.model_attr).__name__ == "TwoElement":
-                out_file.write(zone_template_2.render_unicode(zone=zone))
-            elif type(zone.model_attr).__name__ == "ThreeElement":
-                out_file.write(zone_template_3.render_unicode(zone=zone))
-            elif type(zone.model_attr).__name__ == "FourElement":
-                out_file.write(zone_template_4.render_unicode(zone=zone))
+    private function, do not call. Without workers and executor, all
+    buildings are exported sequentially. Workers write directly into local
+    sinks (directories) and flush their buffer after each building. For all
+    other sinks, workers collect the files of each building in memory and
+    this process writes them into the sink.
 
-            out_file.close()
+    Parameters
+    ----------
+
+    buildings : list
+        list of TEASER instances of Building
+    export : function
+        module level export function for one building
+    workers : int
+        number of worker processes
+    executor : concurrent.futures.Executor
+        user defined executor
+    sink : teaser.data.output.sinks.DirectorySink
+        target of all files
+
+    Returns
+    ----------
+
+    results : list
+        return values of export in the order of buildings
+
+    """
+    if workers is None and executor is None:
+        return [export(bldg=bldg, sink=sink, **kwargs) for bldg in buildings]
+    if sink.local:
+        sink.flush()
+        return parallel.export_buildings(
+            buildings=buildings,
+            export=sinks.FlushedExport(export),
+            workers=workers,
+            executor=executor,
+            sink=sink,
+            **kwargs)
+
+    def write_files(result):
+        sinks.write_files(sink=sink, files=result[1])
+        return result[0]
+
+    return parallel.export_buildings(
+        buildings=buildings,
+        export=sinks.BufferedExport(export),
+        workers=workers,
+        executor=executor,
+        callback=write_files,
+        **kwargs)
+
+
+def _export_building(bldg, prj_name, path, deduplicate=False, sink=None):
+    """Exports the models of one building for AixLib library
+
+    private function, do not call. Writes the model, zone records and
+    boundary condition tables of the building into its package below path.
+    With deduplicate=True tables and zone records are written to the
+    package SharedData instead.
+
+    Parameters
+    ----------
+
+    bldg : Building
+        TEASER instance of a Building
+    prj_name : string
+        name of the Modelica package of the project
+    path : string
+        path of the Modelica package of the project
+    deduplicate : bool
+        if True, tables and zone records are shared in SharedData
+    sink : teaser.data.output.sinks.DirectorySink
+        target of all files
+
+    Returns
+    ----------
 
+    shared_files : list
+        names of the tables and zone records of the building in SharedData,
+        empty if deduplicate is False
+
+    Attributes
+    ----------
+
+    zone_template_1 : Template object
+        Template for ThermalZoneRecord using 1 element model
+    zone_template_2 : Template object
+        Template for ThermalZoneRecord using 2 element model
+    zone_template_3 : Template object
+        Template for ThermalZoneRecord using 3 element model
+    zone_template_4 : Template object
+        Template for ThermalZoneRecord using 4 element model
+    model_template : Template object
+        Template for MultiZone model
+
+    """
+    zone_template_1 = template_cache.get_template(
+        "AixLib/AixLib_ThermalZoneRecord_OneElement")
+    zone_template_2 = template_cache.get_template(
+        "AixLib/AixLib_ThermalZoneRecord_TwoElement")
+    zone_template_3 = template_cache.get_template(
+        "AixLib/AixLib_ThermalZoneRecord_ThreeElement")
+    zone_template_4 = template_cache.get_template(
+        "AixLib/AixLib_ThermalZoneRecord_FourElement")
+    model_template = template_cache.get_template("AixLib/AixLib_Multizone")
+
+    if sink is None:
+        sink = sinks.DirectorySink()
+
+    bldg_path = os.path.join(path, bldg.name)
+    shared_path = os.path.join(path, SHARED_PACKAGE)
+    zone_path = os.path.join(bldg_path, bldg.name + "_DataBase")
+    sink.makedirs(utilities.get_full_path(bldg_path))
+    if not deduplicate:
+        sink.makedirs(utilities.get_full_path(zone_path))
+    else:
+        sink.rmtree(zone_path)
+        for attr, prefix in _TABLE_FILES:
+            table_path = os.path.join(bldg_path, getattr(bldg.library_attr, attr))
+            if sink.exists(table_path):
+                sink.remove(table_path)
+
+    if deduplicate:
+        table_sink = sinks.MemorySink()
+    else:
+        table_sink = sink
+    bldg.library_attr.modelica_set_temp(path=bldg_path, sink=table_sink)
+    bldg.library_attr.modelica_set_temp_cool(path=bldg_path, sink=table_sink)
+    bldg.library_attr.modelica_AHU_boundary(
+        path=bldg_path, sink=table_sink)
+    bldg.library_attr.modelica_gains_boundary(
+        path=bldg_path, sink=table_sink)
+
+    tables = {}
+    shared_files = []
+    for attr, prefix in _TABLE_FILES:
+        file_name = getattr(bldg.library_attr, attr)
+        if deduplicate:
+            table = table_sink.read(os.path.join(bldg_path, file_name))
+            shared_files.append(
+                prefix + "_" + hashlib.sha256(table).hexdigest()[:16] + ".txt")
+            sink.write_unique(
+                os.path.join(shared_path, shared_files[-1]), table)
+            tables[attr] = "modelica://{}/{}/{}".format(
+                prj_name, SHARED_PACKAGE, shared_files[-1])
+        else:
+            tables[attr] = "modelica://{}/{}/{}".format(
+                prj_name, bldg.name, file_name)
+
+    zone_records = []
+    for zone in bldg.thermal_zones:
+        if type(zone.model_attr).__name__ == "OneElement":
+            zone_template = zone_template_1
+        elif type(zone.model_attr).__name__ == "TwoElement":
+            zone_template = zone_template_2
+        elif type(zone.model_attr).__name__ == "ThreeElement":
+            zone_template = zone_template_3
+        elif type(zone.model_attr).__name__ == "FourElement":
+            zone_template = zone_template_4
+
+        if deduplicate:
+            record = zone_template.render_unicode(
+                zone=zone,
+                within=prj_name + '.' + SHARED_PACKAGE,
+                record_name="SHARED_RECORD")
+            record_name = "Zone_" + hashlib.sha256(
+                record.encode("utf-8")).hexdigest()[:16]
+            sink.write_unique(
+                os.path.join(shared_path, record_name + ".mo"),
+                record.replace("SHARED_RECORD", record_name))
+            zone_records.append(SHARED_PACKAGE + "." + record_name)
+            shared_files.append(record_name + ".mo")
+        else:
+            sink.write(
+                utilities.get_full_path(os.path.join(
+                    zone_path, bldg.name + '_' + zone.name + '.mo')),
+                zone_template.render_unicode(
+                    zone=zone,
+                    within=prj_name + '.' + bldg.name + '.' + bldg.name +
+                    '_DataBase',
+                    record_name=bldg.name + '_' + zone.name))
+            zone_records.append(
+                bldg.name + '_DataBase.' + bldg.name + '_' + zone.name)
+
+    _help_package(
+        path=bldg_path,
+        name=bldg.name,
+        within=bldg.parent.name,
+        sink=sink)
+    _help_package_order(
+        path=bldg_path,
+        package_list=[bldg],
+        addition=None,
+        extra=None if deduplicate else bldg.name + "_DataBase",
+        sink=sink)
+
+    sink.write(
+        utilities.get_full_path(os.path.join(bldg_path, bldg.name + ".mo")),
+        model_template.render_unicode(
+            bldg=bldg,
+            weather=bldg.parent.weather_file_path,
+            modelica_info=bldg.parent.modelica_info,
+            zone_records=zone_records,
+            tables=tables))
+
+    if not deduplicate:
         _help_package(
             path=zone_path,
             name=bldg.name + '_DataBase',
-            within=prj.name + '.' + bldg.name)
+            within=prj_name + '.' + bldg.name,
+            sink=sink)
         _help_package_order(
             path=zone_path,
             package_list=bldg.thermal_zones,
             addition=bldg.name + "_",
-            extra=None)
+            extra=None,
+            sink=sink)
 
-    print("Exports can be found here:")
-    print(path)
+    return shared_files
+
+
+def _help_shared_package(path, prj_name, shared_files, sink=None):
+    """Creates package.mo and package.order of the shared package
+
+    private function, do not call. Files in the shared package that are not
+    in shared_files are deleted.
 
+    Parameters
+    ----------
 
-def _help_package(path, name, uses=None, within=None):
+    path : string
+        path of the shared package
+    prj_name : string
+        name of the Modelica package of the project
+    shared_files : set
+        names of all tables and zone records used by the exported buildings
+    sink : teaser.data.output.sinks.DirectorySink
+        target of all files, default writes to the file system
+
+    """
+    if sink is None:
+        sink = sinks.DirectorySink()
+    for file_name in sink.listdir(path):
+        if file_name not in shared_files and \
+                file_name not in ["package.mo", "package.order"]:
+            sink.remove(os.path.join(path, file_name))
+    _help_package(path=path, name=SHARED_PACKAGE, within=prj_name, sink=sink)
+    records = sorted(
+        file_name[:-len(".mo")] for file_name in shared_files
+        if file_name.endswith(".mo"))
+    sink.write(
+        os.path.join(path, "package.order"),
+        "".join(record + "\n" for record in records))
+
+
+def _help_package(path, name, uses=None, within=None, sink=None):
     """creates a package.mo file
 
     private function, do not call
@@ -189,21 +457,23 @@ def _help_package(path, name, uses=None, within=None):
         name of the Modelica package
     within : string
         path of Modelica package containing this package
+    sink : teaser.data.output.sinks.DirectorySink
+        target of the file, default writes to the file system
 
     """
-
-    package_template = Template(filename=utilities.get_full_path(
-        "data/output/modelicatemplate/package"))
-    out_file = open(
-        utilities.get_full_path(os.path.join(path, "package.mo")), 'w')
-    out_file.write(package_template.render_unicode(
-        name=name,
-        within=within,
-        uses=uses))
-    out_file.close()
-
-
-def _help_package_order(path, package_list, addition=None, extra=None):
+    if sink is None:
+        sink = sinks.DirectorySink()
+    package_template = template_cache.get_template("package")
+    sink.write(
+        utilities.get_full_path(os.path.join(path, "package.mo")),
+        package_template.render_unicode(
+            name=name,
+            within=within,
+            uses=uses))
+
+
+def _help_package_order(
+        path, package_list, addition=None, extra=None, sink=None):
     """creates a package.order file
 
     private function, do not call
@@ -221,14 +491,15 @@ def _help_package_order(path, package_list, addition=None, extra=None):
     extra : string
         an extra package or model not contained in package_list can be
         specified
+    sink : teaser.data.output.sinks.DirectorySink
+        target of the file, default writes to the file system
 
     """
-
-    order_template = Template(filename=utilities.get_full_path(
-        "data/output/modelicatemplate/package_order"))
-
-    out_file = open(
-        utilities.get_full_path(path + "/" + "package" + ".order"), 'w')
-    out_file.write(order_template.render_unicode
-                   (list=package_list, addition=addition, extra=extra))
-    out_file.close()
+    if sink is None:
+        sink = sinks.DirectorySink()
+    order_template = template_cache.get_template("package_order")
+
+    sink.write(
+        utilities.get_full_path(path + "/" + "package" + ".order"),
+        order_template.render_unicode(
+            list=package_list, addition=addition, extra=extra))
@@ -27,6 +27,7 @@ def save_type_element(element, data_class):
         but the user can individually change that.
 
     """
+    data_class.writable_binding("element_bind")
     data_class.element_bind["version"] = "0.7"
     add_to_json = True
 
@@ -55,6 +56,7 @@ def save_type_element(element, data_class):
         _set_layer_data_json(
             element=element, wall_out=data_class.element_bind[check_str]
         )
+        data_class.invalidate_element_index()
 
     with open(utilities.get_full_path(data_class.path_tb), "w") as file:
         file.write(
@@ -85,7 +87,9 @@ def delete_type_element(element, data_class):
         type(element).__name__, element.building_age_group, element.construction_type
     )
 
+    data_class.writable_binding("element_bind")
     del data_class.element_bind[check_str]
+    data_class.invalidate_element_index()
 
     with open(utilities.get_full_path(data_class.path_tb), "w") as file:
         file.write(
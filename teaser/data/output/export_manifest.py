@@ -0,0 +1,318 @@
+"""This module contains the manifest of incremental Modelica exports.
+
+The manifest (teaser_manifest.json in the package of the project) stores a
+hash of the export relevant inputs of each exported building. An incremental
+export compares these hashes with the current buildings and only exports
+buildings that changed, were added or whose files are missing. Buildings of
+the manifest that are no longer exported are removed.
+
+The manifest is read from the file system, all files are written and
+deleted through the sink of the export (see teaser.data.output.sinks).
+
+The hash covers the attributes of the building, its library_attr,
+central_ahu, thermal zones, model_attr and use_conditions, the weather file
+and modelica_info of the project, the export options and the Modelica
+templates. Building elements are not part of the hash, as the export only
+uses the calculated model_attr: call calc_all_buildings() after changes of
+building elements, as for every export.
+"""
+
+import os
+import json
+import hashlib
+import numpy as np
+import teaser.data.output.sinks as sinks
+import teaser.data.output.template_cache as template_cache
+from teaser.logic.schedules import Profile
+
+MANIFEST_FILE = "teaser_manifest.json"
+
+_EXCLUDE = {
+    "parent",
+    "_parent",
+    "thermal_zone",
+    "_thermal_zone",
+    "internal_id",
+    "_schedules",
+}
+
+_SKIP = object()
+
+
+def load_manifest(path):
+    """Load the manifest of an export.
+
+    Parameters
+    ----------
+    path : str
+        Path of the exported Modelica package of the project
+
+    Returns
+    ----------
+    manifest : dict
+        Entry of each building with its hash, empty if there is no (valid)
+        manifest
+    """
+    try:
+        with open(os.path.join(path, MANIFEST_FILE)) as manifest_file:
+            manifest = json.load(manifest_file)
+    except (IOError, ValueError):
+        return {}
+    if not isinstance(manifest, dict):
+        return {}
+    return manifest
+
+
+def save_manifest(path, manifest, sink=None):
+    """Save the manifest of an export.
+
+    Parameters
+    ----------
+    path : str
+        Path of the exported Modelica package of the project
+    manifest : dict
+        Entry of each building with its hash
+    sink : teaser.data.output.sinks.DirectorySink
+        target of the manifest, default is None, which writes to the file
+        system
+    """
+    if sink is None:
+        sink = sinks.DirectorySink()
+    sink.write(
+        os.path.join(path, MANIFEST_FILE),
+        json.dumps(manifest, indent=2, sort_keys=True),
+    )
+
+
+def delete_manifest(path, sink=None):
+    """Delete the manifest of an export, if it exists.
+
+    A complete export deletes the manifest, as it may not match the
+    exported files anymore.
+
+    Parameters
+    ----------
+    path : str
+        Path of the exported Modelica package of the project
+    sink : teaser.data.output.sinks.DirectorySink
+        target of the export, default is None, which deletes the manifest
+        from the file system
+    """
+    if sink is None:
+        sink = sinks.DirectorySink()
+    manifest_path = os.path.join(path, MANIFEST_FILE)
+    if sink.exists(manifest_path):
+        sink.remove(manifest_path)
+
+
+def remove_stale_buildings(path, manifest, buildings, sink=None):
+    """Delete the packages of buildings that are no longer exported.
+
+    Only buildings listed in the manifest are deleted, all other files in
+    path are kept.
+
+    Parameters
+    ----------
+    path : str
+        Path of the exported Modelica package of the project
+    manifest : dict
+        Manifest of the previous export
+    buildings : list
+        List of TEASER instances of Building that are exported
+    sink : teaser.data.output.sinks.DirectorySink
+        target of the export, default is None, which deletes the packages
+        from the file system
+
+    Returns
+    ----------
+    stale : list
+        Names of the deleted building packages
+    """
+    if sink is None:
+        sink = sinks.DirectorySink()
+    names = set(bldg.name for bldg in buildings)
+    stale = sorted(name for name in manifest if name not in names)
+    for name in stale:
+        sink.rmtree(os.path.join(path, name))
+    return stale
+
+
+def is_current(path, manifest, bldg, building_hash, sink=None):
+    """Check if the exported files of a building are up to date.
+
+    Parameters
+    ----------
+    path : str
+        Path of the exported Modelica package of the project
+    manifest : dict
+        Manifest of the previous export
+    bldg : Building
+        TEASER instance of Building
+    building_hash : str
+        Current hash of the building, see hash_building()
+    sink : teaser.data.output.sinks.DirectorySink
+        target of the export, default is None for the file system
+
+    Returns
+    ----------
+    current : bool
+        True if the building was exported with the same hash and its
+        package still exists
+    """
+    if sink is None:
+        sink = sinks.DirectorySink()
+    entry = manifest.get(bldg.name)
+    return (
+        isinstance(entry, dict)
+        and entry.get("hash") == building_hash
+        and sink.exists(os.path.join(path, bldg.name))
+    )
+
+
+def get_outdated_buildings(path, buildings, sink=None, **options):
+    """Compare buildings with the manifest of the previous export.
+
+    Deletes the packages of buildings that are no longer exported (see
+    remove_stale_buildings()).
+
+    Parameters
+    ----------
+    path : str
+        Path of the exported Modelica package of the project
+    buildings : list
+        List of TEASER instances of Building that are exported
+    sink : teaser.data.output.sinks.DirectorySink
+        target of the export, default is None for the file system
+    options : dict
+        Export options that change the exported files (e.g. library)
+
+    Returns
+    ----------
+    manifest : dict
+        Manifest of the previous export
+    hashes : dict
+        Current hash of each building name
+    outdated : list
+        Buildings that need to be exported
+    """
+    if sink is None:
+        sink = sinks.DirectorySink()
+    manifest = load_manifest(path)
+    remove_stale_buildings(
+        path=path, manifest=manifest, buildings=buildings, sink=sink
+    )
+    templates_hash = get_templates_hash()
+    hashes = {}
+    outdated = []
+    for bldg in buildings:
+        hashes[bldg.name] = hash_building(
+            bldg, options=options, templates_hash=templates_hash
+        )
+        if not is_current(path, manifest, bldg, hashes[bldg.name], sink=sink):
+            outdated.append(bldg)
+    return manifest, hashes, outdated
+
+
+def hash_building(bldg, options=None, templates_hash=None):
+    """Hash the export relevant inputs of a building.
+
+    Parameters
+    ----------
+    bldg : Building
+        TEASER instance of Building
+    options : dict
+        Export options that change the exported files (e.g. library)
+    templates_hash : str
+        Hash of the Modelica templates, default is None, which calls
+        get_templates_hash()
+
+    Returns
+    ----------
+    building_hash : str
+        sha256 hash of the inputs
+    """
+    if templates_hash is None:
+        templates_hash = get_templates_hash()
+    project = bldg.parent
+    state = {
+        "options": _get_value(options or {}),
+        "templates": templates_hash,
+        "project": {
+            "name": getattr(project, "name", None),
+            "weather_file_path": getattr(project, "weather_file_path", None),
+            "modelica_info": _get_state(getattr(project, "modelica_info", None)),
+        },
+        "building": _get_state(bldg),
+        "library_attr": _get_state(bldg.library_attr),
+        "central_ahu": _get_state(bldg.central_ahu),
+        "thermal_zones": [
+            {
+                "zone": _get_state(zone),
+                "model_attr": _get_state(zone.model_attr),
+                "use_conditions": _get_state(zone.use_conditions),
+            }
+            for zone in bldg.thermal_zones
+        ],
+    }
+    return hashlib.sha256(
+        json.dumps(state, sort_keys=True).encode("utf-8")
+    ).hexdigest()
+
+
+def get_templates_hash():
+    """Hash the content of all Modelica templates.
+
+    Returns
+    ----------
+    templates_hash : str
+        sha256 hash of data/output/modelicatemplate
+    """
+    template_dir = template_cache.get_template_directory()
+    templates_hash = hashlib.sha256()
+    for root, dirs, files in sorted(os.walk(template_dir)):
+        for name in sorted(files):
+            templates_hash.update(name.encode("utf-8"))
+            with open(os.path.join(root, name), "rb") as template_file:
+                templates_hash.update(template_file.read())
+    return templates_hash.hexdigest()
+
+
+def _get_state(obj):
+    """Collect all attributes of obj with JSON serializable values.
+
+    Attributes holding other objects (e.g. building elements) and references
+    to parents are ignored.
+    """
+    if obj is None:
+        return None
+    state = {}
+    for key, value in vars(obj).items():
+        if key in _EXCLUDE:
+            continue
+        value = _get_value(value)
+        if value is not _SKIP:
+            state[key] = value
+    return state
+
+
+def _get_value(value):
+    """Convert value to a JSON serializable value, or _SKIP."""
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, Profile):
+        return list(value.values)
+    if isinstance(value, (list, tuple)):
+        values = [_get_value(item) for item in value]
+        if any(item is _SKIP for item in values):
+            return _SKIP
+        return values
+    if isinstance(value, dict):
+        values = {str(key): _get_value(item) for key, item in value.items()}
+        if any(item is _SKIP for item in values.values()):
+            return _SKIP
+        return values
+    return _SKIP
@@ -9,15 +9,20 @@ This module contains function to call Templates for IBPSA model generation
 import teaser.data.output.aixlib_output as ibpsa_output
 import os.path
 import teaser.logic.utilities as utilities
-from mako.template import Template
-from mako.lookup import TemplateLookup
+import teaser.data.output.template_cache as template_cache
+import teaser.data.output.export_manifest as export_manifest
+import teaser.data.output.sinks as sinks
 
 
 def export_ibpsa(
         buildings,
         prj,
         path=None,
-        library='AixLib'):
+        library='AixLib',
+        workers=None,
+        executor=None,
+        incremental=False,
+        sink=None):
     """Exports models for IBPSA library
 
     Export a building to several models for
@@ -30,6 +35,10 @@ def export_ibpsa(
     calculated in teaser.logic.calculation.ibpsa) but does not include any
     heating or cooling equipment.
 
+    With incremental=True, only buildings that changed since the last
+    incremental export into path are exported (see
+    data.output.export_manifest). Packages of buildings that are no longer
+    part of buildings are deleted.
 
     Parameters
     ----------
@@ -51,12 +60,106 @@ def export_ibpsa(
         just a core set of models and should not be used standalone.
         Valid values are 'AixLib' (default), 'Buildings',
         'BuildingSystems' and 'IDEAS'.
+    workers : int
+        number of worker processes to export the buildings in parallel,
+        default is None which exports all buildings sequentially
+    executor : concurrent.futures.Executor
+        user defined executor to export the buildings in parallel (instead
+        of a new ProcessPoolExecutor with workers processes)
+    incremental : bool
+        if True, unchanged buildings of the last incremental export are not
+        exported again, default is False
+    sink : teaser.data.output.sinks.DirectorySink
+        target of all files (e.g. an ArchiveSink), default is None, which
+        writes to the file system
 
-     Attributes
+    """
+    if sink is None:
+        sink = sinks.DirectorySink()
+    if incremental and not sink.local:
+        raise ValueError("Incremental export is only possible into a directory")
+
+    uses = uses = [
+        'Modelica(version="' + prj.modelica_info.version + '")',
+        library + '(version="' + prj.buildings[-1].library_attr.version[
+            library] + '")']
+
+    ibpsa_output._help_package(
+        path=path,
+        name=prj.name,
+        uses=uses,
+        within=None,
+        sink=sink)
+    ibpsa_output._help_package_order(
+        path=path,
+        package_list=buildings,
+        addition=None,
+        extra=None,
+        sink=sink)
+
+    ass_error = "You chose AixLib calculation, " \
+                "but want to export IBPSA models, " \
+                "this is not possible"
+
+    for bldg in buildings:
+        assert bldg.used_library_calc == 'IBPSA', ass_error
+
+    if incremental:
+        manifest, hashes, outdated = export_manifest.get_outdated_buildings(
+            path=path,
+            buildings=buildings,
+            sink=sink,
+            library=library)
+    else:
+        export_manifest.delete_manifest(path, sink=sink)
+        outdated = buildings
+
+    ibpsa_output._export_buildings(
+        buildings=outdated,
+        export=_export_building,
+        workers=workers,
+        executor=executor,
+        sink=sink,
+        prj_name=prj.name,
+        path=path,
+        library=library)
+
+    if incremental:
+        sink.flush()
+        export_manifest.save_manifest(
+            path=path,
+            sink=sink,
+            manifest={
+                bldg.name: {"hash": hashes[bldg.name]} for bldg in buildings})
+        sink.flush()
+
+    print("Exports can be found here:")
+    print(path)
+
+
+def _export_building(bldg, prj_name, path, library='AixLib', sink=None):
+    """Exports the models of one building for IBPSA library
+
+    private function, do not call. Writes the zone models and internal
+    gains of the building into its package below path.
+
+    Parameters
+    ----------
+
+    bldg : Building
+        TEASER instance of a Building
+    prj_name : string
+        name of the Modelica package of the project
+    path : string
+        path of the Modelica package of the project
+    library : str
+        Used library within the framework of IBPSA library
+    sink : teaser.data.output.sinks.DirectorySink
+        target of all files
+
+    Attributes
     ----------
 
-    lookup : TemplateLookup object
-        Instance of mako.TemplateLookup to store general functions for templates
     model_template_1 : Template object
         Template for ThermalZoneRecord using 1 element model
     model_template_2 : Template object
@@ -67,106 +170,70 @@ def export_ibpsa(
         Template for ThermalZoneRecord using 4 element model
 
     """
+    model_template_1 = template_cache.get_template("IBPSA/IBPSA_OneElement")
+    model_template_2 = template_cache.get_template("IBPSA/IBPSA_TwoElements")
+    model_template_3 = template_cache.get_template("IBPSA/IBPSA_ThreeElements")
+    model_template_4 = template_cache.get_template("IBPSA/IBPSA_FourElements")
 
-    uses = uses = [
-        'Modelica(version="' + prj.modelica_info.version + '")',
-        library + '(version="' + prj.buildings[-1].library_attr.version[
-            library] + '")']
+    if sink is None:
+        sink = sinks.DirectorySink()
+
+    bldg_path = os.path.join(path, bldg.name)
 
-    lookup = TemplateLookup(directories=[utilities.get_full_path(
-        os.path.join('data', 'output', 'modelicatemplate'))])
-    model_template_1 = Template(
-        filename=utilities.get_full_path(
-            "data/output/modelicatemplate/IBPSA/IBPSA_OneElement"),
-        lookup=lookup)
-    model_template_2 = Template(
-        filename=utilities.get_full_path(
-            "data/output/modelicatemplate/IBPSA/IBPSA_TwoElements"),
-        lookup=lookup)
-    model_template_3 = Template(
-        filename=utilities.get_full_path(
-            "data/output/modelicatemplate/IBPSA/IBPSA_ThreeElements"),
-        lookup=lookup)
-    model_template_4 = Template(
-        filename=utilities.get_full_path(
-            "data/output/modelicatemplate/IBPSA/IBPSA_FourElements"),
-        lookup=lookup)
+    sink.makedirs(utilities.get_full_path(bldg_path))
+    sink.makedirs(utilities.get_full_path(
+        os.path.join(bldg_path, bldg.name + "_Models")))
 
     ibpsa_output._help_package(
-        path=path,
-        name=prj.name,
-        uses=uses,
-        within=None)
+        path=bldg_path,
+        name=bldg.name,
+        within=bldg.parent.name,
+        sink=sink)
+
     ibpsa_output._help_package_order(
-        path=path,
-        package_list=buildings,
+        path=bldg_path,
+        package_list=[],
         addition=None,
-        extra=None)
+        extra=bldg.name + "_Models",
+        sink=sink)
 
-    for i, bldg in enumerate(buildings):
+    zone_path = os.path.join(
+        bldg_path,
+        bldg.name + "_Models")
 
-        ass_error = "You chose AixLib calculation, " \
-                    "but want to export IBPSA models, " \
-                    "this is not possible"
+    file_internal_gains = bldg.library_attr.file_internal_gains
+    for zone in bldg.thermal_zones:
 
-        assert bldg.used_library_calc == 'IBPSA', ass_error
-
-        bldg_path = os.path.join(path, bldg.name)
-
-        utilities.create_path(utilities.get_full_path(bldg_path))
-        utilities.create_path(utilities.get_full_path(
-            os.path.join(bldg_path, bldg.name + "_Models")))
-
-        ibpsa_output._help_package(
-            path=bldg_path,
-            name=bldg.name,
-            within=bldg.parent.name)
-
-        ibpsa_output._help_package_order(
-            path=bldg_path,
-            package_list=[],
-            addition=None,
-            extra=bldg.name + "_Models")
-
-        zone_path = os.path.join(
-            bldg_path,
-            bldg.name + "_Models")
-
-        for zone in bldg.thermal_zones:
-
-            zone.parent.library_attr.file_internal_gains = \
-                'InternalGains_' + bldg.name + zone.name + '.txt'
-            bldg.library_attr.modelica_gains_boundary(
-                zone=zone,
-                path=zone_path)
-
-            out_file = open(utilities.get_full_path(os.path.join(
-                zone_path, bldg.name + '_' + zone.name + '.mo')), 'w')
-
-            if type(zone.model_attr).__name__ == "OneElement":
-                out_file.write(model_template_1.render_unicode(zone=zone,
-                                                               library=library))
-            elif type(zone.model_attr).__name__ == "TwoElement":
-                out_file.write(model_template_2.render_unicode(zone=zone,
-                                                               library=library))
-            elif type(zone.model_attr).__name__ == "ThreeElement":
-                out_file.write(model_template_3.render_unicode(zone=zone,
-                                                               library=library))
-            elif type(zone.model_attr).__name__ == "FourElement":
-                out_file.write(model_template_4.render_unicode(zone=zone,
-                                                               library=library))
-
-            out_file.close()
-
-        ibpsa_output._help_package(
+        zone.parent.library_attr.file_internal_gains = \
+            'InternalGains_' + bldg.name + zone.name + '.txt'
+        bldg.library_attr.modelica_gains_boundary(
+            zone=zone,
             path=zone_path,
-            name=bldg.name + "_Models",
-            within=prj.name + '.' + bldg.name)
+            sink=sink)
+
+        if type(zone.model_attr).__name__ == "OneElement":
+            model_template = model_template_1
+        elif type(zone.model_attr).__name__ == "TwoElement":
+            model_template = model_template_2
+        elif type(zone.model_attr).__name__ == "ThreeElement":
+            model_template = model_template_3
+        elif type(zone.model_attr).__name__ == "FourElement":
+            model_template = model_template_4
+
+        sink.write(
+            utilities.get_full_path(os.path.join(
+                zone_path, bldg.name + '_' + zone.name + '.mo')),
+            model_template.render_unicode(zone=zone, library=library))
+    bldg.library_attr.file_internal_gains = file_internal_gains
 
-        ibpsa_output._help_package_order(
-            path=zone_path,
-            package_list=bldg.thermal_zones,
-            addition=bldg.name + "_")
+    ibpsa_output._help_package(
+        path=zone_path,
+        name=bldg.name + "_Models",
+        within=prj_name + '.' + bldg.name,
+        sink=sink)
 
-    print("Exports can be found here:")
-    print(path)
+    ibpsa_output._help_package_order(
+        path=zone_path,
+        package_list=bldg.thermal_zones,
+        addition=bldg.name + "_",
+        sink=sink)
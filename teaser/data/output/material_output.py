@@ -24,6 +24,7 @@ def save_material(material, data_class):
         but the user can individually change that.
 
     """
+    data_class.writable_binding("material_bind")
     data_class.material_bind["version"] = "0.7"
     add_to_json = True
 
@@ -64,6 +65,49 @@ def save_material(material, data_class):
             material.material_id]["thickness_list"] = material.thickness_list
         data_class.material_bind[
             material.material_id]["solar_absorp"] = material.solar_absorp
+        data_class.invalidate_material_index()
+
+    with open(utilities.get_full_path(data_class.path_mat), 'w') as file:
+        file.write(json.dumps(
+            data_class.material_bind,
+            indent=4,
+            separators=(',', ': ')))
+
+
+def modify_material(material, data_class):
+    """Material modifier.
+
+    Overwrites the properties of the material with the same material_id in
+    the JSON file for materials with the properties of the given material.
+    If there is no such material in the JSON, the material is not saved.
+
+    Parameters
+    ----------
+    material : Material()
+        instance of TEASERS Material class
+
+    data_class : DataClass()
+        DataClass containing the bindings for TypeBuildingElement and
+        Material (typically this is the data class stored in prj.data,
+        but the user can individually change that.
+
+    """
+    if material.material_id not in data_class.material_bind:
+        warnings.warn("Material with id {} does not exist in JSON, "
+                      "use save_material_template() "
+                      "instead".format(material.material_id))
+        return
+
+    data_class.writable_binding("material_bind")
+    mat_out = data_class.material_bind[material.material_id]
+    mat_out["name"] = material.name
+    mat_out["density"] = material.density
+    mat_out["thermal_conduc"] = material.thermal_conduc
+    mat_out["heat_capac"] = material.heat_capac
+    mat_out["thickness_default"] = material.thickness_default
+    mat_out["thickness_list"] = material.thickness_list
+    mat_out["solar_absorp"] = material.solar_absorp
+    data_class.invalidate_material_index()
 
     with open(utilities.get_full_path(data_class.path_mat), 'w') as file:
         file.write(json.dumps(
@@ -0,0 +1,456 @@
+"""This module contains the targets of Modelica exports and saved projects.
+
+Exports and save_teaser_json() write all files through a sink instead of
+calling open() directly. The sink decides where the files end up:
+
+DirectorySink
+    writes files to the file system (default), optionally buffered and
+    written in batches
+ArchiveSink
+    streams files into a zip or tar archive, without writing single files
+    to the file system
+MemorySink
+    keeps files in memory, e.g. to collect the files of a building in a
+    worker process
+
+All sinks are used with the full path a file would have on the file system.
+ArchiveSink and MemorySink store the paths relative to their root.
+"""
+
+import io
+import os
+import time
+import shutil
+import collections
+import uuid
+import tarfile
+import zipfile
+import teaser.logic.utilities as utilities
+
+DEFAULT_BUFFER_SIZE = 16 * 1024 * 1024
+
+ARCHIVE_FORMATS = {
+    "zip": None,
+    "tar": "",
+    "gztar": "gz",
+    "bztar": "bz2",
+    "xztar": "xz",
+}
+
+_ARCHIVE_EXTENSIONS = [
+    (".zip", "zip"),
+    (".tar.gz", "gztar"),
+    (".tgz", "gztar"),
+    (".tar.bz2", "bztar"),
+    (".tar.xz", "xztar"),
+    (".tar", "tar"),
+]
+
+
+class DirectorySink(object):
+    """Sink that writes files to the file system.
+
+    With buffer_size, written files are kept in memory and written in one
+    batch once their total size exceeds buffer_size, and on flush() or
+    close(). A file written several times before the batch is written only
+    once. exists(), listdir() and remove() include the buffered files.
+
+    Parameters
+    ----------
+    buffer_size : int
+        Size of the buffer in bytes (characters for str). Default is None,
+        which writes each file immediately
+    """
+
+    local = True
+
+    def __init__(self, buffer_size=None):
+        self.buffer_size = buffer_size
+        self._pending = collections.OrderedDict()
+        self._pending_size = 0
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_pending"] = collections.OrderedDict()
+        state["_pending_size"] = 0
+        return state
+
+    def makedirs(self, path):
+        """Create a directory and all missing parents.
+
+        Parameters
+        ----------
+        path : str
+            Full path of the directory
+        """
+        utilities.create_path(path)
+
+    def write(self, path, data):
+        """Write a file.
+
+        Parameters
+        ----------
+        path : str
+            Full path of the file
+        data : str or bytes
+            Content of the file
+        """
+        self._add(path, data, unique=False)
+
+    def write_unique(self, path, data):
+        """Write a file, unless it exists already.
+
+        Used for content addressed files, that several worker processes may
+        write at the same time. The file is written to a temporary file
+        first and then renamed.
+
+        Parameters
+        ----------
+        path : str
+            Full path of the file
+        data : str or bytes
+            Content of the file
+        """
+        if not self.exists(path):
+            self._add(path, data, unique=True)
+
+    def open(self, path):
+        """Open a text file for writing, to write large files in parts.
+
+        The file is written directly, bypassing the buffer.
+
+        Parameters
+        ----------
+        path : str
+            Full path of the file
+
+        Returns
+        ----------
+        file : file object
+            Writable text file, the file is complete once it is closed
+        """
+        if path in self._pending:
+            self._pending_size -= len(self._pending.pop(path)[0])
+        return open(path, "w")
+
+    def exists(self, path):
+        """Check if a file or directory exists."""
+        return path in self._pending or os.path.exists(path)
+
+    def listdir(self, path):
+        """Return the names of all files in a directory."""
+        names = set(os.listdir(path))
+        names.update(
+            os.path.basename(file_path)
+            for file_path in self._pending
+            if os.path.dirname(file_path) == path
+        )
+        return sorted(names)
+
+    def remove(self, path):
+        """Delete a file."""
+        if path in self._pending:
+            self._pending_size -= len(self._pending.pop(path)[0])
+            if not os.path.exists(path):
+                return
+        os.remove(path)
+
+    def rmtree(self, path):
+        """Delete a directory and all its content, if it exists."""
+        prefix = os.path.join(path, "")
+        for file_path in [p for p in self._pending if p.startswith(prefix)]:
+            self._pending_size -= len(self._pending.pop(file_path)[0])
+        shutil.rmtree(path, ignore_errors=True)
+
+    def flush(self):
+        """Write all buffered files."""
+        pending = self._pending
+        self._pending = collections.OrderedDict()
+        self._pending_size = 0
+        for path, (data, unique) in pending.items():
+            if not unique:
+                _write_file(path, data)
+            elif not os.path.exists(path):
+                # open() keeps the permissions of other files (umask),
+                # unlike tempfile.mkstemp()
+                temp_path = "{}.{}.tmp".format(path, uuid.uuid4().hex)
+                _write_file(temp_path, data)
+                os.replace(temp_path, path)
+
+    def close(self):
+        """Write all buffered files."""
+        self.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _add(self, path, data, unique):
+        """Buffer a file and write the buffer if it is full."""
+        if path in self._pending:
+            self._pending_size -= len(self._pending.pop(path)[0])
+        self._pending[path] = (data, unique)
+        self._pending_size += len(data)
+        if self.buffer_size is None or self._pending_size >= self.buffer_size:
+            self.flush()
+
+
+class MemorySink(DirectorySink):
+    """Sink that keeps all files in memory.
+
+    Parameters
+    ----------
+    root : str
+        Path the stored file names are relative to. Default is None, which
+        stores full paths
+
+    Attributes
+    ----------
+    files : dict
+        Content (bytes) of each file name in the order of writing
+    """
+
+    local = False
+
+    def __init__(self, root=None):
+        self.root = root
+        self.files = {}
+
+    def get_name(self, path):
+        """Return the stored name of a full path."""
+        if self.root is None:
+            return os.path.normpath(path)
+        return os.path.relpath(path, self.root).replace(os.sep, "/")
+
+    def makedirs(self, path):
+        pass
+
+    def write(self, path, data):
+        if not isinstance(data, bytes):
+            data = data.encode("utf-8")
+        self.files[self.get_name(path)] = data
+
+    def write_unique(self, path, data):
+        if self.get_name(path) not in self.get_names():
+            self.write(path, data)
+
+    def open(self, path):
+        return _SinkFile(self, path)
+
+    def read(self, path):
+        """Return the content (bytes) of a file."""
+        return self.files[self.get_name(path)]
+
+    def get_names(self):
+        """Return the stored names of all written files."""
+        return self.files
+
+    def exists(self, path):
+        name = self.get_name(path)
+        names = self.get_names()
+        return name in names or any(
+            file_name.startswith(name + "/") for file_name in names
+        )
+
+    def listdir(self, path):
+        prefix = self.get_name(path) + "/"
+        return sorted(
+            set(
+                file_name[len(prefix):].split("/")[0]
+                for file_name in self.get_names()
+                if file_name.startswith(prefix)
+            )
+        )
+
+    def remove(self, path):
+        del self.files[self.get_name(path)]
+
+    def rmtree(self, path):
+        prefix = self.get_name(path) + "/"
+        for name in [name for name in self.files if name.startswith(prefix)]:
+            del self.files[name]
+
+    def flush(self):
+        pass
+
+
+class ArchiveSink(MemorySink):
+    """Sink that streams files into a zip or tar archive.
+
+    Each file is added to the archive when it is written. Files can not be
+    removed or overwritten, so incremental exports into archives are not
+    possible.
+
+    Parameters
+    ----------
+    archive : str or file object
+        Path of the archive or a binary file object to write the archive to
+    root : str
+        Path the names in the archive are relative to
+    archive_format : str
+        One of 'zip', 'tar', 'gztar', 'bztar' and 'xztar' (see
+        shutil.make_archive()). Default is None, which derives the format
+        from the name of archive
+    """
+
+    def __init__(self, archive, root, archive_format=None):
+        super(ArchiveSink, self).__init__(root=root)
+        if archive_format is None:
+            archive_format = get_archive_format(archive)
+        if archive_format not in ARCHIVE_FORMATS:
+            raise ValueError("Unknown archive format: " + str(archive_format))
+        self.archive_format = archive_format
+        self._names = set()
+        if archive_format == "zip":
+            self._archive = zipfile.ZipFile(
+                archive, mode="w", compression=zipfile.ZIP_DEFLATED
+            )
+        else:
+            compression = ARCHIVE_FORMATS[archive_format]
+            if isinstance(archive, str):
+                self._archive = tarfile.open(archive, mode="w:" + compression)
+            else:
+                self._archive = tarfile.open(
+                    fileobj=archive, mode="w|" + compression
+                )
+
+    def write(self, path, data):
+        if not isinstance(data, bytes):
+            data = data.encode("utf-8")
+        name = self.get_name(path)
+        if name in self._names:
+            raise ValueError("File exists in archive: " + name)
+        self._names.add(name)
+        if self.archive_format == "zip":
+            self._archive.writestr(name, data)
+        else:
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            info.mtime = time.time()
+            self._archive.addfile(info, io.BytesIO(data))
+
+    def read(self, path):
+        raise IOError("Files can not be read from an archive")
+
+    def get_names(self):
+        return self._names
+
+    def remove(self, path):
+        raise IOError("Files can not be removed from an archive")
+
+    def rmtree(self, path):
+        if self.exists(path):
+            raise IOError("Files can not be removed from an archive")
+
+    def close(self):
+        """Write the end of the archive."""
+        self._archive.close()
+
+
+class _SinkFile(io.StringIO):
+    """Text file that is written into a sink when it is closed."""
+
+    def __init__(self, sink, path):
+        super(_SinkFile, self).__init__()
+        self.sink = sink
+        self.path = path
+
+    def close(self):
+        if not self.closed:
+            self.sink.write(self.path, self.getvalue())
+        super(_SinkFile, self).close()
+
+
+class BufferedExport(object):
+    """Wrapper of an export function that returns all written files.
+
+    Used to run exports into a sink that can not be shared with worker
+    processes (e.g. an archive): the worker writes into a MemorySink and
+    the calling process adds the files to the sink, see write_files().
+
+    Parameters
+    ----------
+    export : function
+        Module level export function, called with sink=MemorySink()
+    """
+
+    def __init__(self, export):
+        self.export = export
+
+    def __call__(self, **kwargs):
+        sink = MemorySink()
+        result = self.export(sink=sink, **kwargs)
+        return result, sink.files
+
+
+class FlushedExport(object):
+    """Wrapper of an export function that flushes the sink after each call.
+
+    Used to run exports into a buffered DirectorySink in worker processes:
+    each worker gets a copy of the sink without buffered files and writes
+    its buffer before it returns.
+
+    Parameters
+    ----------
+    export : function
+        Module level export function, called with a sink
+    """
+
+    def __init__(self, export):
+        self.export = export
+
+    def __call__(self, sink, **kwargs):
+        result = self.export(sink=sink, **kwargs)
+        sink.flush()
+        return result
+
+
+def write_files(sink, files):
+    """Write the files collected by a MemorySink without root.
+
+    Files that exist already are skipped, as shared files may be collected
+    by several worker processes.
+
+    Parameters
+    ----------
+    sink : DirectorySink
+        Target of the files
+    files : dict
+        Content of each full path, see MemorySink.files
+    """
+    for path, data in files.items():
+        sink.write_unique(path, data)
+
+
+def _write_file(path, data):
+    """Write str or bytes to a file."""
+    if isinstance(data, bytes):
+        with open(path, "wb") as out_file:
+            out_file.write(data)
+    else:
+        with open(path, "w") as out_file:
+            out_file.write(data)
+
+
+def get_archive_format(archive):
+    """Derive the archive format from the name of an archive.
+
+    Parameters
+    ----------
+    archive : str or file object
+        Path of the archive, or a file object with attribute name
+
+    Returns
+    ----------
+    archive_format : str
+        One of 'zip', 'tar', 'gztar', 'bztar' and 'xztar'
+    """
+    name = archive if isinstance(archive, str) else getattr(archive, "name", "")
+    for extension, archive_format in _ARCHIVE_EXTENSIONS:
+        if str(name).lower().endswith(extension):
+            return archive_format
+    raise ValueError(
+        "Can not derive the archive format of {}, use archive_format".format(archive)
+    )
@@ -0,0 +1,350 @@
+"""Saves Projects in the compact binary TEASER file format.
+
+The binary format stores the same data as teaserjson, in columnar tables
+instead of nested objects:
+
+buildings
+    one row per building, with the number of its thermal zones
+zones
+    one row per thermal zone (in the order of buildings), with the number of
+    its building elements
+elements
+    one row per building element (in the order of zones), with the list of
+    the zone it belongs to (e.g. outer_walls) and its construction
+constructions
+    one row per distinct layer structure of building elements, with the
+    number of its layers
+layers
+    one row per layer (in the order of constructions), with its material
+materials
+    one row per distinct material
+
+Building elements with equal layers and materials share one construction,
+equal materials are stored once. Nested records (e.g. use_conditions of a
+zone) are stored as one column per attribute ("use_conditions.persons").
+The key of each object in teaserjson (e.g. the name of a building), the
+number of children, the element list and the construction are stored in
+reserved columns (KEY, COUNT, LIST and CONSTRUCTION), whose names start with
+a null character and never collide with attributes of the objects.
+
+File layout: MAGIC, the schema version and the length of the header
+(uint32, uint32, uint64, little endian), the header (JSON: project data,
+tables with name, kind and arrays of each column) and the data of all arrays
+aligned to ALIGNMENT bytes, so every column can be read by memory mapping
+the file (see teaser.data.input.teaserbinary_input). Strings and values
+without a fixed size (e.g. profiles) are stored once in a string pool and
+referenced by their index.
+"""
+
+import json
+import struct
+import collections
+import numpy as np
+import teaser.data.output.teaserjson_output as tjson_out
+
+MAGIC = b"TEASERB\x00"
+SCHEMA_VERSION = 1
+FILE_EXTENSION = ".teaserbin"
+ALIGNMENT = 64
+HEADER = struct.Struct("<8sIIQ")
+
+TABLES = ["buildings", "zones", "elements", "constructions", "layers", "materials"]
+
+ELEMENT_LISTS = [
+    "outer_walls",
+    "doors",
+    "rooftops",
+    "ground_floors",
+    "windows",
+    "inner_walls",
+    "floors",
+    "ceilings",
+]
+
+RECORDS = {
+    "buildings": ["classification", "central_ahu"],
+    "zones": ["use_conditions"],
+    "elements": [],
+    "constructions": [],
+    "layers": [],
+    "materials": [],
+}
+
+KEY = "\0key"
+COUNT = "\0count"
+LIST = "\0list"
+CONSTRUCTION = "\0construction"
+
+VALUE = 0
+NULL = 1
+MISSING = 2
+
+_MISSING = object()
+
+
+def save_teaser_binary(path, project):
+    """Save a project to a binary file.
+
+    Parameters
+    ----------
+    path: string
+        complete path to the output file, FILE_EXTENSION is added if
+        missing
+    project: Project()
+        Teaser instance of Project()
+    """
+    buildings = collections.OrderedDict()
+    for bldg in project.buildings:
+        buildings[bldg.name] = bldg
+    write_teaser_binary(
+        path,
+        tjson_out.get_project_data(project),
+        ((name, tjson_out.get_building_data(bldg)) for name, bldg in buildings.items()),
+    )
+
+
+def convert_json_to_binary(json_path, binary_path):
+    """Convert a teaserjson file to the binary format without loss.
+
+    Parameters
+    ----------
+    json_path: string
+        path of the teaserjson file
+    binary_path: string
+        path of the binary file
+    """
+    with open(json_path, "r") as f:
+        prj_in = json.load(f, object_pairs_hook=collections.OrderedDict)
+    buildings = prj_in["project"].pop("buildings", collections.OrderedDict())
+    write_teaser_binary(binary_path, prj_in, buildings.items())
+
+
+def write_teaser_binary(path, prj_out, buildings):
+    """Write converted project data to a binary file.
+
+    Parameters
+    ----------
+    path: string
+        complete path to the output file, FILE_EXTENSION is added if
+        missing
+    prj_out: collections.OrderedDict
+        project data as returned by teaserjson_output.get_project_data()
+    buildings: iterable
+        (name, building data) of each building, building data as returned
+        by teaserjson_output.get_building_data()
+    """
+    if not path.endswith(FILE_EXTENSION):
+        path = path + FILE_EXTENSION
+
+    rows = {table: [] for table in TABLES}
+    constructions = {}
+    materials = {}
+    for bldg_name, bldg_out in buildings:
+        bldg_row = collections.OrderedDict([(KEY, bldg_name)])
+        bldg_row.update(bldg_out)
+        zones = bldg_row.pop("thermal_zones", {})
+        bldg_row[COUNT] = len(zones)
+        rows["buildings"].append(bldg_row)
+        for zone_name, zone_out in zones.items():
+            zone_row = collections.OrderedDict([(KEY, zone_name)])
+            zone_row.update(zone_out)
+            element_count = 0
+            for kind, element_list in enumerate(ELEMENT_LISTS):
+                for element_name, element_out in zone_row.pop(
+                    element_list, {}
+                ).items():
+                    element_row = collections.OrderedDict(
+                        [(LIST, kind), (KEY, element_name)]
+                    )
+                    element_row.update(element_out)
+                    element_row[CONSTRUCTION] = _add_construction(
+                        rows, constructions, materials, element_row.pop("layer", {})
+                    )
+                    rows["elements"].append(element_row)
+                    element_count += 1
+            zone_row[COUNT] = element_count
+            rows["zones"].append(zone_row)
+
+    strings = _StringPool()
+    arrays = []
+    header = collections.OrderedDict()
+    header["schema_version"] = SCHEMA_VERSION
+    header["project"] = prj_out["project"].copy()
+    header["project"].pop("buildings", None)
+    header["tables"] = collections.OrderedDict(
+        (table, _encode_table(rows[table], RECORDS[table], strings, arrays))
+        for table in TABLES
+    )
+    header["strings"] = strings.encode(arrays)
+
+    header_bytes = json.dumps(header, separators=(",", ":")).encode("utf-8")
+    data_start = _align(HEADER.size + len(header_bytes))
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, SCHEMA_VERSION, 0, len(header_bytes)))
+        f.write(header_bytes)
+        f.write(b"\0" * (data_start - HEADER.size - len(header_bytes)))
+        position = 0
+        for array in arrays:
+            data = array.tobytes()
+            f.write(data)
+            position += len(data)
+            f.write(b"\0" * (_align(position) - position))
+            position = _align(position)
+
+
+def _add_construction(rows, constructions, materials, layers):
+    """Return the index of the construction of layers, add it if new."""
+    layer_rows = []
+    for layer_id, layer_out in layers.items():
+        material = layer_out.get("material")
+        key = json.dumps(material)
+        if key not in materials:
+            materials[key] = len(rows["materials"])
+            rows["materials"].append(material)
+        layer_row = collections.OrderedDict([(KEY, layer_id)])
+        layer_row.update(layer_out)
+        layer_row["material"] = materials[key]
+        layer_rows.append(layer_row)
+    key = json.dumps(layer_rows)
+    if key not in constructions:
+        constructions[key] = len(rows["constructions"])
+        rows["constructions"].append({COUNT: len(layer_rows)})
+        rows["layers"].extend(layer_rows)
+    return constructions[key]
+
+
+def _encode_table(rows, records, strings, arrays):
+    """Encode rows (dicts) of a table as columns.
+
+    Returns the header of the table, the arrays of all columns are appended
+    to arrays.
+    """
+    columns = collections.OrderedDict()
+    for index, row in enumerate(rows):
+        for key, value in row.items():
+            if key in records and isinstance(value, dict):
+                for sub_key, sub_value in value.items():
+                    _add_value(columns, key + "." + sub_key, index, value=sub_value)
+            else:
+                _add_value(columns, key, index, value=value)
+    return collections.OrderedDict(
+        [
+            ("rows", len(rows)),
+            (
+                "columns",
+                [
+                    _encode_column(name, values, len(rows), strings, arrays)
+                    for name, values in columns.items()
+                ],
+            ),
+        ]
+    )
+
+
+def _add_value(columns, name, index, value):
+    """Set the value of a column in row index, earlier rows are missing."""
+    values = columns.get(name)
+    if values is None:
+        values = columns[name] = []
+    values.extend([_MISSING] * (index - len(values)))
+    values.append(value)
+
+
+def _encode_column(name, values, row_count, strings, arrays):
+    """Encode the values of one column, returns the header of the column."""
+    values = values + [_MISSING] * (row_count - len(values))
+    state = np.array(
+        [MISSING if v is _MISSING else NULL if v is None else VALUE for v in values],
+        dtype=np.uint8,
+    )
+    present = [v for v in values if v is not _MISSING and v is not None]
+    kind = _get_kind(present)
+    filled = [_get_default(kind) if v is _MISSING or v is None else v for v in values]
+
+    column = collections.OrderedDict([("name", name), ("kind", kind)])
+    column_arrays = collections.OrderedDict()
+    if kind == "bool":
+        column_arrays["data"] = np.array(filled, dtype="|u1")
+    elif kind == "int":
+        column_arrays["data"] = np.array(filled, dtype="<i8")
+    elif kind == "number":
+        column_arrays["data"] = np.array(filled, dtype="<f8")
+        if any(type(v) is int for v in present):
+            column_arrays["is_int"] = np.array(
+                [type(v) is int for v in filled], dtype="|u1"
+            )
+    elif kind == "str":
+        column_arrays["data"] = np.array(
+            [strings.add(v) for v in filled], dtype="<i4"
+        )
+    else:
+        column_arrays["data"] = np.array(
+            [strings.add(json.dumps(v)) for v in filled], dtype="<i4"
+        )
+    if state.any():
+        column_arrays["state"] = state
+    column["arrays"] = collections.OrderedDict(
+        (key, _add_array(arrays, array)) for key, array in column_arrays.items()
+    )
+    return column
+
+
+def _get_kind(values):
+    """Return the kind of column for values (without None)."""
+    types = set(type(value) for value in values)
+    if types == {bool}:
+        return "bool"
+    if types == {int} and all(-(2 ** 63) <= value < 2 ** 63 for value in values):
+        return "int"
+    if types and types <= {int, float} and all(
+        type(value) is float or abs(value) <= 2 ** 53 for value in values
+    ):
+        return "number"
+    if types == {str}:
+        return "str"
+    return "json"
+
+
+def _get_default(kind):
+    """Return the value stored for None and missing values."""
+    return {"bool": False, "int": 0, "number": 0.0, "str": ""}.get(kind, None)
+
+
+def _add_array(arrays, array):
+    """Append an array to the data of the file, returns its header."""
+    offset = sum(_align(existing.nbytes) for existing in arrays)
+    arrays.append(array)
+    return collections.OrderedDict(
+        [("dtype", array.dtype.str), ("offset", offset), ("length", len(array))]
+    )
+
+
+def _align(position):
+    """Return the next position aligned to ALIGNMENT."""
+    return (position + ALIGNMENT - 1) // ALIGNMENT * ALIGNMENT
+
+
+class _StringPool(object):
+    """Distinct strings of a file, each string is stored once."""
+
+    def __init__(self):
+        self.codes = {}
+
+    def add(self, value):
+        """Return the index of value, add it if new."""
+        code = self.codes.get(value)
+        if code is None:
+            code = self.codes[value] = len(self.codes)
+        return code
+
+    def encode(self, arrays):
+        """Append offsets and data of all strings to arrays."""
+        data = [value.encode("utf-8") for value in self.codes]
+        offsets = np.zeros(len(data) + 1, dtype="<i8")
+        offsets[1:] = np.cumsum([len(value) for value in data], dtype=np.int64)
+        return collections.OrderedDict(
+            [
+                ("offsets", _add_array(arrays, offsets)),
+                ("data", _add_array(arrays, np.frombuffer(b"".join(data), "|u1"))),
+            ]
+        )
@@ -2,12 +2,17 @@
 
 import json
 import collections
+import teaser.data.output.sinks as sinks
 
+_BUILDINGS_PLACEHOLDER = "__teaser_buildings__"
 
-def save_teaser_json(path, project):
+
+def save_teaser_json(path, project, sink=None, compact=False):
     """Save a project to a JSON file.
 
-    The function needs to be written.
+    The file is written while the buildings are converted, one building at
+    a time, so only the data of one building is held in memory besides the
+    project.
 
     Parameters
     ----------
@@ -15,6 +20,11 @@ def save_teaser_json(path, project):
         complete path to the output file
     project: Project()
         Teaser instance of Project()
+    sink: teaser.data.output.sinks.DirectorySink
+        target of the file, default is None, which writes to the file system
+    compact: bool
+        if True, the file is written without indentation and whitespace,
+        default is False
 
     """
     if path.endswith("json"):
@@ -22,6 +32,107 @@ def save_teaser_json(path, project):
     else:
         path = path + ".json"
 
+    if sink is None:
+        sink = sinks.DirectorySink()
+    with sink.open(path) as file:
+        for chunk in iter_teaser_json(project, compact=compact):
+            file.write(chunk)
+
+
+def iter_teaser_json(project, compact=False):
+    """Yield the JSON text of a project in chunks.
+
+    The first chunk holds all project data, followed by one chunk per
+    building and the end of the document. Joined, the chunks are identical
+    to json.dumps() of the complete project. If several buildings have the
+    same name, only the last one is kept (as in a dict).
+
+    Parameters
+    ----------
+    project: Project()
+        Teaser instance of Project()
+    compact: bool
+        if True, no indentation and whitespace is used, default is False
+
+    Yields
+    ------
+    chunk: str
+        part of the JSON document
+    """
+    buildings = collections.OrderedDict()
+    for bldg in project.buildings:
+        buildings[bldg.name] = bldg
+
+    return iter_json_chunks(
+        get_project_data(project),
+        ((name, get_building_data(bldg)) for name, bldg in buildings.items()),
+        compact=compact,
+    )
+
+
+def iter_json_chunks(prj_out, buildings, compact=False):
+    """Yield the JSON text of converted project data in chunks.
+
+    Parameters
+    ----------
+    prj_out: collections.OrderedDict
+        project data as returned by get_project_data()
+    buildings: iterable
+        (name, building data) of each building, building data as returned
+        by get_building_data(), names have to be unique
+    compact: bool
+        if True, no indentation and whitespace is used, default is False
+
+    Yields
+    ------
+    chunk: str
+        part of the JSON document
+    """
+    if compact:
+        dump_options = {"separators": (",", ":")}
+        separator = ","
+        key_separator = ":"
+        newline = ""
+        closing = "}"
+    else:
+        dump_options = {"indent": 4, "separators": (",", ": ")}
+        separator = ","
+        key_separator = ": "
+        newline = "\n" + " " * 12
+        closing = "\n" + " " * 8 + "}"
+
+    prj_out = collections.OrderedDict(prj_out)
+    prj_out["project"] = collections.OrderedDict(prj_out["project"])
+    prj_out["project"]["buildings"] = _BUILDINGS_PLACEHOLDER
+    start, placeholder, end = json.dumps(prj_out, **dump_options).rpartition(
+        json.dumps(_BUILDINGS_PLACEHOLDER)
+    )
+
+    index = 0
+    for index, (name, bldg_out) in enumerate(buildings, 1):
+        bldg_json = json.dumps(bldg_out, **dump_options)
+        yield (separator if index > 1 else start + "{") + newline + json.dumps(
+            name
+        ) + key_separator + bldg_json.replace("\n", newline)
+    if index:
+        yield closing + end
+    else:
+        yield start + "{}" + end
+
+
+def get_project_data(project):
+    """Convert the data of a project without buildings.
+
+    Parameters
+    ----------
+    project: Project()
+        Teaser instance of Project()
+
+    Returns
+    -------
+    prj_out: collections.OrderedDict
+        project data, with an empty dict of buildings
+    """
     prj_out = collections.OrderedDict()
     prj_out["project"] = collections.OrderedDict()
     prj_out["project"]["version"] = "0.7"
@@ -47,215 +158,202 @@ def save_teaser_json(path, project):
     ] = project.modelica_info.results_at_events
     prj_out["project"]["modelica_info"]["version"] = project.modelica_info.version
     prj_out["project"]["buildings"] = collections.OrderedDict()
-    __building_class = {
-        "Building": {"method": "undefined", "usage": "undefined"},
-        "Office": {"method": "bmvbs", "usage": "office"},
-        "Institute": {"method": "bmvbs", "usage": "institute"},
-        "Institute4": {"method": "bmvbs", "usage": "institute4"},
-        "Institute8": {"method": "bmvbs", "usage": "institute8"},
-        "SingleFamilyDwelling": {"method": "iwu", "usage": "single_family_dwelling"},
-        "SingleFamilyHouse": {"method": "tabula_de", "usage": "single_family_house"},
-        "TerracedHouse": {"method": "tabula_de", "usage": "terraced_house"},
-        "MultiFamilyHouse": {"method": "tabula_de", "usage": "multi_family_house"},
-        "ApartmentBlock": {"method": "tabula_de", "usage": "apartment_block"},
-    }
+    return prj_out
 
-    for bldg in project.buildings:
-        prj_out["project"]["buildings"][bldg.name] = collections.OrderedDict()
-        prj_out["project"]["buildings"][bldg.name][
-            "classification"
-        ] = collections.OrderedDict()
-        prj_out["project"]["buildings"][bldg.name]["classification"]["class"] = type(
-            bldg
-        ).__name__
-        prj_out["project"]["buildings"][bldg.name]["classification"][
-            "method"
-        ] = __building_class[type(bldg).__name__]["method"]
-        prj_out["project"]["buildings"][bldg.name]["street_name"] = bldg.street_name
-        prj_out["project"]["buildings"][bldg.name]["city"] = bldg.city
-        prj_out["project"]["buildings"][bldg.name][
-            "year_of_construction"
-        ] = bldg.year_of_construction
-        prj_out["project"]["buildings"][bldg.name][
-            "year_of_retrofit"
-        ] = bldg.year_of_retrofit
-        prj_out["project"]["buildings"][bldg.name][
-            "number_of_floors"
-        ] = bldg.number_of_floors
-        prj_out["project"]["buildings"][bldg.name][
-            "height_of_floors"
-        ] = bldg.height_of_floors
-        prj_out["project"]["buildings"][bldg.name][
-            "net_leased_area"
-        ] = bldg.net_leased_area
-        prj_out["project"]["buildings"][bldg.name]["outer_area"] = bldg.outer_area
-        prj_out["project"]["buildings"][bldg.name]["window_area"] = bldg.window_area
-        if bldg.central_ahu is not None:
-            ahu_out = collections.OrderedDict()
-            ahu_out["heating"] = bldg.central_ahu.heating
-            ahu_out["cooling"] = bldg.central_ahu.cooling
-            ahu_out["dehumidification"] = bldg.central_ahu.dehumidification
-            ahu_out["humidification"] = bldg.central_ahu.humidification
-            ahu_out["heat_recovery"] = bldg.central_ahu.heat_recovery
-            ahu_out[
-                "by_pass_dehumidification"
-            ] = bldg.central_ahu.by_pass_dehumidification
-            ahu_out["efficiency_recovery"] = bldg.central_ahu.efficiency_recovery
-            ahu_out[
-                "efficiency_recovery_false"
-            ] = bldg.central_ahu.efficiency_recovery_false
-            ahu_out[
-                "min_relative_humidity_profile"
-            ] = bldg.central_ahu.min_relative_humidity_profile
-            ahu_out[
-                "max_relative_humidity_profile"
-            ] = bldg.central_ahu.max_relative_humidity_profile
-            ahu_out["v_flow_profile"] = bldg.central_ahu.v_flow_profile
-            ahu_out["temperature_profile"] = bldg.central_ahu.temperature_profile
-            prj_out["project"]["buildings"][bldg.name]["central_ahu"] = ahu_out
-        else:
-            pass
-        prj_out["project"]["buildings"][bldg.name][
-            "thermal_zones"
-        ] = collections.OrderedDict()
-        for zone in bldg.thermal_zones:
-
-            zone_out = collections.OrderedDict()
-
-            zone_out["area"] = zone.area
-            zone_out["volume"] = zone.volume
-            zone_out["use_conditions"] = collections.OrderedDict()
-            zone_out["use_conditions"]["usage"] = zone.use_conditions.usage
-
-            zone_out["use_conditions"][
-                "typical_length"
-            ] = zone.use_conditions.typical_length
-            zone_out["use_conditions"][
-                "typical_width"
-            ] = zone.use_conditions.typical_width
-            zone_out["use_conditions"][
-                "with_heating"
-            ] = zone.use_conditions.with_heating
-            zone_out["use_conditions"][
-                "with_ideal_thresholds"
-            ] = zone.use_conditions.with_ideal_thresholds
-            zone_out["use_conditions"][
-                "T_threshold_heating"
-            ] = zone.use_conditions.T_threshold_heating
-            zone_out["use_conditions"][
-                "T_threshold_cooling"
-            ] = zone.use_conditions.T_threshold_cooling
-            zone_out["use_conditions"][
-                "with_cooling"
-            ] = zone.use_conditions.with_cooling
-            zone_out["use_conditions"][
-                "fixed_heat_flow_rate_persons"
-            ] = zone.use_conditions.fixed_heat_flow_rate_persons
-            zone_out["use_conditions"][
-                "activity_degree_persons"
-            ] = zone.use_conditions.activity_degree_persons
-            zone_out["use_conditions"]["persons"] = zone.use_conditions.persons
-            zone_out["use_conditions"][
-                "internal_gains_moisture_no_people"
-            ] = zone.use_conditions.internal_gains_moisture_no_people
-            zone_out["use_conditions"][
-                "ratio_conv_rad_persons"
-            ] = zone.use_conditions.ratio_conv_rad_persons
-            zone_out["use_conditions"]["machines"] = zone.use_conditions.machines
-            zone_out["use_conditions"][
-                "ratio_conv_rad_machines"
-            ] = zone.use_conditions.ratio_conv_rad_machines
-            zone_out["use_conditions"][
-                "lighting_power"
-            ] = zone.use_conditions.lighting_power
-            zone_out["use_conditions"][
-                "ratio_conv_rad_lighting"
-            ] = zone.use_conditions.ratio_conv_rad_lighting
-            zone_out["use_conditions"][
-                "use_constant_infiltration"
-            ] = zone.use_conditions.use_constant_infiltration
-            zone_out["use_conditions"][
-                "infiltration_rate"
-            ] = zone.use_conditions.infiltration_rate
-            zone_out["use_conditions"][
-                "max_user_infiltration"
-            ] = zone.use_conditions.max_user_infiltration
-            zone_out["use_conditions"][
-                "max_overheating_infiltration"
-            ] = zone.use_conditions.max_overheating_infiltration
-            zone_out["use_conditions"][
-                "max_summer_infiltration"
-            ] = zone.use_conditions.max_summer_infiltration
-            zone_out["use_conditions"][
-                "winter_reduction_infiltration"
-            ] = zone.use_conditions.winter_reduction_infiltration
-            zone_out["use_conditions"]["min_ahu"] = zone.use_conditions.min_ahu
-            zone_out["use_conditions"]["max_ahu"] = zone.use_conditions.max_ahu
-            zone_out["use_conditions"]["with_ahu"] = zone.use_conditions.with_ahu
-            zone_out["use_conditions"][
-                "heating_profile"
-            ] = zone.use_conditions.heating_profile
-            zone_out["use_conditions"][
-                "cooling_profile"
-            ] = zone.use_conditions.cooling_profile
-            zone_out["use_conditions"][
-                "persons_profile"
-            ] = zone.use_conditions.persons_profile
-            zone_out["use_conditions"][
-                "machines_profile"
-            ] = zone.use_conditions.machines_profile
-            zone_out["use_conditions"][
-                "lighting_profile"
-            ] = zone.use_conditions.lighting_profile
-
-            zone_out["outer_walls"] = collections.OrderedDict()
-            zone_out["doors"] = collections.OrderedDict()
-            zone_out["rooftops"] = collections.OrderedDict()
-            zone_out["ground_floors"] = collections.OrderedDict()
-            zone_out["windows"] = collections.OrderedDict()
-            zone_out["inner_walls"] = collections.OrderedDict()
-            zone_out["floors"] = collections.OrderedDict()
-            zone_out["ceilings"] = collections.OrderedDict()
-
-            for out_wall in zone.outer_walls:
-                zone_out["outer_walls"][out_wall.name] = collections.OrderedDict()
-                set_basic_data(zone_out["outer_walls"][out_wall.name], out_wall)
-                set_layer_data(zone_out["outer_walls"][out_wall.name], out_wall)
-            for door in zone.doors:
-                zone_out["doors"][door.name] = collections.OrderedDict()
-                set_basic_data(zone_out["doors"][door.name], door)
-                set_layer_data(zone_out["doors"][door.name], door)
-            for roof in zone.rooftops:
-                zone_out["rooftops"][roof.name] = collections.OrderedDict()
-                set_basic_data(zone_out["rooftops"][roof.name], roof)
-                set_layer_data(zone_out["rooftops"][roof.name], roof)
-            for gf in zone.ground_floors:
-                zone_out["ground_floors"][gf.name] = collections.OrderedDict()
-                set_basic_data(zone_out["ground_floors"][gf.name], gf)
-                set_layer_data(zone_out["ground_floors"][gf.name], gf)
-            for win in zone.windows:
-                zone_out["windows"][win.name] = collections.OrderedDict()
-                set_basic_data(zone_out["windows"][win.name], win)
-                set_layer_data(zone_out["windows"][win.name], win)
-            for iw in zone.inner_walls:
-                zone_out["inner_walls"][iw.name] = collections.OrderedDict()
-                set_basic_data(zone_out["inner_walls"][iw.name], iw)
-                set_layer_data(zone_out["inner_walls"][iw.name], iw)
-            for floor in zone.floors:
-                zone_out["floors"][floor.name] = collections.OrderedDict()
-                set_basic_data(zone_out["floors"][floor.name], floor)
-                set_layer_data(zone_out["floors"][floor.name], floor)
-            for ceil in zone.ceilings:
-                zone_out["ceilings"][ceil.name] = collections.OrderedDict()
-                set_basic_data(zone_out["ceilings"][ceil.name], ceil)
-                set_layer_data(zone_out["ceilings"][ceil.name], ceil)
-
-            prj_out["project"]["buildings"][bldg.name]["thermal_zones"][
-                zone.name
-            ] = zone_out
-
-    with open(path, "w") as file:
-        file.write(json.dumps(prj_out, indent=4, separators=(",", ": ")))
+
+_BUILDING_CLASS = {
+    "Building": {"method": "undefined", "usage": "undefined"},
+    "Office": {"method": "bmvbs", "usage": "office"},
+    "Institute": {"method": "bmvbs", "usage": "institute"},
+    "Institute4": {"method": "bmvbs", "usage": "institute4"},
+    "Institute8": {"method": "bmvbs", "usage": "institute8"},
+    "SingleFamilyDwelling": {"method": "iwu", "usage": "single_family_dwelling"},
+    "SingleFamilyHouse": {"method": "tabula_de", "usage": "single_family_house"},
+    "TerracedHouse": {"method": "tabula_de", "usage": "terraced_house"},
+    "MultiFamilyHouse": {"method": "tabula_de", "usage": "multi_family_house"},
+    "ApartmentBlock": {"method": "tabula_de", "usage": "apartment_block"},
+}
+
+
+def get_building_data(bldg):
+    """Convert the data of one building.
+
+    Parameters
+    ----------
+    bldg: Building()
+        Teaser instance of Building()
+
+    Returns
+    -------
+    bldg_out: collections.OrderedDict
+        building data as stored in the buildings of the project
+    """
+    bldg_out = collections.OrderedDict()
+    bldg_out["classification"] = collections.OrderedDict()
+    bldg_out["classification"]["class"] = type(bldg).__name__
+    bldg_out["classification"]["method"] = _BUILDING_CLASS[type(bldg).__name__][
+        "method"
+    ]
+    bldg_out["street_name"] = bldg.street_name
+    bldg_out["city"] = bldg.city
+    bldg_out["year_of_construction"] = bldg.year_of_construction
+    bldg_out["year_of_retrofit"] = bldg.year_of_retrofit
+    bldg_out["number_of_floors"] = bldg.number_of_floors
+    bldg_out["height_of_floors"] = bldg.height_of_floors
+    bldg_out["net_leased_area"] = bldg.net_leased_area
+    bldg_out["outer_area"] = bldg.outer_area
+    bldg_out["window_area"] = bldg.window_area
+    if bldg.central_ahu is not None:
+        ahu_out = collections.OrderedDict()
+        ahu_out["heating"] = bldg.central_ahu.heating
+        ahu_out["cooling"] = bldg.central_ahu.cooling
+        ahu_out["dehumidification"] = bldg.central_ahu.dehumidification
+        ahu_out["humidification"] = bldg.central_ahu.humidification
+        ahu_out["heat_recovery"] = bldg.central_ahu.heat_recovery
+        ahu_out["by_pass_dehumidification"] = bldg.central_ahu.by_pass_dehumidification
+        ahu_out["efficiency_recovery"] = bldg.central_ahu.efficiency_recovery
+        ahu_out[
+            "efficiency_recovery_false"
+        ] = bldg.central_ahu.efficiency_recovery_false
+        ahu_out[
+            "min_relative_humidity_profile"
+        ] = bldg.central_ahu.min_relative_humidity_profile
+        ahu_out[
+            "max_relative_humidity_profile"
+        ] = bldg.central_ahu.max_relative_humidity_profile
+        ahu_out["v_flow_profile"] = bldg.central_ahu.v_flow_profile
+        ahu_out["temperature_profile"] = bldg.central_ahu.temperature_profile
+        bldg_out["central_ahu"] = ahu_out
+    bldg_out["thermal_zones"] = collections.OrderedDict()
+    for zone in bldg.thermal_zones:
+
+        zone_out = collections.OrderedDict()
+
+        zone_out["area"] = zone.area
+        zone_out["volume"] = zone.volume
+        zone_out["use_conditions"] = collections.OrderedDict()
+        zone_out["use_conditions"]["usage"] = zone.use_conditions.usage
+
+        zone_out["use_conditions"][
+            "typical_length"
+        ] = zone.use_conditions.typical_length
+        zone_out["use_conditions"]["typical_width"] = zone.use_conditions.typical_width
+        zone_out["use_conditions"]["with_heating"] = zone.use_conditions.with_heating
+        zone_out["use_conditions"][
+            "with_ideal_thresholds"
+        ] = zone.use_conditions.with_ideal_thresholds
+        zone_out["use_conditions"][
+            "T_threshold_heating"
+        ] = zone.use_conditions.T_threshold_heating
+        zone_out["use_conditions"][
+            "T_threshold_cooling"
+        ] = zone.use_conditions.T_threshold_cooling
+        zone_out["use_conditions"]["with_cooling"] = zone.use_conditions.with_cooling
+        zone_out["use_conditions"][
+            "fixed_heat_flow_rate_persons"
+        ] = zone.use_conditions.fixed_heat_flow_rate_persons
+        zone_out["use_conditions"][
+            "activity_degree_persons"
+        ] = zone.use_conditions.activity_degree_persons
+        zone_out["use_conditions"]["persons"] = zone.use_conditions.persons
+        zone_out["use_conditions"][
+            "internal_gains_moisture_no_people"
+        ] = zone.use_conditions.internal_gains_moisture_no_people
+        zone_out["use_conditions"][
+            "ratio_conv_rad_persons"
+        ] = zone.use_conditions.ratio_conv_rad_persons
+        zone_out["use_conditions"]["machines"] = zone.use_conditions.machines
+        zone_out["use_conditions"][
+            "ratio_conv_rad_machines"
+        ] = zone.use_conditions.ratio_conv_rad_machines
+        zone_out["use_conditions"][
+            "lighting_power"
+        ] = zone.use_conditions.lighting_power
+        zone_out["use_conditions"][
+            "ratio_conv_rad_lighting"
+        ] = zone.use_conditions.ratio_conv_rad_lighting
+        zone_out["use_conditions"][
+            "use_constant_infiltration"
+        ] = zone.use_conditions.use_constant_infiltration
+        zone_out["use_conditions"][
+            "infiltration_rate"
+        ] = zone.use_conditions.infiltration_rate
+        zone_out["use_conditions"][
+            "max_user_infiltration"
+        ] = zone.use_conditions.max_user_infiltration
+        zone_out["use_conditions"][
+            "max_overheating_infiltration"
+        ] = zone.use_conditions.max_overheating_infiltration
+        zone_out["use_conditions"][
+            "max_summer_infiltration"
+        ] = zone.use_conditions.max_summer_infiltration
+        zone_out["use_conditions"][
+            "winter_reduction_infiltration"
+        ] = zone.use_conditions.winter_reduction_infiltration
+        zone_out["use_conditions"]["min_ahu"] = zone.use_conditions.min_ahu
+        zone_out["use_conditions"]["max_ahu"] = zone.use_conditions.max_ahu
+        zone_out["use_conditions"]["with_ahu"] = zone.use_conditions.with_ahu
+        zone_out["use_conditions"][
+            "heating_profile"
+        ] = zone.use_conditions.heating_profile
+        zone_out["use_conditions"][
+            "cooling_profile"
+        ] = zone.use_conditions.cooling_profile
+        zone_out["use_conditions"][
+            "persons_profile"
+        ] = zone.use_conditions.persons_profile
+        zone_out["use_conditions"][
+            "machines_profile"
+        ] = zone.use_conditions.machines_profile
+        zone_out["use_conditions"][
+            "lighting_profile"
+        ] = zone.use_conditions.lighting_profile
+
+        zone_out["outer_walls"] = collections.OrderedDict()
+        zone_out["doors"] = collections.OrderedDict()
+        zone_out["rooftops"] = collections.OrderedDict()
+        zone_out["ground_floors"] = collections.OrderedDict()
+        zone_out["windows"] = collections.OrderedDict()
+        zone_out["inner_walls"] = collections.OrderedDict()
+        zone_out["floors"] = collections.OrderedDict()
+        zone_out["ceilings"] = collections.OrderedDict()
+
+        for out_wall in zone.outer_walls:
+            zone_out["outer_walls"][out_wall.name] = collections.OrderedDict()
+            set_basic_data(zone_out["outer_walls"][out_wall.name], out_wall)
+            set_layer_data(zone_out["outer_walls"][out_wall.name], out_wall)
+        for door in zone.doors:
+            zone_out["doors"][door.name] = collections.OrderedDict()
+            set_basic_data(zone_out["doors"][door.name], door)
+            set_layer_data(zone_out["doors"][door.name], door)
+        for roof in zone.rooftops:
+            zone_out["rooftops"][roof.name] = collections.OrderedDict()
+            set_basic_data(zone_out["rooftops"][roof.name], roof)
+            set_layer_data(zone_out["rooftops"][roof.name], roof)
+        for gf in zone.ground_floors:
+            zone_out["ground_floors"][gf.name] = collections.OrderedDict()
+            set_basic_data(zone_out["ground_floors"][gf.name], gf)
+            set_layer_data(zone_out["ground_floors"][gf.name], gf)
+        for win in zone.windows:
+            zone_out["windows"][win.name] = collections.OrderedDict()
+            set_basic_data(zone_out["windows"][win.name], win)
+            set_layer_data(zone_out["windows"][win.name], win)
+        for iw in zone.inner_walls:
+            zone_out["inner_walls"][iw.name] = collections.OrderedDict()
+            set_basic_data(zone_out["inner_walls"][iw.name], iw)
+            set_layer_data(zone_out["inner_walls"][iw.name], iw)
+        for floor in zone.floors:
+            zone_out["floors"][floor.name] = collections.OrderedDict()
+            set_basic_data(zone_out["floors"][floor.name], floor)
+            set_layer_data(zone_out["floors"][floor.name], floor)
+        for ceil in zone.ceilings:
+            zone_out["ceilings"][ceil.name] = collections.OrderedDict()
+            set_basic_data(zone_out["ceilings"][ceil.name], ceil)
+            set_layer_data(zone_out["ceilings"][ceil.name], ceil)
+
+        bldg_out["thermal_zones"][zone.name] = zone_out
+
+    return bldg_out
 
 
 def set_basic_data(wall_out, element):
@@ -0,0 +1,106 @@
+"""This module contains a cache of compiled Mako templates for Modelica export.
+
+The templates in data.output.modelicatemplate are compiled once per process
+and shared by the AixLib and IBPSA export. Templates are stored with their
+path and modification time as key, so a changed template file is compiled
+again. Optionally Mako writes the compiled template modules to a directory
+(see set_module_directory()), which allows new processes to skip the
+compilation as well.
+"""
+
+import os
+import teaser.logic.utilities as utilities
+
+_module_directory = None
+_lookups = {}
+_templates = {}
+
+
+def get_template_directory():
+    """Return the full path of the Modelica templates.
+
+    Returns
+    ----------
+    path : str
+        Full path to data/output/modelicatemplate
+    """
+    return utilities.get_full_path(os.path.join("data", "output", "modelicatemplate"))
+
+
+def set_module_directory(path=None):
+    """Set the directory for compiled template modules.
+
+    Parameters
+    ----------
+    path : str
+        Directory where Mako stores the compiled Python modules of the
+        templates. Default is None, which keeps compiled templates in memory
+        only.
+    """
+    global _module_directory
+    _module_directory = path
+    clear_templates()
+
+
+def clear_templates():
+    """Delete all compiled templates and lookups of this process."""
+    _lookups.clear()
+    _templates.clear()
+
+
+def get_lookup():
+    """Return the shared TemplateLookup of the Modelica templates.
+
+    The lookup resolves namespaces used in the templates (e.g.
+    /modelica_language/) and keeps them compiled.
+
+    Returns
+    ----------
+    lookup : mako.lookup.TemplateLookup
+        Lookup for data/output/modelicatemplate
+    """
+    try:
+        return _lookups[_module_directory]
+    except KeyError:
+        pass
+    from mako.lookup import TemplateLookup
+
+    lookup = TemplateLookup(
+        directories=[get_template_directory()], module_directory=_module_directory
+    )
+    _lookups[_module_directory] = lookup
+    return lookup
+
+
+def get_template(name):
+    """Return the compiled template with the given name.
+
+    Parameters
+    ----------
+    name : str
+        Path of the template relative to data/output/modelicatemplate,
+        e.g. 'AixLib/AixLib_Multizone' or 'package'
+
+    Returns
+    ----------
+    template : mako.template.Template
+        Compiled template using the shared lookup
+    """
+    filename = os.path.join(get_template_directory(), *name.split("/"))
+    key = (filename, os.path.getmtime(filename), _module_directory)
+    try:
+        return _templates[key]
+    except KeyError:
+        pass
+    from mako.template import Template
+
+    template = Template(
+        filename=filename,
+        uri="/" + name,
+        lookup=get_lookup(),
+        module_directory=_module_directory,
+    )
+    for old_key in [old_key for old_key in _templates if old_key[0] == filename]:
+        del _templates[old_key]
+    _templates[key] = template
+    return template
@@ -0,0 +1,71 @@
+"""Prebuild the compiled cache of the JSON input data.
+
+Parsing the JSON files of TEASER is a relevant part of the start up time of
+short lived processes. This module writes a compiled cache next to each JSON
+file (see teaser.data.dataclass.compile_json_binding()), which DataClass
+uses as long as the JSON file does not change. Run it at deploy time with::
+
+    python -m teaser.data.precompile [path ...]
+
+or with the teaser-precompile command. Without paths all JSON files in
+teaser/data/input/inputdata are compiled. Compiled caches are pickled, so
+they are only written and used for files in this directory (see
+teaser.data.dataclass.is_compiled_directory()).
+"""
+
+import os
+import argparse
+import teaser.logic.utilities as utils
+from teaser.data.dataclass import compile_json_binding
+
+
+def precompile(paths=None):
+    """Write the compiled cache of JSON input data files.
+
+    Parameters
+    ----------
+    paths : list
+        List of paths to JSON files or directories with JSON files in
+        teaser/data/input/inputdata. Default is None, which compiles
+        teaser/data/input/inputdata
+
+    Returns
+    ----------
+    compiled_paths : list
+        Full paths of all written compiled caches
+    """
+    if paths is None:
+        paths = [utils.get_full_path(os.path.join("data", "input", "inputdata"))]
+
+    compiled_paths = []
+    for path in paths:
+        if os.path.isdir(path):
+            json_files = [
+                os.path.join(path, name)
+                for name in sorted(os.listdir(path))
+                if name.endswith(".json")
+            ]
+        else:
+            json_files = [path]
+        for json_file in json_files:
+            compiled_paths.append(compile_json_binding(json_file))
+    return compiled_paths
+
+
+def main(argv=None):
+    """Command line interface of precompile()."""
+    parser = argparse.ArgumentParser(
+        description="Prebuild the compiled cache of TEASER JSON input data."
+    )
+    parser.add_argument(
+        "paths",
+        nargs="*",
+        help="JSON files or directories, default is the TEASER input data",
+    )
+    args = parser.parse_args(argv)
+    for compiled_path in precompile(paths=args.paths or None):
+        print(compiled_path)
+
+
+if __name__ == "__main__":
+    main()
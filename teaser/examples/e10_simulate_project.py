@@ -0,0 +1,72 @@
+"""This module contains an example how to simulate all zones of a project."""
+
+import time
+import teaser.examples.e1_generate_archetype as e1
+import teaser.data.input.weather_input as weather_input
+import teaser.logic.simulation.batch as batch
+import teaser.logic.simulation.solar as solar
+
+
+def example_simulate_project(copies=1, hours=8760):
+    """Simulate all zones of the archetype project at once.
+
+    Parameters
+    ----------
+    copies : int
+        Number of copies of each zone in the batch, to measure the
+        throughput of larger projects
+    hours : int
+        Simulated hours, default is one year
+    """
+    # In e1_generate_archetype we created a Project with several archetype
+    # buildings to get this Project we rerun this example and calculate the
+    # parameters of all buildings
+
+    prj = e1.example_generate_archetype()
+    prj.calc_all_buildings()
+
+    # The weather file of the project provides the outdoor and sky
+    # temperature. The solar irradiation is calculated for every (orientation,
+    # tilt) of the zones in one pass, all zones are stacked into one
+    # BatchNetwork
+
+    weather = weather_input.load_weather(prj.weather_file_path)
+    t_outdoor = weather.get_t_outdoor()[:hours]
+    t_sky = weather.get_t_sky()[:hours]
+
+    thermal_zones = [zone for bldg in prj.buildings for zone in bldg.thermal_zones]
+    start = time.time()
+    network = batch.BatchNetwork(thermal_zones * copies)
+    irradiation = solar.get_irradiation(weather, network.orientations)
+    solar_hours = {
+        key: values[:hours] for key, values in irradiation.get_solar().items()
+    }
+    built = time.time()
+    result = network.simulate(
+        t_outdoor, t_sky=t_sky, solar=solar_hours, time_series=False
+    )
+    simulated = time.time()
+
+    zone_years = len(network.thermal_zones) * hours / 8760
+    print(
+        "{} zones: network {:.2f} s, simulation {:.2f} s, {:.0f} zone-years/s".format(
+            len(network.thermal_zones),
+            built - start,
+            simulated - built,
+            zone_years / max(simulated - built, 1e-9),
+        )
+    )
+    for zone, heating_demand in zip(
+        thermal_zones, result.heating_demand[: len(thermal_zones)]
+    ):
+        print(
+            "{} {}: {:.0f} kWh".format(zone.parent.name, zone.name, heating_demand)
+        )
+    return result
+
+
+if __name__ == '__main__':
+
+    example_simulate_project(copies=100)
+
+    print("Example 10: That's it! :)")
@@ -3,8 +3,21 @@ This script loads the VDI 6007 Room 1 as *.teaserjson and computes
 parameters. The parameters are then compared with the ones from Rouvel
 """
 
+import numpy as np
 from teaser.project import Project
 import teaser.logic.utilities as utilities
+import teaser.logic.simulation.reducedorder as reducedorder
+
+ROUVEL_ROOM1 = {
+    "r1_iw": 0.000595515,
+    "c1_iw": 14836.2e3,
+    "area_iw": 75.5,
+    "alpha_conv_inner_iw": 2.236423594,
+    "r_rest_ow": 0.042768721,
+    "r1_ow": 0.004367913,
+    "c1_ow": 1600.8e3,
+    "area_ow": 10.5,
+    "alpha_conv_inner_ow": 2.7}
 
 
 def parameter_room1():
@@ -23,6 +36,87 @@ def parameter_room1():
     return prj
 
 
+def simulation_room1(days=60):
+    """Simulates room 1 with the boundary conditions of VDI 6007 test case 1
+
+    Constant outdoor air temperature of 22 degC, no solar radiation and
+    1000 W convective internal gains from 6 to 18 o'clock, without heating.
+    """
+
+    return simulation_test_case_1(parameter_room1(), days=days)
+
+
+def simulation_test_case_1(prj, days=60):
+    """Simulates the room of prj with the boundary conditions of test case 1
+
+    See simulation_room1(), also used for room 3 (test case 3).
+    """
+
+    zone = prj.buildings[0].thermal_zones[0]
+    zone.use_conditions.with_heating = False
+    zone.use_conditions.with_cooling = False
+
+    q_conv = get_gains_test_case_1(days)
+
+    return reducedorder.simulate_zone(
+        zone,
+        t_outdoor=np.full(len(q_conv), 295.15),
+        internal_gains=(q_conv, np.zeros(len(q_conv))),
+        infiltration_rate=0.0,
+        t_start=295.15)
+
+
+def get_gains_test_case_1(days=60):
+    """Hourly convective internal gains [W] of VDI 6007 test case 1"""
+
+    hours = np.arange(days * 24)
+    return np.where((hours % 24 >= 6) & (hours % 24 < 18), 1000.0, 0.0)
+
+
+def reference_test_case_1(parameters, thermal_zone, days=60,
+                          steps_per_hour=360):
+    """Air temperature [K] of test case 1 with the parameters of Rouvel
+
+    The two element network of VDI 6007 with the published parameters
+    (e.g. ROUVEL_ROOM1) is integrated with the implicit Euler method and
+    small time steps, independent of teaser.logic.simulation.reducedorder.
+    r_rest_ow of Rouvel includes the outer heat transfer. The air volume and
+    the radiative heat transfer are taken from thermal_zone.
+    """
+
+    dt = 3600.0 / steps_per_hour
+    # nodes: air, outer wall, interior wall and their inner surfaces
+    conductance = np.zeros((5, 5))
+    links = [
+        (0, 3, parameters["alpha_conv_inner_ow"] * parameters["area_ow"]),
+        (0, 4, parameters["alpha_conv_inner_iw"] * parameters["area_iw"]),
+        (3, 1, 1 / parameters["r1_ow"]),
+        (4, 2, 1 / parameters["r1_iw"]),
+        (3, 4, thermal_zone.model_attr.alpha_rad_inner_mean * min(
+            parameters["area_ow"], parameters["area_iw"]))]
+    for a, b, value in links:
+        conductance[[a, b], [a, b]] += value
+        conductance[[a, b], [b, a]] -= value
+    conductance[1, 1] += 1 / parameters["r_rest_ow"]
+    capacities = np.array([
+        thermal_zone.volume * thermal_zone.density_air
+        * thermal_zone.heat_capac_air,
+        parameters["c1_ow"],
+        parameters["c1_iw"],
+        0.0,
+        0.0]) / dt
+    step = np.linalg.inv(np.diag(capacities) + conductance)
+
+    t = np.full(5, 295.15)
+    t_air = []
+    for q_conv in get_gains_test_case_1(days):
+        source = np.array([q_conv, 295.15 / parameters["r_rest_ow"], 0, 0, 0])
+        for i in range(steps_per_hour):
+            t = step.dot(capacities * t + source)
+        t_air.append(t[0])
+    return np.array(t_air)
+
+
 if __name__ == "__main__":
     prj = parameter_room1()
 
@@ -61,3 +155,14 @@ if __name__ == "__main__":
     print("alpha_comb_outer_ow: ",
           prj.buildings[0].thermal_zones[0].model_attr.alpha_comb_outer_ow,
           "W/(m2*K) ---", "Rouvel: 25.0 W/(m2*K)")
+
+    result = simulation_room1()
+    reference = reference_test_case_1(
+        ROUVEL_ROOM1, prj.buildings[0].thermal_zones[0])
+    print("\nAir temperature of test case 1 (hour: day 1, day 10, day 60)")
+    for hour in [1, 6, 7, 10, 18, 19, 24]:
+        rows = [(day - 1) * 24 + hour - 1 for day in [1, 10, 60]]
+        print(hour, ":",
+              [round(result.t_air[row] - 273.15, 1) for row in rows],
+              "degC ---", "Rouvel:",
+              [round(reference[row] - 273.15, 1) for row in rows], "degC")
@@ -8,6 +8,18 @@ parameters. The parameters are then compared with the ones from Rouvel
 
 from teaser.project import Project
 import teaser.logic.utilities as utilities
+import teaser.examples.verification.verification_VDI_6007_room1 as room1
+
+ROUVEL_ROOM3 = {
+    "r1_iw": 0.003237138,
+    "c1_iw": 7297.1e3,
+    "area_iw": 75.5,
+    "alpha_conv_inner_iw": 2.236423594,
+    "r_rest_ow": 0.043140385,
+    "r1_ow": 0.004049352,
+    "c1_ow": 47.9e3,
+    "area_ow": 10.5,
+    "alpha_conv_inner_ow": 2.7}
 
 
 def parameter_room3():
@@ -26,6 +38,16 @@ def parameter_room3():
     return prj
 
 
+def simulation_room3(days=60):
+    """Simulates room 3 with the boundary conditions of VDI 6007 test case 3
+
+    Test case 3 applies the loads of test case 1 to the light room type L,
+    see verification_VDI_6007_room1.simulation_room1().
+    """
+
+    return room1.simulation_test_case_1(parameter_room3(), days=days)
+
+
 if __name__ == "__main__":
     prj = parameter_room3()
 
@@ -63,3 +85,14 @@ if __name__ == "__main__":
     print("alpha_comb_outer_ow: ",
           prj.buildings[0].thermal_zones[0].model_attr.alpha_comb_outer_ow,
           "W/(m2*K) ---", "Rouvel: 25.0 W/(m2*K)")
+
+    result = simulation_room3()
+    reference = room1.reference_test_case_1(
+        ROUVEL_ROOM3, prj.buildings[0].thermal_zones[0])
+    print("\nAir temperature of test case 3 (hour: day 1, day 10, day 60)")
+    for hour in [1, 6, 7, 10, 18, 19, 24]:
+        rows = [(day - 1) * 24 + hour - 1 for day in [1, 10, 60]]
+        print(hour, ":",
+              [round(result.t_air[row] - 273.15, 1) for row in rows],
+              "degC ---", "Rouvel:",
+              [round(reference[row] - 273.15, 1) for row in rows], "degC")
@@ -377,6 +377,17 @@ class Building(object):
             )
             self.sum_heat_load += zone.model_attr.heat_load
 
+        self.calc_library_attr()
+
+    def calc_library_attr(self):
+        """Sets and calculates the library specific attributes
+
+        Instantiates library_attr for the library given in used_library_calc
+        (AixLib or IBPSA) and calculates the auxiliary attributes. This
+        function is called by calc_building_parameter() after all thermal
+        zones are calculated.
+        """
+
         if self.used_library_calc == self.library_attr.__class__.__name__:
             if self.used_library_calc == "AixLib":
                 self.library_attr.calc_auxiliary_attr()
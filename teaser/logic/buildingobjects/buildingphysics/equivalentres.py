@@ -0,0 +1,313 @@
+"""This module contains the vectorized VDI 6007 calculation for walls."""
+
+from __future__ import division
+import collections
+import numpy as np
+
+
+def get_layer_stack(element):
+    """Returns the layer properties of an element as hashable tuple.
+
+    Parameters
+    ----------
+    element : BuildingElement()
+        TEASER building element (e.g. OuterWall, InnerWall)
+
+    Returns
+    ----------
+    layer_stack : tuple
+        Tuple with one (thickness, thermal_conduc, density, heat_capac)
+        tuple per layer, starting from the inner side
+    """
+
+    return tuple(
+        (count_layer.thickness,
+         count_layer.material.thermal_conduc,
+         count_layer.material.density,
+         count_layer.material.heat_capac) for count_layer in element.layer)
+
+
+def pad_layer_stacks(layer_stacks):
+    """Gathers the layer properties of several elements in padded arrays.
+
+    Elements with less layers than the element with the most layers are
+    padded, the padded entries are marked with False in the returned mask.
+
+    Parameters
+    ----------
+    layer_stacks : list
+        List of layer stacks as returned by get_layer_stack()
+
+    Returns
+    ----------
+    mask : np.array
+        Boolean array of shape (number of elements, max number of layer),
+        True for existing layers
+    density : np.array
+        Padded density of each layer
+    thermal_conduc : np.array
+        Padded thermal conductivity of each layer
+    heat_capac : np.array
+        Padded heat capacity of each layer
+    thickness : np.array
+        Padded thickness of each layer
+    """
+
+    max_layer = max([len(stack) for stack in layer_stacks] + [0])
+    shape = (len(layer_stacks), max_layer)
+
+    mask = np.zeros(shape, dtype=bool)
+    values = np.zeros(shape + (4,))
+    values[..., 1] = 1.0
+
+    for i, stack in enumerate(layer_stacks):
+        if len(stack) == 0:
+            continue
+        mask[i, :len(stack)] = True
+        values[i, :len(stack)] = stack
+
+    return (mask, values[..., 2], values[..., 1], values[..., 3],
+            values[..., 0])
+
+
+def calc_unit_equivalent_res(
+        mask,
+        density,
+        thermal_conduc,
+        heat_capac,
+        thickness,
+        t_bt=7):
+    """Equivalent resistance per unit area according to VDI 6007.
+
+    Vectorized version of the analogous model of VDI 6007. The transfer
+    matrix of each layer is set up as complex 2x2 matrix and all layer
+    stacks are multiplied at once. Results are related to an area of 1 m2,
+    resistances need to be divided by and capacities multiplied with the
+    area of the element.
+
+    Parameters
+    ----------
+    mask : np.array
+        Boolean array of shape (number of elements, max number of layer),
+        True for existing layers (see pad_layer_stacks())
+    density : np.array
+        Padded density of each layer
+    thermal_conduc : np.array
+        Padded thermal conductivity of each layer
+    heat_capac : np.array
+        Padded heat capacity of each layer
+    thickness : np.array
+        Padded thickness of each layer
+    t_bt : int
+        Time constant according to VDI 6007 (default t_bt = 7)
+
+    Returns
+    ----------
+    r1 : np.array
+        R1 of each element for 1 m2
+    r2 : np.array
+        R2 of each element for 1 m2
+    r3 : np.array
+        R3 of each element for 1 m2
+    c1 : np.array
+        C1 of each element for 1 m2
+    c2 : np.array
+        C2 of each element for 1 m2
+    c1_korr : np.array
+        C1,korr of each element for 1 m2
+    """
+
+    omega = 2 * np.pi / (86400 * t_bt)
+
+    r_layer = np.where(mask, thickness / thermal_conduc, 0.0)
+    c_layer = heat_capac * density * thickness * 1000
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        x = np.sqrt(0.5 * omega * r_layer * c_layer)
+        a11 = np.cosh(x) * np.cos(x) + 1j * np.sinh(x) * np.sin(x)
+        a12 = r_layer * np.sqrt(1 / (2 * omega * r_layer * c_layer)) * (
+            (np.cosh(x) * np.sin(x) + np.sinh(x) * np.cos(x)) +
+            1j * (np.cosh(x) * np.sin(x) - np.sinh(x) * np.cos(x)))
+        a21 = (1 / r_layer) * x * (
+            -(np.cosh(x) * np.sin(x) - np.sinh(x) * np.cos(x)) +
+            1j * (np.cosh(x) * np.sin(x) + np.sinh(x) * np.cos(x)))
+
+    # padded layers are replaced by identity matrices
+    a_layer = np.zeros(mask.shape + (2, 2), dtype=complex)
+    a_layer[..., 0, 0] = np.where(mask, a11, 1.0)
+    a_layer[..., 0, 1] = np.where(mask, a12, 0.0)
+    a_layer[..., 1, 0] = np.where(mask, a21, 0.0)
+    a_layer[..., 1, 1] = np.where(mask, a11, 1.0)
+
+    new_mat = np.zeros((mask.shape[0], 2, 2), dtype=complex)
+    new_mat[:, 0, 0] = 1.0
+    new_mat[:, 1, 1] = 1.0
+    for count_layer in range(mask.shape[1]):
+        new_mat = np.matmul(new_mat, a_layer[:, count_layer])
+
+    re11 = new_mat[:, 0, 0].real
+    im11 = new_mat[:, 0, 0].imag
+    re12 = new_mat[:, 0, 1].real
+    im12 = new_mat[:, 0, 1].imag
+    re22 = new_mat[:, 1, 1].real
+    im22 = new_mat[:, 1, 1].imag
+
+    r1 = ((re22 - 1) * re12 + im22 * im12) / ((re22 - 1) ** 2 + im22 ** 2)
+    r2 = ((re11 - 1) * re12 + im11 * im12) / ((re11 - 1) ** 2 + im11 ** 2)
+    c1 = ((re22 - 1) ** 2 + im22 ** 2) / \
+        (omega * (re12 * im22 - (re22 - 1) * im12))
+    c2 = ((re11 - 1) ** 2 + im11 ** 2) / \
+        (omega * (re12 * im11 - (re11 - 1) * im12))
+    r3 = np.sum(r_layer, axis=1) - r1 - r2
+
+    r_wall = r1 + r2 + r3
+
+    c1_korr = (1 / (omega * r1)) * \
+        ((r_wall - re12 * re22 - im12 * im22) / (re22 * im12 - re12 * im22))
+
+    return r1, r2, r3, c1, c2, c1_korr
+
+
+class EquivalentResCache(object):
+    """Cache for equivalent resistances and capacities per unit area.
+
+    Building elements with identical layer stacks (e.g. all walls loaded
+    from the same type element) only differ in area. This class stores the
+    VDI 6007 results for 1 m2 with the layer stack and t_bt as key, so
+    that the transfer matrices of each distinct construction are only
+    calculated once. The least recently used entries are evicted once
+    maxsize is exceeded.
+
+    Parameters
+    ----------
+    maxsize : int
+        Maximum number of cached layer stacks, use 0 to disable caching
+        (default 4096)
+
+    Attributes
+    ----------
+    hits : int
+        Number of layer stacks found in the cache
+    misses : int
+        Number of layer stacks that needed to be calculated
+    """
+
+    def __init__(self, maxsize=4096):
+        """Constructor of EquivalentResCache"""
+
+        self._results = collections.OrderedDict()
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._results)
+
+    def get(self, key):
+        """Returns the cached results for key or None"""
+
+        try:
+            value = self._results[key]
+        except KeyError:
+            self.misses += 1
+            return None
+        self._results.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key, value):
+        """Stores the results for key and evicts old entries"""
+
+        if self.maxsize <= 0:
+            return
+        self._results[key] = value
+        self._results.move_to_end(key)
+        self._evict()
+
+    def _evict(self):
+        """Removes least recently used entries exceeding maxsize"""
+
+        while len(self._results) > max(self.maxsize, 0):
+            self._results.popitem(last=False)
+
+    def clear(self):
+        """Deletes all cached results and resets the counters"""
+
+        self._results.clear()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def maxsize(self):
+        return self._maxsize
+
+    @maxsize.setter
+    def maxsize(self, value):
+
+        self._maxsize = int(value)
+        self._evict()
+
+
+unit_res_cache = EquivalentResCache()
+
+
+def calc_equivalent_res(elements, t_bt=7):
+    """Equivalent resistance according to VDI 6007 for several walls.
+
+    Calculates the equivalent resistances and capacities of all given walls
+    and sets r1, r2, r3, c1, c2 and c1_korr of each wall. Results per unit
+    area are looked up in unit_res_cache, all remaining layer stacks are
+    calculated in one vectorized pass. For OuterWall, Rooftop and
+    GroundFloor c1 is set to c1_korr. This function is used by
+    Wall.calc_equivalent_res() and the calculation classes of the thermal
+    zone (e.g. TwoElement).
+
+    Parameters
+    ----------
+    elements : list
+        List of TEASER Wall instances (e.g. OuterWall, InnerWall, Floor)
+    t_bt : int
+        Time constant according to VDI 6007 (default t_bt = 7)
+    """
+
+    if len(elements) == 0:
+        return
+
+    for element in elements:
+        if element.area is None:
+            raise TypeError(
+                "Area of building element {} is not set".format(element.name))
+        if element.area == 0:
+            raise ZeroDivisionError(
+                "Area of building element {} is zero".format(element.name))
+    area = np.array([element.area for element in elements], dtype=float)
+
+    keys = [(get_layer_stack(element), t_bt) for element in elements]
+    unit_res = [unit_res_cache.get(key) for key in keys]
+
+    missing = collections.OrderedDict()
+    for key, res in zip(keys, unit_res):
+        if res is None:
+            missing[key] = None
+    if missing:
+        results = calc_unit_equivalent_res(
+            *pad_layer_stacks([key[0] for key in missing]), t_bt=t_bt)
+        for i, key in enumerate(missing):
+            missing[key] = tuple(result[i] for result in results)
+            unit_res_cache.put(key, missing[key])
+        unit_res = [res if res is not None else missing[key]
+                    for key, res in zip(keys, unit_res)]
+
+    for i, element in enumerate(elements):
+        r1, r2, r3, c1, c2, c1_korr = unit_res[i]
+        element.r1 = r1 / area[i]
+        element.r2 = r2 / area[i]
+        element.r3 = r3 / area[i]
+        element.c1 = c1 * area[i]
+        element.c2 = c2 * area[i]
+        element.c1_korr = c1_korr * area[i]
+
+        if type(element).__name__ == "OuterWall" \
+                or type(element).__name__ == "Rooftop" \
+                or type(element).__name__ == "GroundFloor":
+            element.c1 = element.c1_korr
@@ -3,8 +3,8 @@
 
 """This module includes a class for central AHU
 """
-import pandas as pd
-from itertools import cycle, islice
+from collections import OrderedDict
+import teaser.logic.schedules as schedules
 
 
 class BuildingAHU(object):
@@ -73,6 +73,10 @@ class BuildingAHU(object):
         timeline of relative humidity requirements for AHU simulation
     v_flow_profile : [int]
         timeline of desired relative v_flow of the AHU simulation (0..1)
+    schedules : pandas.DataFrame
+        All profiles of the AHU for one year in hourly time steps, used for
+        export. It is created on first access and discarded when a profile
+        is changed.
 
     """
 
@@ -95,28 +99,11 @@ class BuildingAHU(object):
         self.pressure_drop_fan_supply = 800
         self.pressure_drop_fan_return = 800
 
-        self._temperature_profile = 7 * [293.15] + 12 * [295.15] + 6 * [293.15]
-        self._min_relative_humidity_profile = 25 * [0.45]
-        self._max_relative_humidity_profile = 25 * [0.65]
-        self._v_flow_profile = 7 * [0.0] + 12 * [1.0] + 6 * [0.0]
-
-        self.schedules = pd.DataFrame(
-            index=pd.date_range("2019-01-01 00:00:00", periods=8760, freq="H")
-            .to_series()
-            .dt.strftime("%m-%d %H:%M:%S"),
-            data={
-                "temperature_profile": list(
-                    islice(cycle(self.temperature_profile), 8760)
-                ),
-                "min_relative_humidity_profile": list(
-                    islice(cycle(self.min_relative_humidity_profile), 8760)
-                ),
-                "max_relative_humidity_profile": list(
-                    islice(cycle(self.max_relative_humidity_profile), 8760)
-                ),
-                "v_flow_profile": list(islice(cycle(self.v_flow_profile), 8760)),
-            },
-        )
+        self._schedules = None
+        self.temperature_profile = 7 * [293.15] + 12 * [295.15] + 6 * [293.15]
+        self.min_relative_humidity_profile = 25 * [0.45]
+        self.max_relative_humidity_profile = 25 * [0.65]
+        self.v_flow_profile = 7 * [0.0] + 12 * [1.0] + 6 * [0.0]
 
     @property
     def parent(self):
@@ -133,48 +120,57 @@ class BuildingAHU(object):
 
     @property
     def temperature_profile(self):
-        return self._temperature_profile
+        return list(self._temperature_profile)
 
     @temperature_profile.setter
     def temperature_profile(self, value):
-        if not isinstance(value, list):
-            value = [value]
-        self._temperature_profile = value
-        self.schedules["temperature_profile"] = list(islice(cycle(value), 8760))
+        self._temperature_profile = schedules.intern_profile(value)
+        self._schedules = None
 
     @property
     def min_relative_humidity_profile(self):
-        return self._min_relative_humidity_profile
+        return list(self._min_relative_humidity_profile)
 
     @min_relative_humidity_profile.setter
     def min_relative_humidity_profile(self, value):
-        if not isinstance(value, list):
-            value = [value]
-        self._min_relative_humidity_profile = value
-        self.schedules["min_relative_humidity_profile"] = list(
-            islice(cycle(value), 8760)
-        )
+        self._min_relative_humidity_profile = schedules.intern_profile(value)
+        self._schedules = None
 
     @property
     def max_relative_humidity_profile(self):
-        return self._max_relative_humidity_profile
+        return list(self._max_relative_humidity_profile)
 
     @max_relative_humidity_profile.setter
     def max_relative_humidity_profile(self, value):
-        if not isinstance(value, list):
-            value = [value]
-        self._min_relative_humidity_profile = value
-        self.schedules["max_relative_humidity_profile"] = list(
-            islice(cycle(value), 8760)
-        )
+        self._max_relative_humidity_profile = schedules.intern_profile(value)
+        self._schedules = None
 
     @property
     def v_flow_profile(self):
-        return self._v_flow_profile
+        return list(self._v_flow_profile)
 
     @v_flow_profile.setter
     def v_flow_profile(self, value):
-        if not isinstance(value, list):
-            value = [value]
-        self._v_flow_profile = value
-        self.schedules["v_flow_profile"] = list(islice(cycle(value), 8760))
+        self._v_flow_profile = schedules.intern_profile(value)
+        self._schedules = None
+
+    @property
+    def schedules(self):
+        if self._schedules is None:
+            self._schedules = schedules.build_schedules(
+                OrderedDict(
+                    [
+                        ("temperature_profile", self._temperature_profile),
+                        (
+                            "min_relative_humidity_profile",
+                            self._min_relative_humidity_profile,
+                        ),
+                        (
+                            "max_relative_humidity_profile",
+                            self._max_relative_humidity_profile,
+                        ),
+                        ("v_flow_profile", self._v_flow_profile),
+                    ]
+                )
+            )
+        return self._schedules
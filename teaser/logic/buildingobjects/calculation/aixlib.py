@@ -1,9 +1,9 @@
 """This module includes AixLib calculation class."""
 
 import teaser.logic.utilities as utilities
-from itertools import cycle, islice
+import teaser.data.output.sinks as sinks
+import teaser.logic.schedules as schedules
 import os
-import pandas as pd
 
 
 class AixLib(object):
@@ -102,7 +102,7 @@ class AixLib(object):
 
         self.total_surface_area = surf_area_temp
 
-    def modelica_set_temp(self, path=None):
+    def modelica_set_temp(self, path=None, sink=None):
         """Create .txt file for set temperatures for heating.
 
         This function creates a txt for set temperatures of each
@@ -112,6 +112,8 @@ class AixLib(object):
         ----------
         path : str
             optional path, when matfile is exported separately
+        sink : teaser.data.output.sinks.DirectorySink
+            optional target of the file, default writes to the file system
 
         """
         if path is None:
@@ -119,31 +121,22 @@ class AixLib(object):
         else:
             pass
 
-        utilities.create_path(path)
+        if sink is None:
+            sink = sinks.DirectorySink()
+        sink.makedirs(path)
         path = os.path.join(path, self.file_set_t_heat)
 
-        export = pd.DataFrame(
-            index=pd.date_range("2019-01-01 00:00:00", periods=8760, freq="H")
-            .to_series()
-            .dt.strftime("%m-%d %H:%M:%S"),
-            columns=[zone.name for zone in self.parent.thermal_zones],
+        schedules.write_table(
+            path=path,
+            name="Tset",
+            columns=[
+                zone.use_conditions.schedules["heating_profile"]
+                for zone in self.parent.thermal_zones
+            ],
+            sink=sink,
         )
 
-        for zone_count in self.parent.thermal_zones:
-            export[zone_count.name] = zone_count.use_conditions.schedules[
-                "heating_profile"
-            ]
-
-        export.index = [(i + 1) * 3600 for i in range(8760)]
-        self._delete_file(path=path)
-        with open(path, "a") as f:
-            f.write("#1\n")
-            f.write(
-                "double Tset({}, {})\n".format(8760, len(self.parent.thermal_zones) + 1)
-            )
-            export.to_csv(f, sep="\t", header=False, index_label=False)
-
-    def modelica_set_temp_cool(self, path=None):
+    def modelica_set_temp_cool(self, path=None, sink=None):
         """Create .txt file for set temperatures cooling.
 
         This function creates a txt for set temperatures for cooling
@@ -154,6 +147,8 @@ class AixLib(object):
         ----------
         path : str
             optional path, when matfile is exported separately
+        sink : teaser.data.output.sinks.DirectorySink
+            optional target of the file, default writes to the file system
 
         """
         if path is None:
@@ -161,31 +156,22 @@ class AixLib(object):
         else:
             pass
 
-        utilities.create_path(path)
+        if sink is None:
+            sink = sinks.DirectorySink()
+        sink.makedirs(path)
         path = os.path.join(path, self.file_set_t_cool)
 
-        export = pd.DataFrame(
-            index=pd.date_range("2019-01-01 00:00:00", periods=8760, freq="H")
-            .to_series()
-            .dt.strftime("%m-%d %H:%M:%S"),
-            columns=[zone.name for zone in self.parent.thermal_zones],
+        schedules.write_table(
+            path=path,
+            name="Tset",
+            columns=[
+                zone.use_conditions.schedules["cooling_profile"]
+                for zone in self.parent.thermal_zones
+            ],
+            sink=sink,
         )
 
-        for zone_count in self.parent.thermal_zones:
-            export[zone_count.name] = zone_count.use_conditions.schedules[
-                "cooling_profile"
-            ]
-
-        export.index = [(i + 1) * 3600 for i in range(8760)]
-        self._delete_file(path=path)
-        with open(path, "a") as f:
-            f.write("#1\n")
-            f.write(
-                "double Tset({}, {})\n".format(8760, len(self.parent.thermal_zones) + 1)
-            )
-            export.to_csv(f, sep="\t", header=False, index_label=False)
-
-    def modelica_AHU_boundary(self, path=None):
+    def modelica_AHU_boundary(self, path=None, sink=None):
         """Create .txt file for AHU boundary conditions (building).
 
         This function creates a txt for building AHU boundary
@@ -201,6 +187,8 @@ class AixLib(object):
         ----------
         path : str
             optional path, when matfile is exported separately
+        sink : teaser.data.output.sinks.DirectorySink
+            optional target of the file, default writes to the file system
 
         Attributes
         ----------
@@ -219,31 +207,20 @@ class AixLib(object):
         else:
             pass
 
-        utilities.create_path(path)
+        if sink is None:
+            sink = sinks.DirectorySink()
+        sink.makedirs(path)
         path = os.path.join(path, self.file_ahu)
 
         if self.parent.with_ahu is True:
             export = self.parent.central_ahu.schedules
+            columns = [export[column] for column in export.columns]
         else:  # Dummy values for Input Table
-            export = pd.DataFrame(
-                index=pd.date_range("2019-01-01 00:00:00", periods=8760, freq="H")
-                .to_series()
-                .dt.strftime("%m-%d %H:%M:%S")
-            )
-
-            export["temperature_profile"] = list(islice(cycle([293.15, 293.15]), 8760))
-            export["min_relative_humidity_profile"] = list(islice(cycle([0, 0]), 8760))
-            export["max_relative_humidity_profile"] = list(islice(cycle([1, 1]), 8760))
-            export["v_flow_profile"] = list(islice(cycle([0, 1]), 8760))
-
-        export.index = [(i + 1) * 3600 for i in range(8760)]
-        self._delete_file(path=path)
-        with open(path, "a") as f:
-            f.write("#1\n")
-            f.write("double AHU({}, {})\n".format(8760, 5))
-            export.to_csv(f, sep="\t", header=False, index_label=False)
-
-    def modelica_gains_boundary(self, path=None):
+            columns = [[293.15, 293.15], [0, 0], [1, 1], [0, 1]]
+
+        schedules.write_table(path=path, name="AHU", columns=columns, sink=sink)
+
+    def modelica_gains_boundary(self, path=None, sink=None):
         """Create .txt file for internal gains boundary conditions.
 
         This function creates a matfile (-v4) for building internal gains
@@ -265,6 +242,8 @@ class AixLib(object):
         ----------
         path : str
             optional path, when matfile is exported separately
+        sink : teaser.data.output.sinks.DirectorySink
+            optional target of the file, default writes to the file system
 
         """
         if path is None:
@@ -272,51 +251,16 @@ class AixLib(object):
         else:
             pass
 
-        utilities.create_path(path)
+        if sink is None:
+            sink = sinks.DirectorySink()
+        sink.makedirs(path)
         path = os.path.join(path, self.file_internal_gains)
 
-        export = pd.DataFrame(
-            index=pd.date_range("2019-01-01 00:00:00", periods=8760, freq="H")
-            .to_series()
-            .dt.strftime("%m-%d %H:%M:%S")
-        )
-
+        columns = []
         for zone_count in self.parent.thermal_zones:
-            export[
-                "person_{}".format(zone_count.name)
-            ] = zone_count.use_conditions.schedules["persons_profile"]
-            export[
-                "machines_{}".format(zone_count.name)
-            ] = zone_count.use_conditions.schedules["machines_profile"]
-            export[
-                "lighting_{}".format(zone_count.name)
-            ] = zone_count.use_conditions.schedules["lighting_profile"]
-
-        export.index = [(i + 1) * 3600 for i in range(8760)]
-        self._delete_file(path=path)
-        with open(path, "a") as f:
-            f.write("#1\n")
-            f.write(
-                "double Internals({}, {})\n".format(
-                    8760, (len(self.parent.thermal_zones) * 3 + 1)
-                )
-            )
-            export.to_csv(f, sep="\t", header=False, index_label=False)
+            export = zone_count.use_conditions.schedules
+            columns.append(export["persons_profile"])
+            columns.append(export["machines_profile"])
+            columns.append(export["lighting_profile"])
 
-    def _delete_file(self, path):
-        """Delete a file before new information is written to it.
-
-        If a building with the exact name and project name is generated, we need to make
-        sure to delete the old information in the text files. This helper function is a
-        wrapper to delete a file with given filepath.
-
-        Parameters:
-        -----------
-        path : str
-            Absolute path to the file to be deleted.
-
-        """
-        try:
-            os.remove(path)
-        except OSError:
-            pass
+        schedules.write_table(path=path, name="Internals", columns=columns, sink=sink)
@@ -4,6 +4,8 @@ from __future__ import division
 import math
 import random
 import warnings
+import teaser.logic.buildingobjects.buildingphysics.equivalentres as \
+    equivalentres
 
 
 class OneElement(object):
@@ -325,8 +327,17 @@ class OneElement(object):
                        self.thermal_zone.ground_floors +
                        self.thermal_zone.rooftops)
 
-        for out_wall in outer_walls:
-            out_wall.calc_equivalent_res()
+        equivalentres.calc_equivalent_res(
+            elements=(self.thermal_zone.outer_walls +
+                      self.thermal_zone.rooftops +
+                      self.thermal_zone.ground_floors +
+                      self.thermal_zone.inner_walls +
+                      self.thermal_zone.floors +
+                      self.thermal_zone.ceilings))
+
+        for out_wall in (self.thermal_zone.outer_walls +
+                         self.thermal_zone.rooftops +
+                         self.thermal_zone.ground_floors):
             out_wall.calc_ua_value()
         for win in self.thermal_zone.windows:
             win.calc_equivalent_res()
@@ -334,7 +345,6 @@ class OneElement(object):
         for inner_wall in (self.thermal_zone.inner_walls +
                            self.thermal_zone.floors +
                            self.thermal_zone.ceilings):
-            inner_wall.calc_equivalent_res()
             inner_wall.calc_ua_value()
 
         self.set_calc_default()
@@ -4,6 +4,8 @@ from __future__ import division
 import math
 import random
 import warnings
+import teaser.logic.buildingobjects.buildingphysics.equivalentres as \
+    equivalentres
 
 
 class ThreeElement(object):
@@ -455,19 +457,24 @@ class ThreeElement(object):
         outer_walls = (self.thermal_zone.outer_walls +
                        self.thermal_zone.rooftops)
 
-        for out_wall in outer_walls:
-            out_wall.calc_equivalent_res()
+        equivalentres.calc_equivalent_res(
+            elements=(self.thermal_zone.outer_walls +
+                      self.thermal_zone.rooftops +
+                      self.thermal_zone.ground_floors +
+                      self.thermal_zone.inner_walls +
+                      self.thermal_zone.floors +
+                      self.thermal_zone.ceilings))
+
+        for out_wall in (self.thermal_zone.outer_walls +
+                         self.thermal_zone.rooftops +
+                         self.thermal_zone.ground_floors):
             out_wall.calc_ua_value()
-        for gf in self.thermal_zone.ground_floors:
-            gf.calc_equivalent_res()
-            gf.calc_ua_value()
         for win in self.thermal_zone.windows:
             win.calc_equivalent_res()
             win.calc_ua_value()
         for inner_wall in (self.thermal_zone.inner_walls +
                            self.thermal_zone.floors +
                            self.thermal_zone.ceilings):
-            inner_wall.calc_equivalent_res()
             inner_wall.calc_ua_value()
 
         self.set_calc_default()
@@ -1009,10 +1016,6 @@ class ThreeElement(object):
                        self.thermal_zone.floors +
                        self.thermal_zone.ceilings)
 
-        for in_wall in inner_walls:
-            in_wall.calc_equivalent_res()
-            in_wall.calc_ua_value()
-
         if 0 < len(inner_walls) <= 1:
             # only one outer wall, no need to calculate chain matrix
             self.r1_iw = inner_walls[0].r1
@@ -2,8 +2,7 @@
 import random
 import teaser.data.input.usecond_input as usecond_input
 import teaser.data.output.usecond_output as usecond_output
-import pandas as pd
-from itertools import cycle, islice
+import teaser.logic.schedules as schedules
 from collections import OrderedDict
 from teaser.logic.utilities import division_from_json
 
@@ -160,7 +159,18 @@ class UseConditions(object):
         aligned to :cite:`DINV1859910`.
     schedules: pandas.DataFrame
         All time dependent boundary attributes in one pandas DataFrame, used
-        for export (one year in hourly timestep.)
+        for export (one year in hourly timestep.) Only the base profiles are
+        stored, the DataFrame is created on first access and discarded when
+        a profile is changed.
+
+    Notes
+    -----
+    Profiles (heating_profile, cooling_profile, persons_profile,
+    machines_profile and lighting_profile) are interned with
+    teaser.logic.schedules.intern_profile(), so all zones with equal
+    profiles share one immutable Profile. The getters return a new list,
+    changes to that list are not stored; assign the changed list to the
+    profile instead.
 
     """
 
@@ -204,7 +214,8 @@ class UseConditions(object):
 
         self._with_ideal_thresholds = False
 
-        self._heating_profile = [
+        self._schedules = None
+        self.heating_profile = [
             294.15,
             294.15,
             294.15,
@@ -231,7 +242,7 @@ class UseConditions(object):
             294.15,
             294.15,
         ]
-        self._cooling_profile = [
+        self.cooling_profile = [
             294.15,
             294.15,
             294.15,
@@ -258,7 +269,7 @@ class UseConditions(object):
             294.15,
             294.15,
         ]
-        self._persons_profile = [
+        self.persons_profile = [
             0.0,
             0.0,
             0.0,
@@ -284,7 +295,7 @@ class UseConditions(object):
             0.0,
             0.0,
         ]
-        self._machines_profile = [
+        self.machines_profile = [
             0.1,
             0.1,
             0.1,
@@ -310,7 +321,7 @@ class UseConditions(object):
             0.1,
             0.1,
         ]
-        self._lighting_profile = [
+        self.lighting_profile = [
             0.0,
             0.0,
             0.0,
@@ -337,19 +348,6 @@ class UseConditions(object):
             0.0,
         ]
 
-        self.schedules = pd.DataFrame(
-            index=pd.date_range("2019-01-01 00:00:00", periods=8760, freq="H")
-            .to_series()
-            .dt.strftime("%m-%d %H:%M:%S"),
-            data={
-                "heating_profile": list(islice(cycle(self._heating_profile), 8760)),
-                "cooling_profile": list(islice(cycle(self._cooling_profile), 8760)),
-                "persons_profile": list(islice(cycle(self._persons_profile), 8760)),
-                "lighting_profile": list(islice(cycle(self._lighting_profile), 8760)),
-                "machines_profile": list(islice(cycle(self._machines_profile), 8760)),
-            },
-        )
-
     def load_use_conditions(self, zone_usage, data_class=None):
         """Load typical use conditions from JSON data base.
 
@@ -413,58 +411,64 @@ class UseConditions(object):
 
     @property
     def heating_profile(self):
-        return self._heating_profile
+        return list(self._heating_profile)
 
     @heating_profile.setter
     def heating_profile(self, value):
-        if not isinstance(value, list):
-            value = [value]
-        self._heating_profile = value
-        self.schedules["heating_profile"] = list(islice(cycle(value), 8760))
+        self._heating_profile = schedules.intern_profile(value)
+        self._schedules = None
 
     @property
     def cooling_profile(self):
-        return self._cooling_profile
+        return list(self._cooling_profile)
 
     @cooling_profile.setter
     def cooling_profile(self, value):
-        if not isinstance(value, list):
-            value = [value]
-        self._cooling_profile = value
-        self.schedules["cooling_profile"] = list(islice(cycle(value), 8760))
+        self._cooling_profile = schedules.intern_profile(value)
+        self._schedules = None
 
     @property
     def persons_profile(self):
-        return self._persons_profile
+        return list(self._persons_profile)
 
     @persons_profile.setter
     def persons_profile(self, value):
-        if not isinstance(value, list):
-            value = [value]
-        self._persons_profile = value
-        self.schedules["persons_profile"] = list(islice(cycle(value), 8760))
+        self._persons_profile = schedules.intern_profile(value)
+        self._schedules = None
 
     @property
     def machines_profile(self):
-        return self._machines_profile
+        return list(self._machines_profile)
 
     @machines_profile.setter
     def machines_profile(self, value):
-        if not isinstance(value, list):
-            value = [value]
-        self._machines_profile = value
-        self.schedules["machines_profile"] = list(islice(cycle(value), 8760))
+        self._machines_profile = schedules.intern_profile(value)
+        self._schedules = None
 
     @property
     def lighting_profile(self):
-        return self._lighting_profile
+        return list(self._lighting_profile)
 
     @lighting_profile.setter
     def lighting_profile(self, value):
-        if not isinstance(value, list):
-            value = [value]
-        self._lighting_profile = value
-        self.schedules["lighting_profile"] = list(islice(cycle(value), 8760))
+        self._lighting_profile = schedules.intern_profile(value)
+        self._schedules = None
+
+    @property
+    def schedules(self):
+        if self._schedules is None:
+            self._schedules = schedules.build_schedules(
+                OrderedDict(
+                    [
+                        ("heating_profile", self._heating_profile),
+                        ("cooling_profile", self._cooling_profile),
+                        ("persons_profile", self._persons_profile),
+                        ("lighting_profile", self._lighting_profile),
+                        ("machines_profile", self._machines_profile),
+                    ]
+                )
+            )
+        return self._schedules
 
     @property
     def parent(self):
@@ -0,0 +1,312 @@
+# created October 2026
+# by TEASER4 Development Team
+
+"""Parallel: Functions to distribute work on buildings to worker processes
+
+Buildings are sent to the workers without their parent Project (and thus
+without the DataClass and all other buildings of the project). Only the
+calculated results are sent back and applied to the buildings of the
+calling process. For export, the buildings get a copy of the Project without
+buildings and DataClass as parent in the worker.
+"""
+
+import io
+import copy
+import pickle
+import collections
+import concurrent.futures
+
+ELEMENT_LISTS = [
+    "outer_walls",
+    "doors",
+    "rooftops",
+    "ground_floors",
+    "windows",
+    "inner_walls",
+    "floors",
+    "ceilings",
+]
+
+ELEMENT_CALC_ATTR = [
+    "r1",
+    "r2",
+    "r3",
+    "c1",
+    "c2",
+    "c1_korr",
+    "ua_value",
+    "u_value",
+    "r_conduc",
+    "r_inner_conv",
+    "r_inner_rad",
+    "r_inner_comb",
+    "r_outer_conv",
+    "r_outer_rad",
+    "r_outer_comb",
+    "wf_out",
+]
+
+
+class _DetachedPickler(pickle.Pickler):
+    """Pickler that replaces the parent Project of a building by None"""
+
+    def __init__(self, file, project):
+        super(_DetachedPickler, self).__init__(
+            file, protocol=pickle.HIGHEST_PROTOCOL)
+        self.project = project
+
+    def persistent_id(self, obj):
+        if self.project is not None and obj is self.project:
+            return "project"
+        return None
+
+
+class _DetachedUnpickler(pickle.Unpickler):
+    """Unpickler that restores the parent Project of a building"""
+
+    def __init__(self, file, project=None):
+        super(_DetachedUnpickler, self).__init__(file)
+        self.project = project
+
+    def persistent_load(self, pid):
+        if pid == "project":
+            return self.project
+        raise pickle.UnpicklingError("unsupported persistent id")
+
+
+def dump_building(bldg):
+    """Serializes a building without its parent Project.
+
+    Parameters
+    ----------
+    bldg : Building()
+        TEASER instance of Building
+
+    Returns
+    ----------
+    data : bytes
+        Pickled building, the parent of the building is None once loaded
+    """
+
+    buffer = io.BytesIO()
+    _DetachedPickler(buffer, bldg.parent).dump(bldg)
+    return buffer.getvalue()
+
+
+def load_building(data, project=None):
+    """Loads a building serialized with dump_building().
+
+    Parameters
+    ----------
+    data : bytes
+        Pickled building
+    project : Project()
+        Parent of the loaded building, default is None
+
+    Returns
+    ----------
+    bldg : Building()
+        TEASER instance of Building with project as parent
+    """
+
+    return _DetachedUnpickler(io.BytesIO(data), project).load()
+
+
+def detach_project(prj):
+    """Returns a copy of a project without buildings and DataClass.
+
+    The copy holds all information of the project needed to export its
+    buildings (e.g. name, weather_file_path and modelica_info).
+
+    Parameters
+    ----------
+    prj : Project()
+        TEASER instance of Project
+
+    Returns
+    ----------
+    project : Project()
+        Shallow copy of prj with an empty list of buildings and data None,
+        None if prj is None
+    """
+
+    if prj is None:
+        return None
+    project = copy.copy(prj)
+    project.__dict__["buildings"] = []
+    project.__dict__["data"] = None
+    return project
+
+
+def get_executor(workers=None, executor=None):
+    """Returns the executor to use and if it needs to be shut down.
+
+    Parameters
+    ----------
+    workers : int
+        Number of worker processes for a new ProcessPoolExecutor
+    executor : concurrent.futures.Executor
+        User defined executor, it is not shut down after use
+
+    Returns
+    ----------
+    executor : concurrent.futures.Executor
+        Executor to submit jobs to
+    shutdown : bool
+        True if the executor was created here and needs to be shut down
+    """
+
+    if executor is not None:
+        return executor, False
+    return concurrent.futures.ProcessPoolExecutor(max_workers=workers), True
+
+
+def calc_building_zones(
+        data,
+        number_of_elements=2,
+        merge_windows=False,
+        t_bt=5):
+    """Calculates all thermal zones of a serialized building.
+
+    This function runs in the worker process. It calculates the zone
+    parameters of all thermal zones and returns the results without
+    references to the building.
+
+    Parameters
+    ----------
+    data : bytes
+        Building serialized with dump_building()
+    number_of_elements : int
+        defines the number of elements, that area aggregated, between 1
+        and 4, default is 2
+    merge_windows : bool
+        True for merging the windows into the outer walls, False for
+        separate resistance for window, default is False
+    t_bt : float
+        Time constant according to VDI 6007 (default t_bt = 5)
+
+    Returns
+    ----------
+    results : list
+        One tuple (model class, model attributes, element attributes) per
+        thermal zone
+    """
+
+    bldg = load_building(data)
+    results = []
+    for zone in bldg.thermal_zones:
+        zone.calc_zone_parameters(
+            number_of_elements=number_of_elements,
+            merge_windows=merge_windows,
+            t_bt=t_bt)
+        model_attr = dict(zone.model_attr.__dict__)
+        del model_attr["thermal_zone"]
+        elements = {}
+        for element_list in ELEMENT_LISTS:
+            elements[element_list] = [
+                {attr: element.__dict__[attr] for attr in ELEMENT_CALC_ATTR
+                 if attr in element.__dict__}
+                for element in getattr(zone, element_list)]
+        results.append((type(zone.model_attr), model_attr, elements))
+    return results
+
+
+def apply_building_zones(bldg, results):
+    """Applies the results of calc_building_zones() to a building.
+
+    Parameters
+    ----------
+    bldg : Building()
+        TEASER instance of Building that was sent to the worker
+    results : list
+        Return value of calc_building_zones()
+    """
+
+    for zone, (model_class, model_attr, elements) in zip(
+            bldg.thermal_zones, results):
+        zone.model_attr = model_class.__new__(model_class)
+        zone.model_attr.__dict__.update(model_attr)
+        zone.model_attr.thermal_zone = zone
+        for element_list in ELEMENT_LISTS:
+            for element, attributes in zip(
+                    getattr(zone, element_list), elements[element_list]):
+                element.__dict__.update(attributes)
+
+
+def export_building(data, project, export, kwargs):
+    """Exports a serialized building.
+
+    This function runs in the worker process.
+
+    Parameters
+    ----------
+    data : bytes
+        Building serialized with dump_building()
+    project : Project()
+        Project as returned by detach_project(), parent of the building
+    export : function
+        Export function for one building, called with bldg and kwargs
+    kwargs : dict
+        Keyword arguments of export
+
+    Returns
+    ----------
+    result : object
+        Return value of export
+    """
+
+    return export(bldg=load_building(data, project=project), **kwargs)
+
+
+def export_buildings(
+        buildings, export, workers=None, executor=None, callback=None, **kwargs):
+    """Exports several buildings in worker processes.
+
+    Each building is exported by export(bldg=bldg, **kwargs) in a worker.
+    The function returns once all buildings are exported, errors of the
+    workers are raised in the order of buildings.
+
+    Parameters
+    ----------
+    buildings : list
+        List of TEASER instances of Building
+    export : function
+        Module level export function for one building
+    workers : int
+        Number of worker processes for a new ProcessPoolExecutor
+    executor : concurrent.futures.Executor
+        User defined executor, it is not shut down after use
+    callback : function
+        Optional function that is called in this process with the return
+        value of export of each building, in the order of buildings and as
+        soon as it is available. Its return value replaces the result
+
+    Returns
+    ----------
+    results : list
+        Return values of export (or callback) in the order of buildings
+    """
+
+    executor, shutdown = get_executor(workers=workers, executor=executor)
+    projects = {}
+    try:
+        futures = collections.deque()
+        for bldg in buildings:
+            if id(bldg.parent) not in projects:
+                projects[id(bldg.parent)] = detach_project(bldg.parent)
+            futures.append(executor.submit(
+                export_building,
+                dump_building(bldg),
+                projects[id(bldg.parent)],
+                export,
+                kwargs))
+        results = []
+        while futures:
+            result = futures.popleft().result()
+            if callback is not None:
+                result = callback(result)
+            results.append(result)
+        return results
+    finally:
+        if shutdown:
+            executor.shutdown()
@@ -0,0 +1,305 @@
+# created October 2026
+# by TEASER4 Development Team
+
+"""Schedules: Functions for time dependent boundary conditions
+
+Profiles of boundary conditions (e.g. UseConditions.heating_profile) are
+stored as short base profiles (typically one day or one week) that are
+repeated over one year in hourly time steps. These functions materialize
+the yearly view only when it is needed, e.g. for export.
+
+Base profiles are interned: all zones with equal profiles share one
+immutable Profile instance, so equal profiles can be compared with "is".
+
+Yearly schedules are written to Modelica tables (text format of
+Modelica.Blocks.Sources.CombiTimeTable) with write_table(), which formats
+the data with NumPy instead of pandas.
+"""
+
+import weakref
+import numpy as np
+
+HOURS_PER_YEAR = 8760
+
+_schedule_index = None
+
+_time_columns = {}
+
+_profile_registry = weakref.WeakValueDictionary()
+
+
+class Profile(object):
+    """Immutable base profile shared by all owners of equal values.
+
+    Do not create instances directly, use intern_profile(). Instances are
+    re-interned when they are unpickled or copied.
+
+    Parameters
+    ----------
+    values : tuple
+        Values of the base profile
+
+    Attributes
+    ----------
+    values : tuple
+        Values of the base profile
+    """
+
+    __slots__ = ("values", "_schedule", "__weakref__")
+
+    def __init__(self, values):
+        self.values = values
+        self._schedule = None
+
+    def __reduce__(self):
+        return intern_profile, (self.values,)
+
+    def __iter__(self):
+        return iter(self.values)
+
+    def __len__(self):
+        return len(self.values)
+
+    def __getitem__(self, item):
+        return self.values[item]
+
+    def __repr__(self):
+        return "Profile({!r})".format(self.values)
+
+    def expand(self):
+        """Returns the yearly schedule of the profile.
+
+        The schedule is created on first use and shared by all owners of the
+        profile.
+
+        Returns
+        ----------
+        schedule : np.array
+            Read-only array with one value per hour of the year
+        """
+
+        if self._schedule is None:
+            self._schedule = expand_profile(self.values)
+        return self._schedule
+
+
+def intern_profile(profile):
+    """Returns the shared Profile instance for the values of a profile.
+
+    Values are compared including their type, so [0, 1] and [0.0, 1.0] are
+    different profiles. Profiles are kept in the registry as long as they
+    are used.
+
+    Parameters
+    ----------
+    profile : list
+        Base profile, a single value is treated as profile of length one
+
+    Returns
+    ----------
+    profile : Profile
+        Immutable profile, identical for all equal base profiles
+    """
+
+    if isinstance(profile, Profile):
+        return profile
+    if not isinstance(profile, (list, tuple)):
+        profile = [profile]
+    values = tuple(profile)
+    key = (values, tuple(type(value) for value in values))
+    try:
+        interned = _profile_registry.get(key)
+    except TypeError:
+        return Profile(values)
+    if interned is None:
+        interned = Profile(values)
+        _profile_registry[key] = interned
+    return interned
+
+
+def expand_profile(profile, periods=HOURS_PER_YEAR):
+    """Repeats a base profile over the given number of time steps.
+
+    Parameters
+    ----------
+    profile : list
+        Base profile, repeated until periods values are reached
+    periods : int
+        Number of time steps, default is one year in hourly time steps
+
+    Returns
+    ----------
+    schedule : np.array
+        Read-only array with periods values
+    """
+
+    schedule = np.resize(np.asarray(profile), periods)
+    schedule.flags.writeable = False
+    return schedule
+
+
+def get_schedule_index():
+    """Returns the index of yearly schedules.
+
+    The index holds one "%m-%d %H:%M:%S" string per hour of the year 2019.
+    It is created on first use and shared by all schedules.
+
+    Returns
+    ----------
+    index : pandas.Series
+        Time stamps of one year in hourly time steps
+    """
+
+    global _schedule_index
+    if _schedule_index is None:
+        import pandas as pd
+
+        _schedule_index = (
+            pd.date_range("2019-01-01 00:00:00", periods=HOURS_PER_YEAR, freq="H")
+            .to_series()
+            .dt.strftime("%m-%d %H:%M:%S")
+        )
+    return _schedule_index
+
+
+def build_schedules(profiles):
+    """Creates the yearly schedules of several base profiles.
+
+    Parameters
+    ----------
+    profiles : collections.OrderedDict
+        Base profile for each column of the schedules
+
+    Returns
+    ----------
+    schedules : pandas.DataFrame
+        One column per profile, one row per hour of the year
+    """
+
+    import pandas as pd
+
+    return pd.DataFrame(
+        index=get_schedule_index(),
+        data={
+            name: intern_profile(profile).expand()
+            for name, profile in profiles.items()
+        },
+    )
+
+
+def get_time_column(periods=HOURS_PER_YEAR):
+    """Returns the formatted time column of Modelica tables.
+
+    The column holds the end of each hourly time step in seconds ("3600",
+    "7200", ...). It is created on first use and shared by all tables.
+
+    Parameters
+    ----------
+    periods : int
+        Number of time steps, default is one year in hourly time steps
+
+    Returns
+    ----------
+    time_column : np.array
+        Read-only array of strings with periods values
+    """
+
+    try:
+        return _time_columns[periods]
+    except KeyError:
+        pass
+    time_column = np.arange(1, periods + 1, dtype=np.int64) * 3600
+    time_column = time_column.astype(str)
+    time_column.flags.writeable = False
+    _time_columns[periods] = time_column
+    return time_column
+
+
+def format_column(column, periods=HOURS_PER_YEAR):
+    """Formats the values of one column of a Modelica table.
+
+    Values are formatted like pandas does (shortest representation, integers
+    without decimals). Schedules contain only a few distinct values, so each
+    distinct value is formatted once and then repeated.
+
+    Parameters
+    ----------
+    column : list
+        Values of the column, a base profile or schedule with less than
+        periods values is repeated until periods values are reached
+    periods : int
+        Number of time steps, default is one year in hourly time steps
+
+    Returns
+    ----------
+    column : np.array
+        Array of strings with periods values
+    """
+
+    values = np.asarray(column)
+    if values.ndim == 0:
+        values = values.reshape(1)
+    if len(values) != periods:
+        values = np.resize(values, periods)
+    unique, inverse = np.unique(values, return_inverse=True)
+    return unique.astype(str)[inverse]
+
+
+def format_table(name, columns, periods=HOURS_PER_YEAR):
+    """Formats schedules as table for Modelica.
+
+    Returns the text format of Modelica.Blocks.Sources.CombiTimeTable
+    ("#1", "double name(rows, columns)" and one tab separated line per time
+    step). The first column of the table is the time in seconds, followed by
+    the given columns.
+
+    Parameters
+    ----------
+    name : str
+        Name of the table (tableName in CombiTimeTable)
+    columns : list
+        List of columns, each column is a schedule or base profile (see
+        format_column())
+    periods : int
+        Number of time steps, default is one year in hourly time steps
+
+    Returns
+    ----------
+    table : str
+        Content of the table file
+    """
+
+    formatted = [get_time_column(periods)]
+    formatted.extend(format_column(column, periods) for column in columns)
+    lines = ["#1\n", "double {}({}, {})\n".format(name, periods, len(formatted))]
+    lines.extend("\t".join(row) + "\n" for row in zip(*[c.tolist() for c in formatted]))
+    return "".join(lines)
+
+
+def write_table(path, name, columns, periods=HOURS_PER_YEAR, sink=None):
+    """Writes schedules as table for Modelica.
+
+    Writes the table of format_table() to path. An existing file is
+    overwritten.
+
+    Parameters
+    ----------
+    path : str
+        Full path of the table file
+    name : str
+        Name of the table (tableName in CombiTimeTable)
+    columns : list
+        List of columns, each column is a schedule or base profile (see
+        format_column())
+    periods : int
+        Number of time steps, default is one year in hourly time steps
+    sink : teaser.data.output.sinks.DirectorySink
+        Target of the file, default is None, which writes to the file system
+    """
+
+    table = format_table(name=name, columns=columns, periods=periods)
+    if sink is None:
+        with open(path, "w") as f:
+            f.write(table)
+    else:
+        sink.write(path, table)
@@ -0,0 +1,488 @@
+# created October 2026
+# by TEASER4 Development Team
+
+"""Simulation of all zones of a project as one batched system.
+
+The thermal networks of all zones (see
+teaser.logic.simulation.reducedorder) are stacked into arrays with one
+row per zone: a small dense state space system per zone, padded to the
+largest number of states. The batch is discretized once per time step
+size and all zones are advanced together with one vectorized update per
+time step, so the memory scales linearly with the number of zones.
+
+Inputs of all zones are calculated from shared weather features (WEATHER
+of reducedorder, followed by the solar irradiation of each distinct
+orientation and tilt of the project). Each zone gathers only its own
+features (WEATHER and the orientations of its facades and roofs) and maps
+them with a small linear map, so the maps do not grow with the number of
+distinct orientations of the project.
+Internal gains and set temperatures are taken from the interned base
+profiles of the use conditions, each distinct profile is expanded once.
+"""
+
+import numpy as np
+import teaser.data.input.weather_input as weather_input
+import teaser.logic.schedules as schedules
+import teaser.logic.simulation.reducedorder as reducedorder
+import teaser.logic.simulation.solar as solar_irradiation
+
+CHUNK_SIZE = 168
+
+
+class BatchNetwork(object):
+    """Thermal networks of several zones, simulated at once.
+
+    Parameters
+    ----------
+    thermal_zones : list
+        Zones with calculated parameters (model_attr)
+    infiltration_rate : float [1/h]
+        Air exchange with the outdoor air, default is None, which uses
+        use_conditions.infiltration_rate of each zone
+
+    Attributes
+    ----------
+    thermal_zones : list
+        Simulated zones, in the order of the rows of all arrays
+    orientations : list
+        Distinct (orientation, tilt) of all facades and roofs, in the order
+        of the solar features (after WEATHER)
+    capacities : np.array [J/K]
+        Heat capacity of each state of each zone, padded states have a
+        capacity of 1 and no connections
+    conductance : np.array [W/K]
+        Conductance matrix of the states of each zone
+    input_matrix : np.array
+        Heat flow into each state per unit of each input of each zone
+    output_states : np.array
+        Air temperature per unit of each state of each zone
+    output_inputs : np.array
+        Air temperature per unit of each input of each zone
+    feature_index : np.array
+        Column of the weather features of each local feature of each zone:
+        WEATHER, followed by the distinct orientations of the facades and
+        roofs of the zone, padded with the constant feature
+    weather_map : np.array
+        Inputs (see INPUTS) per unit of each local feature of each zone,
+        zero for padded features
+    gains_map : np.array
+        Inputs per unit of convective and radiative gains of each zone
+    """
+
+    def __init__(self, thermal_zones, infiltration_rate=None):
+
+        self.thermal_zones = list(thermal_zones)
+        networks = [
+            reducedorder.ZoneNetwork(zone, infiltration_rate=infiltration_rate)
+            for zone in self.thermal_zones
+        ]
+        self.orientations = []
+        columns = {}
+        zone_features = []
+        zone_columns = []
+        for zone, network in zip(self.thermal_zones, networks):
+            model_attr = zone.model_attr
+            facade = list(zip(model_attr.orientation_facade, model_attr.tilt_facade))
+            roof = []
+            if network.areas["rt"] > 0:
+                roof = list(zip(model_attr.orientation_rt, model_attr.tilt_rt))
+            features = list(range(len(reducedorder.WEATHER)))
+            local_columns = {}
+            for key in facade + roof:
+                if key not in columns:
+                    columns[key] = len(reducedorder.WEATHER) + len(self.orientations)
+                    self.orientations.append(key)
+                if key not in local_columns:
+                    local_columns[key] = len(features)
+                    features.append(columns[key])
+            zone_features.append(features)
+            zone_columns.append(
+                (
+                    [local_columns[key] for key in facade],
+                    [local_columns[key] for key in roof],
+                )
+            )
+        n_features = max(
+            [len(features) for features in zone_features]
+            + [len(reducedorder.WEATHER)]
+        )
+
+        n_zones = len(networks)
+        n_states = max([len(network.state_names) for network in networks] + [1])
+        n_inputs = len(reducedorder.INPUTS)
+        self.capacities = np.ones((n_zones, n_states))
+        self.conductance = np.zeros((n_zones, n_states, n_states))
+        self.input_matrix = np.zeros((n_zones, n_states, n_inputs))
+        self.output_states = np.zeros((n_zones, n_states))
+        self.output_inputs = np.zeros((n_zones, n_inputs))
+        self.feature_index = np.zeros((n_zones, n_features), dtype=np.int64)
+        self.weather_map = np.zeros((n_zones, n_inputs, n_features))
+        self.gains_map = np.zeros((n_zones, n_inputs, 2))
+        for i, (zone, network) in enumerate(zip(self.thermal_zones, networks)):
+            n = len(network.state_names)
+            self.capacities[i, :n] = network.capacities
+            self.conductance[i, :n, :n] = network.conductance
+            self.input_matrix[i, :n] = network.input_matrix
+            self.output_states[i, :n] = network.output_states[0]
+            self.output_inputs[i] = network.output_inputs[0]
+            features = zone_features[i]
+            self.feature_index[i, : len(features)] = features
+            facade_columns, roof_columns = zone_columns[i]
+            weather_map, self.gains_map[i] = reducedorder.calc_input_map(
+                zone,
+                facade_columns=facade_columns,
+                roof_columns=roof_columns,
+                n_features=len(features),
+                areas=network.areas,
+            )
+            self.weather_map[i, :, : len(features)] = weather_map
+
+    def discretize(self, time_step):
+        """Returns the discrete systems of all zones for a time step.
+
+        Zones with equal networks (e.g. of the same archetype) are
+        discretized once (see reducedorder.discretization_cache).
+
+        Parameters
+        ----------
+        time_step : float [s]
+            Length of one time step
+
+        Returns
+        ----------
+        a_d : np.array
+            States at the end of a step per unit of the states at its start,
+            one matrix per zone
+        b_d : np.array
+            States at the end of a step per unit of the inputs, one matrix
+            per zone
+        """
+
+        return reducedorder.discretization_cache.discretize(
+            self.capacities, self.conductance, self.input_matrix, time_step
+        )
+
+    def get_features(self, t_outdoor, t_sky=None, solar=None):
+        """Returns the weather features of the batch.
+
+        Parameters
+        ----------
+        t_outdoor : np.array [K]
+            Outdoor air temperature for each time step
+        t_sky : np.array [K]
+            Black body sky temperature for each time step, default is None,
+            which neglects long wave radiation to the sky
+        solar : dict [W/m2]
+            Total solar irradiation for each time step of each (orientation,
+            tilt) in orientations, default is None for no solar radiation
+
+        Returns
+        ----------
+        features : np.array
+            Value of each feature (columns) for each time step (rows)
+        """
+
+        t_outdoor = np.asarray(t_outdoor, dtype=float)
+        features = np.zeros(
+            (len(t_outdoor), len(reducedorder.WEATHER) + len(self.orientations))
+        )
+        features[:, reducedorder.WEATHER.index("constant")] = 1.0
+        features[:, reducedorder.WEATHER.index("t_outdoor")] = t_outdoor
+        features[:, reducedorder.WEATHER.index("t_sky")] = (
+            t_outdoor if t_sky is None else t_sky
+        )
+        if solar is not None:
+            for i, key in enumerate(self.orientations):
+                if key not in solar:
+                    raise KeyError(
+                        "No solar irradiation for orientation {} and tilt "
+                        "{}".format(*key)
+                    )
+                features[:, len(reducedorder.WEATHER) + i] = solar[key]
+        return features
+
+    def simulate(
+        self,
+        t_outdoor,
+        t_sky=None,
+        solar=None,
+        time_step=3600,
+        t_start=None,
+        time_series=True,
+        max_heating=None,
+        max_cooling=None,
+    ):
+        """Simulates all zones of the batch.
+
+        The zones are heated and cooled ideally to the heating_profile and
+        cooling_profile of their use conditions, if with_heating and
+        with_cooling are set. As in reducedorder.ZoneNetwork.simulate(),
+        heating has priority if the heating set temperature is above the
+        cooling set temperature. Internal gains are calculated from the use
+        conditions as in reducedorder.calc_internal_gains().
+
+        Parameters
+        ----------
+        t_outdoor : np.array [K]
+            Outdoor air temperature for each time step
+        t_sky : np.array [K]
+            Black body sky temperature for each time step, default is None,
+            which neglects long wave radiation to the sky
+        solar : dict [W/m2]
+            Total solar irradiation for each time step of each (orientation,
+            tilt) in orientations, default is None for no solar radiation
+        time_step : float [s]
+            Length of one time step, default is 3600
+        t_start : float [K]
+            Temperature of all nodes at the start, default is None, which
+            uses t_inside of each zone
+        time_series : bool
+            If False, only the heating and cooling demand of each zone is
+            kept, default is True
+        max_heating : float or np.array [W]
+            Maximal heat flow of the ideal heater (for all zones or of each
+            zone), default is None for no limit
+        max_cooling : float or np.array [W]
+            Maximal heat flow of the ideal cooler (positive value, for all
+            zones or of each zone), default is None for no limit
+
+        Returns
+        ----------
+        result : SimulationResult
+            Air temperature and heat flows of the ideal heater and cooler,
+            one column per zone
+        """
+
+        features = self.get_features(t_outdoor, t_sky=t_sky, solar=solar)
+        periods = len(features)
+        n_zones = len(self.thermal_zones)
+        a_d, b_d = self.discretize(time_step)
+        n_states = self.capacities.shape[1]
+
+        profiles = _ProfileTable(periods, time_step)
+        gain_profiles = []
+        gain_values = []
+        for zone in self.thermal_zones:
+            coefficients = reducedorder.get_gain_coefficients(zone)
+            gain_profiles.append([profiles.add(c[0]) for c in coefficients])
+            gain_values.append([c[1:] for c in coefficients])
+        gain_profiles = np.array(gain_profiles, dtype=np.int64).reshape(n_zones, -1)
+        gain_values = np.array(gain_values, dtype=float).reshape(n_zones, -1, 2)
+        heating = np.array(
+            [zone.use_conditions.with_heating for zone in self.thermal_zones], dtype=bool
+        )
+        cooling = np.array(
+            [zone.use_conditions.with_cooling for zone in self.thermal_zones], dtype=bool
+        )
+        heating_profiles = np.array(
+            [
+                profiles.add(zone.use_conditions.heating_profile)
+                for zone in self.thermal_zones
+            ],
+            dtype=np.int64,
+        )
+        cooling_profiles = np.array(
+            [
+                profiles.add(zone.use_conditions.cooling_profile)
+                for zone in self.thermal_zones
+            ],
+            dtype=np.int64,
+        )
+        # one column per profile, so the rows of a chunk are contiguous
+        table = np.ascontiguousarray(profiles.get_table().T)
+
+        # the time loop works on arrays with one column per zone, the last
+        # row is the air temperature at the end of the step
+        b_full = np.concatenate(
+            [
+                b_d,
+                np.matmul(self.output_states[:, None, :], b_d)
+                + self.output_inputs[:, None, :],
+            ],
+            axis=1,
+        )
+        system = np.empty((n_states + 1, n_states, n_zones))
+        system[:n_states] = a_d.transpose(1, 2, 0)
+        system[n_states] = np.einsum("zs,zsj->jz", self.output_states, a_d)
+        b_weather = np.ascontiguousarray(
+            np.matmul(b_full, self.weather_map).transpose(2, 1, 0)
+        )
+        b_profiles = np.einsum(
+            "zsg,zkg->ksz", np.matmul(b_full, self.gains_map), gain_values
+        )
+        b_heat = np.ascontiguousarray(b_full[:, :, reducedorder.INPUTS.index("q_air")].T)
+        inverse_gain = 1 / b_heat[n_states]
+        limited = max_heating is not None or max_cooling is not None
+        if limited:
+            max_heating = _get_limit(max_heating, n_zones)
+            min_heating = -_get_limit(max_cooling, n_zones)
+
+        if t_start is None:
+            t_start = np.array([zone.t_inside for zone in self.thermal_zones])
+        x = np.ones((n_states + 1, n_zones)) * np.reshape(t_start, (1, -1))
+        heating_demand = np.zeros(n_zones)
+        cooling_demand = np.zeros(n_zones)
+        if time_series:
+            t_air = np.empty((periods, n_zones))
+            q_heat = np.zeros((periods, n_zones))
+            q_cool = np.zeros((periods, n_zones))
+
+        for start in range(0, periods, CHUNK_SIZE):
+            stop = min(start + CHUNK_SIZE, periods)
+            values = table[start:stop]
+            chunk = features[start:stop]
+            free = np.zeros((stop - start, n_states + 1, n_zones))
+            for m in range(self.feature_index.shape[1]):
+                if m < len(reducedorder.WEATHER):
+                    # WEATHER is the same for all zones
+                    feature = chunk[:, m, None]
+                else:
+                    feature = np.take(chunk, self.feature_index[:, m], axis=1)
+                for i in range(n_states + 1):
+                    free[:, i] += b_weather[m, i] * feature
+            for k in range(gain_profiles.shape[1]):
+                schedule = np.take(values, gain_profiles[:, k], axis=1)
+                for i in range(n_states + 1):
+                    free[:, i] += b_profiles[k, i] * schedule
+            heating_setpoint = np.where(
+                heating, np.take(values, heating_profiles, axis=1), -np.inf
+            )
+            cooling_setpoint = np.where(
+                cooling, np.take(values, cooling_profiles, axis=1), np.inf
+            )
+            t_chunk = np.empty((stop - start, n_zones))
+            q_chunk = np.empty((stop - start, n_zones))
+            for step in range(stop - start):
+                x = np.einsum("ijz,jz->iz", system, x[:n_states])
+                x += free[step]
+                t = t_chunk[step]
+                np.minimum(x[n_states], cooling_setpoint[step], out=t)
+                np.copyto(
+                    t,
+                    heating_setpoint[step],
+                    where=x[n_states] < heating_setpoint[step],
+                )
+                q = q_chunk[step]
+                np.subtract(t, x[n_states], out=q)
+                q *= inverse_gain
+                if limited:
+                    np.clip(q, min_heating, max_heating, out=q)
+                x += b_heat * q
+                if limited:
+                    t[:] = x[n_states]
+            q_pos = np.maximum(q_chunk, 0.0)
+            q_neg = np.minimum(q_chunk, 0.0)
+            heating_demand += q_pos.sum(axis=0)
+            cooling_demand -= q_neg.sum(axis=0)
+            if time_series:
+                t_air[start:stop] = t_chunk
+                q_heat[start:stop] = q_pos
+                q_cool[start:stop] = q_neg
+
+        result = reducedorder.SimulationResult(
+            time_step=time_step,
+            heating_demand=heating_demand * time_step / 3.6e6,
+            cooling_demand=cooling_demand * time_step / 3.6e6,
+            thermal_zones=self.thermal_zones,
+        )
+        if time_series:
+            result.t_air = t_air
+            result.q_heat = q_heat
+            result.q_cool = q_cool
+        return result
+
+
+def simulate_project(
+    project,
+    t_outdoor=None,
+    t_sky=None,
+    solar=None,
+    time_step=3600,
+    infiltration_rate=None,
+    t_start=None,
+    time_series=True,
+    max_heating=None,
+    max_cooling=None,
+):
+    """Simulates all zones of all buildings of a project at once.
+
+    The parameters of all buildings have to be calculated (e.g. with
+    Project.calc_all_buildings()). See BatchNetwork.simulate() for the
+    parameters.
+
+    Parameters
+    ----------
+    project : Project
+        Project with calculated buildings
+    t_outdoor : np.array [K]
+        Outdoor air temperature for each time step, default is None, which
+        takes the outdoor air temperature, sky temperature and solar
+        irradiation (see teaser.logic.simulation.solar) of the hourly
+        weather file of the project (project.weather_file_path)
+    infiltration_rate : float [1/h]
+        Air exchange with the outdoor air, default is None, which uses
+        use_conditions.infiltration_rate of each zone
+
+    Returns
+    ----------
+    result : SimulationResult
+        Air temperature and heat flows of the ideal heater and cooler, one
+        column per zone in the order of result.thermal_zones
+    """
+
+    network = BatchNetwork(
+        [zone for bldg in project.buildings for zone in bldg.thermal_zones],
+        infiltration_rate=infiltration_rate,
+    )
+    if t_outdoor is None:
+        weather = weather_input.load_weather(project.weather_file_path)
+        t_outdoor = weather.get_t_outdoor()
+        t_sky = weather.get_t_sky()
+        solar = solar_irradiation.get_irradiation(
+            weather, network.orientations
+        ).get_solar()
+    return network.simulate(
+        t_outdoor,
+        t_sky=t_sky,
+        solar=solar,
+        time_step=time_step,
+        t_start=t_start,
+        time_series=time_series,
+        max_heating=max_heating,
+        max_cooling=max_cooling,
+    )
+
+
+def _get_limit(limit, n_zones):
+    """Return the limit of the heat flow of each zone, inf for None."""
+    if limit is None:
+        return np.full(n_zones, np.inf)
+    return np.broadcast_to(np.asarray(limit, dtype=float), (n_zones,))
+
+
+class _ProfileTable(object):
+    """Schedules of distinct base profiles, each profile is expanded once."""
+
+    def __init__(self, periods, time_step):
+        self.periods = periods
+        self.time_step = time_step
+        self.rows = {}
+        self.profiles = []
+
+    def add(self, profile):
+        """Return the row of a profile, add it if new."""
+        profile = schedules.intern_profile(profile)
+        row = self.rows.get(id(profile))
+        if row is None:
+            row = self.rows[id(profile)] = len(self.profiles)
+            self.profiles.append(profile)
+        return row
+
+    def get_table(self):
+        """Return the schedules of all profiles, one row per profile."""
+        return np.array(
+            [
+                reducedorder.get_schedule(profile, self.periods, self.time_step)
+                for profile in self.profiles
+            ]
+        ).reshape(len(self.profiles), self.periods)
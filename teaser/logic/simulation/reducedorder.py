@@ -0,0 +1,1088 @@
+# created October 2026
+# by TEASER4 Development Team
+
+"""Reduced order simulation of thermal zones in Python.
+
+Simulates the thermal network of VDI 6007 Part 1 (as implemented in
+IBPSA/AixLib ThermalZones.ReducedOrder.RC) with the parameters of the
+calculation classes (OneElement, TwoElement, ThreeElement and FourElement)
+and the schedules of UseConditions, without a Modelica tool.
+
+The network has one node with heat capacity for the air and for each wall
+type (outer walls, interior walls, floor plate and roof) and one massless
+node for the inner surface of each wall type and the windows:
+
+air
+    convective heat transfer to all inner surfaces, infiltration to the
+    outdoor air
+inner surfaces
+    radiative heat transfer between each pair of surfaces with
+    alpha_rad_inner_mean * min(A_i, A_j)
+outer walls (ow)
+    surface - r1_ow - c1_ow - r_rest_ow and outer heat transfer - equivalent
+    air temperature of walls
+windows (win)
+    surface - r1_win and outer heat transfer - equivalent air temperature
+    of windows (not with merged windows, these are part of the outer walls)
+interior walls (iw)
+    surface - r1_iw - c1_iw
+floor plate (gf)
+    surface - r1_gf - c1_gf - r_rest_gf - t_ground
+roof (rt)
+    surface - r1_rt - c1_rt - r_rest_rt and outer heat transfer -
+    equivalent air temperature of the roof
+
+The massless nodes are eliminated and the remaining linear system is
+discretized exactly for the time step, with all inputs held constant during
+a time step (zero order hold). Inputs are the boundary temperatures and
+heat flows in the order of INPUTS. The ideal heater and cooler add
+convective heat to the air, their heat flow is constant during a time step
+and reaches the set temperature at the end of the step. Discrete systems
+are cached in discretization_cache, so networks of equal zones (e.g. of one
+archetype) are discretized once per time step.
+"""
+
+import collections
+import numpy as np
+import teaser.logic.schedules as schedules
+
+INPUTS = [
+    "t_eq_wall",
+    "t_eq_win",
+    "t_ground",
+    "t_eq_roof",
+    "t_outdoor",
+    "q_air",
+    "q_ow",
+    "q_win",
+    "q_iw",
+    "q_gf",
+    "q_rt",
+]
+
+SURFACES = ["ow", "win", "iw", "gf", "rt"]
+
+WEATHER = ["constant", "t_outdoor", "t_sky"]
+
+CACHE_SIZE = 1024
+
+CACHE_DIGITS = 10
+
+
+class ZoneNetwork(object):
+    """Linear thermal network of a thermal zone.
+
+    Parameters
+    ----------
+    thermal_zone : ThermalZone
+        Zone with calculated parameters (model_attr)
+    infiltration_rate : float [1/h]
+        Air exchange with the outdoor air, default is None, which uses
+        use_conditions.infiltration_rate
+
+    Attributes
+    ----------
+    node_names : list
+        Names of all nodes, "air", the wall types with heat capacity (e.g.
+        "ow") and the inner surfaces (e.g. "ow_surface")
+    state_names : list
+        Names of the nodes with heat capacity, in the order of the states
+    capacities : np.array [J/K]
+        Heat capacity of each state
+    conductance : np.array [W/K]
+        Symmetric conductance matrix of the states, massless nodes are
+        eliminated
+    input_matrix : np.array
+        Heat flow into each state per unit of each input (see INPUTS)
+    output_states : np.array
+        Temperature of each node per unit of each state
+    output_inputs : np.array
+        Temperature of each node per unit of each input
+    areas : dict [m2]
+        Area of each inner surface (see SURFACES), 0 if the surface does not
+        exist
+    """
+
+    def __init__(self, thermal_zone, infiltration_rate=None):
+
+        model_attr = thermal_zone.model_attr
+        if model_attr is None:
+            raise ValueError(
+                "Parameters of zone {} are not calculated, use "
+                "calc_zone_parameters()".format(thermal_zone.name)
+            )
+        if infiltration_rate is None:
+            infiltration_rate = thermal_zone.use_conditions.infiltration_rate
+
+        self.areas = get_surface_areas(model_attr)
+        self.node_names = ["air"]
+        capacities = [
+            thermal_zone.volume
+            * thermal_zone.density_air
+            * thermal_zone.heat_capac_air
+        ]
+        links = [
+            (
+                "air",
+                "t_outdoor",
+                thermal_zone.volume
+                * infiltration_rate
+                / 3600
+                * thermal_zone.density_air
+                * thermal_zone.heat_capac_air,
+            )
+        ]
+
+        for surface in SURFACES:
+            area = self.areas[surface]
+            if area <= 0:
+                continue
+            node = surface + "_surface"
+            self.node_names.append(node)
+            capacities.append(0.0)
+            links.append(
+                ("air", node, getattr(model_attr, "alpha_conv_inner_" + surface) * area)
+            )
+            if surface == "win":
+                links.append(
+                    (
+                        node,
+                        "t_eq_win",
+                        1
+                        / (
+                            model_attr.r1_win
+                            + 1 / (model_attr.alpha_comb_outer_win * model_attr.area_win)
+                        ),
+                    )
+                )
+                continue
+            self.node_names.append(surface)
+            capacities.append(getattr(model_attr, "c1_" + surface))
+            links.append((node, surface, 1 / getattr(model_attr, "r1_" + surface)))
+            if surface == "ow":
+                links.append(
+                    (
+                        surface,
+                        "t_eq_wall",
+                        1
+                        / (
+                            model_attr.r_rest_ow
+                            + 1 / (model_attr.alpha_comb_outer_ow * model_attr.area_ow)
+                        ),
+                    )
+                )
+            elif surface == "gf":
+                links.append((surface, "t_ground", 1 / model_attr.r_rest_gf))
+            elif surface == "rt":
+                links.append(
+                    (
+                        surface,
+                        "t_eq_roof",
+                        1
+                        / (
+                            model_attr.r_rest_rt
+                            + 1 / (model_attr.alpha_comb_outer_rt * model_attr.area_rt)
+                        ),
+                    )
+                )
+
+        surfaces = [surface for surface in SURFACES if self.areas[surface] > 0]
+        for i, surface_i in enumerate(surfaces):
+            for surface_j in surfaces[i + 1:]:
+                links.append(
+                    (
+                        surface_i + "_surface",
+                        surface_j + "_surface",
+                        model_attr.alpha_rad_inner_mean
+                        * min(self.areas[surface_i], self.areas[surface_j]),
+                    )
+                )
+
+        n_nodes = len(self.node_names)
+        conductance = np.zeros((n_nodes, n_nodes))
+        input_matrix = np.zeros((n_nodes, len(INPUTS)))
+        for node_a, node_b, value in links:
+            a = self.node_names.index(node_a)
+            conductance[a, a] += value
+            if node_b in INPUTS:
+                input_matrix[a, INPUTS.index(node_b)] += value
+            else:
+                b = self.node_names.index(node_b)
+                conductance[b, b] += value
+                conductance[a, b] -= value
+                conductance[b, a] -= value
+        input_matrix[0, INPUTS.index("q_air")] = 1.0
+        for surface in surfaces:
+            input_matrix[
+                self.node_names.index(surface + "_surface"), INPUTS.index("q_" + surface)
+            ] = 1.0
+
+        capacities = np.array(capacities)
+        states = capacities > 0
+        massless = ~states
+        self.state_names = [
+            name for name, state in zip(self.node_names, states) if state
+        ]
+        self.capacities = capacities[states]
+        self.output_states = np.zeros((n_nodes, len(self.state_names)))
+        self.output_states[states] = np.eye(len(self.state_names))
+        self.output_inputs = np.zeros((n_nodes, len(INPUTS)))
+        k_ss = conductance[np.ix_(states, states)]
+        e_s = input_matrix[states]
+        if massless.any():
+            k_sm = conductance[np.ix_(states, massless)]
+            solved = np.linalg.solve(
+                conductance[np.ix_(massless, massless)],
+                np.hstack(
+                    [-conductance[np.ix_(massless, states)], input_matrix[massless]]
+                ),
+            )
+            self.output_states[massless] = solved[:, : len(self.state_names)]
+            self.output_inputs[massless] = solved[:, len(self.state_names):]
+            k_ss = k_ss + k_sm.dot(self.output_states[massless])
+            e_s = e_s - k_sm.dot(self.output_inputs[massless])
+        self.conductance = (k_ss + k_ss.T) / 2
+        self.input_matrix = e_s
+
+    def discretize(self, time_step):
+        """Returns the discrete system of the network for a time step.
+
+        Networks with equal parameters are discretized once (see
+        discretization_cache).
+
+        Parameters
+        ----------
+        time_step : float [s]
+            Length of one time step
+
+        Returns
+        ----------
+        a_d : np.array
+            States at the end of a step per unit of the states at its start
+        b_d : np.array
+            States at the end of a step per unit of the inputs (see INPUTS)
+        """
+
+        return discretization_cache.discretize(
+            self.capacities, self.conductance, self.input_matrix, time_step
+        )
+
+    def simulate(
+        self,
+        inputs,
+        time_step=3600,
+        t_start=293.15,
+        heating_setpoint=None,
+        cooling_setpoint=None,
+        max_heating=None,
+        max_cooling=None,
+    ):
+        """Simulates the network for given inputs.
+
+        Parameters
+        ----------
+        inputs : np.array
+            Value of each input (columns in the order of INPUTS) for each
+            time step (rows)
+        time_step : float [s]
+            Length of one time step, default is 3600
+        t_start : float [K]
+            Temperature of all nodes at the start, default is 293.15
+        heating_setpoint : np.array [K]
+            Set temperature of the ideal heater for each time step, default
+            is None for no heating
+        cooling_setpoint : np.array [K]
+            Set temperature of the ideal cooler for each time step, default
+            is None for no cooling
+        max_heating : float [W]
+            Maximal heat flow of the ideal heater, default is None for no
+            limit
+        max_cooling : float [W]
+            Maximal heat flow of the ideal cooler (positive value), default
+            is None for no limit
+
+        Returns
+        ----------
+        result : SimulationResult
+            Air temperature and heat flows of the ideal heater and cooler
+        """
+
+        inputs = np.asarray(inputs, dtype=float)
+        periods = len(inputs)
+        a_d, b_d = self.discretize(time_step)
+        q_air = INPUTS.index("q_air")
+        out_states = self.output_states[0]
+        b_heat = b_d[:, q_air]
+        gain = out_states.dot(b_heat) + self.output_inputs[0, q_air]
+        free = inputs.dot(b_d.T)
+        out_inputs = inputs.dot(self.output_inputs[0])
+        heating = heating_setpoint is not None
+        cooling = cooling_setpoint is not None
+        if max_heating is None:
+            max_heating = np.inf
+        if max_cooling is None:
+            max_cooling = np.inf
+
+        t_air = np.empty(periods)
+        q_heat = np.zeros(periods)
+        q_cool = np.zeros(periods)
+        x = np.full(len(self.state_names), float(t_start))
+        for step in range(periods):
+            x = a_d.dot(x) + free[step]
+            t = out_states.dot(x) + out_inputs[step]
+            q = 0.0
+            if heating and t < heating_setpoint[step]:
+                q = min((heating_setpoint[step] - t) / gain, max_heating)
+                q_heat[step] = q
+            elif cooling and t > cooling_setpoint[step]:
+                q = max((cooling_setpoint[step] - t) / gain, -max_cooling)
+                q_cool[step] = q
+            if q:
+                x = x + b_heat * q
+                t = t + gain * q
+            t_air[step] = t
+        return SimulationResult(
+            time_step=time_step, t_air=t_air, q_heat=q_heat, q_cool=q_cool
+        )
+
+
+class SimulationResult(object):
+    """Results of a simulation.
+
+    Time series have one row per time step, results of several zones (see
+    teaser.logic.simulation.batch) have one column per zone.
+
+    Parameters
+    ----------
+    time_step : float [s]
+        Length of one time step
+    t_air : np.array [K]
+        Air temperature at the end of each time step
+    q_heat : np.array [W]
+        Heat flow of the ideal heater during each time step
+    q_cool : np.array [W]
+        Heat flow of the ideal cooler during each time step (negative)
+    heating_demand : float [kWh]
+        Heat supplied by the ideal heater, default is None, which sums up
+        q_heat
+    cooling_demand : float [kWh]
+        Heat removed by the ideal cooler (positive value), default is None,
+        which sums up q_cool
+    thermal_zones : list
+        Simulated zones, in the order of the columns, default is None for
+        the result of one zone
+
+    Attributes
+    ----------
+    heating_demand : float [kWh]
+        Heat supplied by the ideal heater (np.array with one value per zone
+        for several zones)
+    cooling_demand : float [kWh]
+        Heat removed by the ideal cooler (np.array with one value per zone
+        for several zones)
+    """
+
+    def __init__(
+        self,
+        time_step,
+        t_air=None,
+        q_heat=None,
+        q_cool=None,
+        heating_demand=None,
+        cooling_demand=None,
+        thermal_zones=None,
+    ):
+        self.time_step = time_step
+        self.t_air = t_air
+        self.q_heat = q_heat
+        self.q_cool = q_cool
+        self.thermal_zones = thermal_zones
+        if heating_demand is None:
+            heating_demand = np.sum(q_heat, axis=0) * time_step / 3.6e6
+        if cooling_demand is None:
+            cooling_demand = -np.sum(q_cool, axis=0) * time_step / 3.6e6
+        if thermal_zones is None:
+            heating_demand = float(heating_demand)
+            cooling_demand = float(cooling_demand)
+        self.heating_demand = heating_demand
+        self.cooling_demand = cooling_demand
+
+
+def simulate_zone(
+    thermal_zone,
+    t_outdoor,
+    t_sky=None,
+    solar_facade=None,
+    solar_roof=None,
+    internal_gains=None,
+    time_step=3600,
+    infiltration_rate=None,
+    t_start=None,
+    max_heating=None,
+    max_cooling=None,
+):
+    """Simulates a thermal zone with its parameters and use conditions.
+
+    The zone is heated and cooled ideally to the heating_profile and
+    cooling_profile of its use conditions, if with_heating and with_cooling
+    are set. All time series start at the first hour of the profiles.
+
+    Parameters
+    ----------
+    thermal_zone : ThermalZone
+        Zone with calculated parameters (model_attr)
+    t_outdoor : np.array [K]
+        Outdoor air temperature for each time step
+    t_sky : np.array [K]
+        Black body sky temperature for each time step, default is None,
+        which neglects long wave radiation to the sky
+    solar_facade : np.array [W/m2]
+        Total solar irradiation on each orientation of
+        model_attr.orientation_facade (columns) for each time step (rows),
+        default is None for no solar radiation
+    solar_roof : np.array [W/m2]
+        Total solar irradiation on each orientation of model_attr.orientation_rt
+        (FourElement only), default is None for no solar radiation
+    internal_gains : tuple of np.array [W]
+        Convective and radiative internal gains for each time step, default
+        is None, which calculates the gains with calc_internal_gains()
+    time_step : float [s]
+        Length of one time step, default is 3600
+    infiltration_rate : float [1/h]
+        Air exchange with the outdoor air, default is None, which uses
+        use_conditions.infiltration_rate
+    t_start : float [K]
+        Temperature of all nodes at the start, default is None, which uses
+        thermal_zone.t_inside
+    max_heating : float [W]
+        Maximal heat flow of the ideal heater, default is None for no limit
+    max_cooling : float [W]
+        Maximal heat flow of the ideal cooler, default is None for no limit
+
+    Returns
+    ----------
+    result : SimulationResult
+        Air temperature and heat flows of the ideal heater and cooler
+    """
+
+    network = ZoneNetwork(thermal_zone, infiltration_rate=infiltration_rate)
+    inputs = calc_inputs(
+        thermal_zone,
+        t_outdoor=t_outdoor,
+        t_sky=t_sky,
+        solar_facade=solar_facade,
+        solar_roof=solar_roof,
+        internal_gains=internal_gains,
+        time_step=time_step,
+        areas=network.areas,
+    )
+    periods = len(inputs)
+    use_conditions = thermal_zone.use_conditions
+    heating_setpoint = None
+    cooling_setpoint = None
+    if use_conditions.with_heating:
+        heating_setpoint = get_schedule(
+            use_conditions.heating_profile, periods, time_step
+        )
+    if use_conditions.with_cooling:
+        cooling_setpoint = get_schedule(
+            use_conditions.cooling_profile, periods, time_step
+        )
+    if t_start is None:
+        t_start = thermal_zone.t_inside
+    return network.simulate(
+        inputs,
+        time_step=time_step,
+        t_start=t_start,
+        heating_setpoint=heating_setpoint,
+        cooling_setpoint=cooling_setpoint,
+        max_heating=max_heating,
+        max_cooling=max_cooling,
+    )
+
+
+def calc_inputs(
+    thermal_zone,
+    t_outdoor,
+    t_sky=None,
+    solar_facade=None,
+    solar_roof=None,
+    internal_gains=None,
+    time_step=3600,
+    areas=None,
+):
+    """Calculates the inputs of the network of a zone.
+
+    See simulate_zone() for the parameters.
+
+    Returns
+    ----------
+    inputs : np.array
+        Value of each input (columns in the order of INPUTS) for each time
+        step (rows)
+    """
+
+    model_attr = thermal_zone.model_attr
+    t_outdoor = np.asarray(t_outdoor, dtype=float)
+    periods = len(t_outdoor)
+    if t_sky is None:
+        t_sky = t_outdoor
+    if areas is None:
+        areas = get_surface_areas(model_attr)
+    solar_facade = _get_solar(solar_facade, periods, model_attr.orientation_facade)
+    inputs = np.zeros((periods, len(INPUTS)))
+
+    t_eq_wall, t_eq_win = calc_equivalent_temperatures(
+        t_outdoor=t_outdoor,
+        t_sky=t_sky,
+        solar=solar_facade,
+        weightfactors_wall=model_attr.weightfactor_ow,
+        weightfactors_win=model_attr.weightfactor_win,
+        weightfactor_ground=model_attr.weightfactor_ground,
+        t_ground=thermal_zone.t_ground,
+        absorption=model_attr.solar_absorp_ow,
+        alpha_conv_outer=model_attr.alpha_conv_outer_ow,
+        alpha_rad_outer=model_attr.alpha_rad_outer_mean,
+        alpha_conv_outer_win=(
+            None if model_attr.merge_windows else model_attr.alpha_conv_outer_win
+        ),
+    )
+    inputs[:, INPUTS.index("t_eq_wall")] = t_eq_wall
+    inputs[:, INPUTS.index("t_eq_win")] = t_eq_win
+    inputs[:, INPUTS.index("t_ground")] = thermal_zone.t_ground
+    inputs[:, INPUTS.index("t_outdoor")] = t_outdoor
+    if areas["rt"] > 0:
+        inputs[:, INPUTS.index("t_eq_roof")] = calc_equivalent_temperatures(
+            t_outdoor=t_outdoor,
+            t_sky=t_sky,
+            solar=_get_solar(solar_roof, periods, model_attr.orientation_rt),
+            weightfactors_wall=model_attr.weightfactor_rt,
+            weightfactors_win=model_attr.weightfactor_win_rt,
+            weightfactor_ground=0.0,
+            t_ground=thermal_zone.t_ground,
+            absorption=model_attr.solar_absorp_rt,
+            alpha_conv_outer=model_attr.alpha_conv_outer_rt,
+            alpha_rad_outer=model_attr.alpha_rad_outer_rt,
+        )[0]
+    else:
+        inputs[:, INPUTS.index("t_eq_roof")] = t_outdoor
+
+    if internal_gains is None:
+        internal_gains = calc_internal_gains(thermal_zone, periods, time_step)
+    q_conv, q_rad = internal_gains
+    total_area = sum(areas.values())
+    q_surfaces = {
+        surface: np.asarray(q_rad, dtype=float) * areas[surface] / total_area
+        for surface in SURFACES
+    }
+
+    solar_win = (
+        solar_facade
+        * np.asarray(model_attr.transparent_areas, dtype=float)
+        * model_attr.weighted_g_value
+    )
+    ratio_conv = model_attr.ratio_conv_rad_inner_win
+    inputs[:, INPUTS.index("q_air")] = q_conv + ratio_conv * solar_win.sum(axis=1)
+    split = calc_solar_split(
+        areas, model_attr.facade_areas, model_attr.window_areas
+    )
+    solar_rad = (1 - ratio_conv) * solar_win.dot(split.T)
+    for i, surface in enumerate(SURFACES):
+        inputs[:, INPUTS.index("q_" + surface)] = q_surfaces[surface] + solar_rad[:, i]
+    return inputs
+
+
+def calc_input_map(thermal_zone, facade_columns, roof_columns, n_features, areas=None):
+    """Calculates the inputs of a zone as linear map of weather features.
+
+    All inputs are linear in the weather features (columns of WEATHER,
+    followed by the solar irradiation of several orientations) and in the
+    convective and radiative internal gains. The map is derived from
+    calc_inputs() with unit values of each feature, so inputs of many zones
+    can be calculated with one matrix product.
+
+    Parameters
+    ----------
+    thermal_zone : ThermalZone
+        Zone with calculated parameters (model_attr)
+    facade_columns : list
+        Column of the features with the solar irradiation of each
+        orientation of model_attr.orientation_facade
+    roof_columns : list
+        Column of the features with the solar irradiation of each
+        orientation of model_attr.orientation_rt (FourElement only)
+    n_features : int
+        Number of weather features
+    areas : dict [m2]
+        Area of each inner surface, default is None, which calculates the
+        areas with get_surface_areas()
+
+    Returns
+    ----------
+    weather_map : np.array
+        Value of each input (rows) per unit of each feature (columns)
+    gains_map : np.array
+        Value of each input (rows) per unit of convective and radiative
+        internal gains (columns)
+    """
+
+    basis = np.eye(n_features + 2)[:, :n_features]
+    basis[:, 0] = 0.0
+    gains = np.eye(n_features + 2)[:, n_features:]
+    inputs = calc_inputs(
+        thermal_zone,
+        t_outdoor=basis[:, WEATHER.index("t_outdoor")],
+        t_sky=basis[:, WEATHER.index("t_sky")],
+        solar_facade=basis[:, list(facade_columns)],
+        solar_roof=basis[:, list(roof_columns)],
+        internal_gains=(gains[:, 0], gains[:, 1]),
+        areas=areas,
+    )
+    offset = inputs[0]
+    weather_map = (inputs[:n_features] - offset).T
+    weather_map[:, 0] = offset
+    return weather_map, (inputs[n_features:] - offset).T
+
+
+def calc_equivalent_temperatures(
+    t_outdoor,
+    t_sky,
+    solar,
+    weightfactors_wall,
+    weightfactors_win,
+    weightfactor_ground,
+    t_ground,
+    absorption,
+    alpha_conv_outer,
+    alpha_rad_outer,
+    alpha_conv_outer_win=None,
+):
+    """Calculates equivalent air temperatures according to VDI 6007.
+
+    The equivalent air temperature of each orientation adds the absorbed
+    solar radiation and the long wave radiation to the sky to the outdoor
+    air temperature. For windows, only the long wave radiation is
+    considered.
+
+    Parameters
+    ----------
+    t_outdoor : np.array [K]
+        Outdoor air temperature for each time step
+    t_sky : np.array [K]
+        Black body sky temperature for each time step
+    solar : np.array [W/m2]
+        Total solar irradiation on each orientation (columns) for each time
+        step (rows)
+    weightfactors_wall : list
+        Weightfactor of the walls of each orientation
+    weightfactors_win : list
+        Weightfactor of the windows of each orientation
+    weightfactor_ground : float
+        Weightfactor of the ground
+    t_ground : float [K]
+        Temperature of the ground
+    absorption : float
+        Solar absorption coefficient of the walls
+    alpha_conv_outer : float [W/(m2*K)]
+        Outer convective coefficient of heat transfer of the walls
+    alpha_rad_outer : float [W/(m2*K)]
+        Outer radiative coefficient of heat transfer
+    alpha_conv_outer_win : float [W/(m2*K)]
+        Outer convective coefficient of heat transfer of the windows,
+        default is None for merged windows: windows are part of the
+        equivalent air temperature of the walls
+
+    Returns
+    ----------
+    t_eq_wall : np.array [K]
+        Equivalent air temperature of the walls for each time step
+    t_eq_win : np.array [K]
+        Equivalent air temperature of the windows for each time step, the
+        outdoor air temperature for merged windows
+    """
+
+    t_outdoor = np.asarray(t_outdoor, dtype=float)
+    wf_wall = np.asarray(weightfactors_wall, dtype=float)
+    wf_win = np.asarray(weightfactors_win, dtype=float)
+    alpha_wall = alpha_conv_outer + alpha_rad_outer
+    long_wave = (np.asarray(t_sky, dtype=float) - t_outdoor) * alpha_rad_outer
+    t_eq_wall = (
+        t_outdoor[:, None]
+        + (long_wave[:, None] + absorption * solar) / alpha_wall
+    )
+    if alpha_conv_outer_win is None:
+        t_eq_win = t_outdoor + long_wave / alpha_wall
+        return (
+            t_eq_wall.dot(wf_wall)
+            + t_eq_win * wf_win.sum()
+            + t_ground * weightfactor_ground,
+            t_outdoor,
+        )
+    t_eq_win = t_outdoor + long_wave / (alpha_conv_outer_win + alpha_rad_outer)
+    if wf_win.sum() <= 0:
+        t_eq_win = t_outdoor
+    return t_eq_wall.dot(wf_wall) + t_ground * weightfactor_ground, t_eq_win
+
+
+def calc_internal_gains(thermal_zone, periods=schedules.HOURS_PER_YEAR, time_step=3600):
+    """Calculates the internal gains of a zone from its use conditions.
+
+    Gains of persons, machines and lighting are split in convective and
+    radiative parts with ratio_conv_rad_persons, ratio_conv_rad_machines
+    and ratio_conv_rad_lighting, as in the internal gains of AixLib.
+
+    Parameters
+    ----------
+    thermal_zone : ThermalZone
+        Zone with use conditions
+    periods : int
+        Number of time steps, default is one year in hourly time steps
+    time_step : float [s]
+        Length of one time step, default is 3600
+
+    Returns
+    ----------
+    q_conv : np.array [W]
+        Convective internal gains for each time step
+    q_rad : np.array [W]
+        Radiative internal gains for each time step
+    """
+
+    q_conv = np.zeros(periods)
+    q_rad = np.zeros(periods)
+    for profile, conv, rad in get_gain_coefficients(thermal_zone):
+        schedule = get_schedule(profile, periods, time_step)
+        q_conv += conv * schedule
+        q_rad += rad * schedule
+    return q_conv, q_rad
+
+
+def get_gain_coefficients(thermal_zone):
+    """Returns the internal gains of a zone per unit of their profiles.
+
+    Parameters
+    ----------
+    thermal_zone : ThermalZone
+        Zone with use conditions
+
+    Returns
+    ----------
+    coefficients : list
+        (profile, convective gain [W], radiative gain [W]) of persons,
+        machines and lighting, profile is the interned base profile
+        (teaser.logic.schedules.Profile)
+    """
+
+    use_conditions = thermal_zone.use_conditions
+    coefficients = []
+    for profile, gain, ratio_conv in [
+        (
+            use_conditions.persons_profile,
+            use_conditions.fixed_heat_flow_rate_persons * use_conditions.persons,
+            use_conditions.ratio_conv_rad_persons,
+        ),
+        (
+            use_conditions.machines_profile,
+            use_conditions.machines,
+            use_conditions.ratio_conv_rad_machines,
+        ),
+        (
+            use_conditions.lighting_profile,
+            use_conditions.lighting_power,
+            use_conditions.ratio_conv_rad_lighting,
+        ),
+    ]:
+        gain = gain * thermal_zone.area
+        coefficients.append(
+            (
+                schedules.intern_profile(profile),
+                gain * ratio_conv,
+                gain * (1 - ratio_conv),
+            )
+        )
+    return coefficients
+
+
+def calc_solar_split(areas, facade_areas, window_areas):
+    """Calculates the distribution of solar radiation on inner surfaces.
+
+    Solar radiation through the windows of one orientation is distributed
+    to all inner surfaces by area, except the outer walls and windows of
+    that orientation (as splitFacVal of IBPSA).
+
+    Parameters
+    ----------
+    areas : dict [m2]
+        Area of each inner surface (see SURFACES)
+    facade_areas : list [m2]
+        Area of the outer walls of each orientation
+    window_areas : list [m2]
+        Area of the windows of each orientation
+
+    Returns
+    ----------
+    split : np.array
+        Share of each surface (rows in the order of SURFACES) for each
+        orientation (columns)
+    """
+
+    own = np.zeros((len(SURFACES), len(facade_areas)))
+    own[SURFACES.index("ow")] = facade_areas
+    own[SURFACES.index("win")] = window_areas
+    split = np.array([areas[surface] for surface in SURFACES])[:, None] - own
+    split = np.maximum(split, 0.0)
+    total = split.sum(axis=0)
+    return split / np.where(total > 0, total, 1.0)
+
+
+def get_surface_areas(model_attr):
+    """Returns the area of each inner surface of the network.
+
+    The areas follow the parameters of IBPSA.ThermalZones.ReducedOrder.RC:
+    outer walls include the windows if windows are merged.
+
+    Parameters
+    ----------
+    model_attr : OneElement
+        Calculated parameters of a zone (OneElement, TwoElement,
+        ThreeElement or FourElement)
+
+    Returns
+    ----------
+    areas : dict [m2]
+        Area of each surface (see SURFACES)
+    """
+
+    return {
+        "ow": float(sum(model_attr.facade_areas)),
+        "win": float(sum(model_attr.window_areas)),
+        "iw": getattr(model_attr, "area_iw", 0.0),
+        "gf": getattr(model_attr, "area_gf", 0.0),
+        "rt": getattr(model_attr, "area_rt", 0.0),
+    }
+
+
+def get_schedule(profile, periods, time_step=3600):
+    """Returns the value of an hourly profile for each time step.
+
+    Parameters
+    ----------
+    profile : list
+        Hourly base profile, repeated as in teaser.logic.schedules
+    periods : int
+        Number of time steps
+    time_step : float [s]
+        Length of one time step, default is 3600
+
+    Returns
+    ----------
+    schedule : np.array
+        Value of the profile at the start of each time step
+    """
+
+    values = np.asarray(schedules.intern_profile(profile).values, dtype=float)
+    hours = (np.arange(periods) * time_step // 3600).astype(np.int64)
+    return values[hours % len(values)]
+
+
+def discretize(capacities, conductance, input_matrix, time_step):
+    """Discretizes a thermal network exactly for a time step.
+
+    Solves C dx/dt = -K x + E u for inputs u that are constant during the
+    time step. As K is symmetric, the matrix exponential of -C^-1 K is
+    calculated with the eigen decomposition of C^-1/2 K C^-1/2. Networks of
+    several zones are discretized at once, if all arrays have the same
+    leading dimensions (e.g. one row per zone).
+
+    Parameters
+    ----------
+    capacities : np.array [J/K]
+        Heat capacity of each state (C)
+    conductance : np.array [W/K]
+        Symmetric conductance matrix of the states (K)
+    input_matrix : np.array
+        Heat flow into each state per unit of each input (E)
+    time_step : float [s]
+        Length of one time step
+
+    Returns
+    ----------
+    a_d : np.array
+        States at the end of a step per unit of the states at its start
+    b_d : np.array
+        States at the end of a step per unit of the inputs
+    """
+
+    scale = 1 / np.sqrt(capacities)
+    eigenvalues, vectors = np.linalg.eigh(
+        conductance * scale[..., :, None] * scale[..., None, :]
+    )
+    eigenvalues = np.maximum(eigenvalues, 0.0)
+    decay = np.exp(-eigenvalues * time_step)
+    integral = np.where(
+        eigenvalues * time_step > 1e-12,
+        -np.expm1(-eigenvalues * time_step) / np.where(eigenvalues > 0, eigenvalues, 1.0),
+        time_step,
+    )
+    left = scale[..., :, None] * vectors
+    vectors_t = np.swapaxes(vectors, -1, -2)
+    a_d = np.matmul(left * decay[..., None, :], vectors_t) / scale[..., None, :]
+    b_d = np.matmul(
+        np.matmul(left * integral[..., None, :], np.swapaxes(left, -1, -2)),
+        input_matrix,
+    )
+    return a_d, b_d
+
+
+class DiscretizationCache(object):
+    """Discrete systems of thermal networks, with least recently used eviction.
+
+    Zones of the same archetype have equal networks. The cache discretizes
+    each distinct network once per time step, networks are compared with
+    their parameters rounded to digits significant digits.
+
+    Parameters
+    ----------
+    maxsize : int
+        Maximal number of cached systems, default is CACHE_SIZE
+    digits : int
+        Significant digits of the parameters used to compare networks,
+        default is CACHE_DIGITS
+
+    Attributes
+    ----------
+    maxsize : int
+        Maximal number of cached systems
+    digits : int
+        Significant digits of the parameters used to compare networks
+    hits : int
+        Number of networks taken from the cache
+    misses : int
+        Number of discretized networks
+    """
+
+    def __init__(self, maxsize=CACHE_SIZE, digits=CACHE_DIGITS):
+
+        self.maxsize = maxsize
+        self.digits = digits
+        self.hits = 0
+        self.misses = 0
+        self._systems = collections.OrderedDict()
+
+    def __len__(self):
+        return len(self._systems)
+
+    def clear(self):
+        """Deletes all cached systems and resets hits and misses."""
+        self._systems.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def discretize(self, capacities, conductance, input_matrix, time_step):
+        """Discretizes thermal networks, see discretize().
+
+        Networks that are not cached are discretized at once and added to
+        the cache.
+
+        Parameters
+        ----------
+        capacities : np.array [J/K]
+            Heat capacity of each state (C)
+        conductance : np.array [W/K]
+            Symmetric conductance matrix of the states (K)
+        input_matrix : np.array
+            Heat flow into each state per unit of each input (E)
+        time_step : float [s]
+            Length of one time step
+
+        Returns
+        ----------
+        a_d : np.array
+            States at the end of a step per unit of the states at its start
+        b_d : np.array
+            States at the end of a step per unit of the inputs
+        """
+
+        capacities = np.asarray(capacities, dtype=float)
+        conductance = np.asarray(conductance, dtype=float)
+        input_matrix = np.asarray(input_matrix, dtype=float)
+        shape = capacities.shape[:-1]
+        n_states = capacities.shape[-1]
+        n_inputs = input_matrix.shape[-1]
+        capacities = capacities.reshape(-1, n_states)
+        conductance = conductance.reshape(-1, n_states, n_states)
+        input_matrix = input_matrix.reshape(-1, n_states, n_inputs)
+        parameters = _round_significant(
+            np.concatenate(
+                [
+                    capacities,
+                    conductance.reshape(len(capacities), -1),
+                    input_matrix.reshape(len(capacities), -1),
+                ],
+                axis=1,
+            ),
+            self.digits,
+        )
+
+        systems = []
+        rows = {}
+        index = np.empty(len(capacities), dtype=np.int64)
+        missing = []
+        for i, values in enumerate(parameters):
+            key = (float(time_step), n_states, n_inputs, values.tobytes())
+            row = rows.get(key)
+            if row is None:
+                row = rows[key] = len(systems)
+                system = self._systems.get(key)
+                if system is None:
+                    missing.append((i, key))
+                else:
+                    self._systems.move_to_end(key)
+                systems.append(system)
+            index[i] = row
+        self.hits += len(capacities) - len(missing)
+        self.misses += len(missing)
+
+        if missing:
+            rows_missing = [i for i, key in missing]
+            a_new, b_new = discretize(
+                capacities[rows_missing],
+                conductance[rows_missing],
+                input_matrix[rows_missing],
+                time_step,
+            )
+            for (i, key), a_d, b_d in zip(missing, a_new, b_new):
+                a_d.setflags(write=False)
+                b_d.setflags(write=False)
+                systems[rows[key]] = self._systems[key] = (a_d, b_d)
+            while len(self._systems) > self.maxsize:
+                self._systems.popitem(last=False)
+
+        a_d = np.array([system[0] for system in systems])[index]
+        b_d = np.array([system[1] for system in systems])[index]
+        return (
+            a_d.reshape(shape + (n_states, n_states)),
+            b_d.reshape(shape + (n_states, n_inputs)),
+        )
+
+
+discretization_cache = DiscretizationCache()
+
+
+def _round_significant(values, digits):
+    """Rounds values to significant digits, -0.0 is replaced by 0.0."""
+    magnitude = np.zeros_like(values)
+    nonzero = values != 0
+    magnitude[nonzero] = np.floor(np.log10(np.abs(values[nonzero])))
+    scale = 10.0 ** (digits - 1 - magnitude)
+    return np.round(values * scale) / scale + 0.0
+
+
+def _get_solar(solar, periods, orientations):
+    """Returns solar irradiation as array with one column per orientation."""
+    if solar is None:
+        return np.zeros((periods, len(orientations)))
+    solar = np.asarray(solar, dtype=float)
+    if solar.ndim == 1:
+        solar = solar[:, None]
+    return solar
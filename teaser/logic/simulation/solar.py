@@ -0,0 +1,347 @@
+# created October 2026
+# by TEASER4 Development Team
+
+"""Solar irradiation on tilted surfaces.
+
+Calculates the hourly direct, diffuse and ground reflected irradiation on
+surfaces with the orientation and tilt of TEASER building elements from the
+columns of a weather file (see teaser.data.input.weather_input), following
+the solar geometry of IBPSA (BoundaryConditions.SolarGeometry and
+BoundaryConditions.SolarIrradiation with the isotropic sky model).
+
+Orientations are given as in TEASER: 0 is north, 90 east, 180 south and
+270 west, -1 (roofs) and -2 (ground floors) are horizontal. Tilt is 0 for
+horizontal and 90 for vertical surfaces.
+
+All distinct (orientation, tilt) of a project are calculated in one
+vectorized pass. Results are cached per weather data and location, so
+further projects (or zones) with the same weather file only calculate
+orientations that are not cached yet.
+"""
+
+import weakref
+import numpy as np
+import teaser.data.input.weather_input as weather_input
+
+GROUND_REFLECTANCE = 0.2
+
+TIME_SHIFT = -1800.0
+
+_irradiation_cache = weakref.WeakKeyDictionary()
+
+
+class Irradiation(object):
+    """Solar irradiation on surfaces of several orientations.
+
+    Parameters
+    ----------
+    orientations : list
+        (orientation, tilt) of each surface
+    direct : np.array [W/m2]
+        Direct irradiation for each time step (rows) on each surface
+        (columns)
+    diffuse : np.array [W/m2]
+        Diffuse irradiation from the sky for each time step on each surface
+    ground_reflected : np.array [W/m2]
+        Irradiation reflected by the ground for each time step on each
+        surface
+
+    Attributes
+    ----------
+    orientations : list
+        (orientation, tilt) of each surface, in the order of the columns
+    direct : np.array [W/m2]
+        Direct irradiation for each time step (rows) on each surface
+        (columns)
+    diffuse : np.array [W/m2]
+        Diffuse irradiation from the sky for each time step on each surface
+    ground_reflected : np.array [W/m2]
+        Irradiation reflected by the ground for each time step on each
+        surface
+    """
+
+    def __init__(self, orientations, direct, diffuse, ground_reflected):
+
+        self.orientations = list(orientations)
+        self.direct = direct
+        self.diffuse = diffuse
+        self.ground_reflected = ground_reflected
+
+    @property
+    def total(self):
+        """Total irradiation for each time step on each surface [W/m2]"""
+        return self.direct + self.diffuse + self.ground_reflected
+
+    def get_solar(self):
+        """Returns the total irradiation of each orientation.
+
+        Returns
+        ----------
+        solar : dict [W/m2]
+            Total irradiation for each time step of each (orientation,
+            tilt), as used by teaser.logic.simulation.batch
+        """
+
+        total = self.total
+        return {key: total[:, i] for i, key in enumerate(self.orientations)}
+
+
+def get_orientations(thermal_zones):
+    """Returns the distinct orientations of the outer elements of zones.
+
+    Outer walls, doors, rooftops and windows are taken into account.
+
+    Parameters
+    ----------
+    thermal_zones : list
+        Thermal zones
+
+    Returns
+    ----------
+    orientations : list
+        Distinct (orientation, tilt), in the order of their first use
+    """
+
+    orientations = []
+    known = set()
+    for zone in thermal_zones:
+        for element in zone.outer_walls + zone.doors + zone.rooftops + zone.windows:
+            key = (element.orientation, element.tilt)
+            if key not in known:
+                known.add(key)
+                orientations.append(key)
+    return orientations
+
+
+def calc_sun_position(time, latitude, longitude, time_zone):
+    """Calculates the position of the sun.
+
+    Parameters
+    ----------
+    time : np.array [s]
+        Local standard time since the beginning of the year
+    latitude : float [deg]
+        Latitude of the location, positive to the north
+    longitude : float [deg]
+        Longitude of the location, positive to the east
+    time_zone : float [h]
+        Time zone of the local standard time, e.g. 1 for central Europe
+
+    Returns
+    ----------
+    declination : np.array [rad]
+        Declination of the sun
+    hour_angle : np.array [rad]
+        Hour angle of the sun, 0 at solar noon
+    cos_zenith : np.array
+        Cosine of the zenith angle of the sun
+    """
+
+    time = np.asarray(time, dtype=float)
+    declination = np.arcsin(
+        -np.sin(np.radians(23.45))
+        * np.cos((time / 86400 + 10) * 2 * np.pi / 365.25)
+    )
+    day_angle = 2 * np.pi * (time / 86400 + 1 - 81) / 364
+    equation_of_time = 60 * (
+        9.87 * np.sin(2 * day_angle)
+        - 7.53 * np.cos(day_angle)
+        - 1.5 * np.sin(day_angle)
+    )
+    solar_time = time + equation_of_time + (longitude / 15 - time_zone) * 3600
+    hour_angle = solar_time * 2 * np.pi / 86400 - np.pi
+    latitude = np.radians(latitude)
+    cos_zenith = np.sin(latitude) * np.sin(declination) + np.cos(
+        latitude
+    ) * np.cos(declination) * np.cos(hour_angle)
+    return declination, hour_angle, cos_zenith
+
+
+def calc_irradiation(
+    weather,
+    orientations,
+    location=None,
+    ground_reflectance=GROUND_REFLECTANCE,
+    time_shift=TIME_SHIFT,
+):
+    """Calculates the irradiation on surfaces of several orientations.
+
+    The irradiation of all orientations is calculated at once, without
+    cache (see get_irradiation()).
+
+    Parameters
+    ----------
+    weather : WeatherData
+        Weather data with global horizontal, direct normal and diffuse
+        horizontal irradiation
+    orientations : list
+        (orientation, tilt) of each surface in degree
+    location : tuple
+        (latitude, longitude, time_zone) in degree and hours, default is
+        None, which uses the LOCATION of the weather file
+    ground_reflectance : float
+        Reflectance of the ground, default is GROUND_REFLECTANCE
+    time_shift : float [s]
+        Time between the time of a row of the weather file and the sun
+        position of its irradiation, default is TIME_SHIFT, as the
+        irradiation is the mean of the hour before the time of the row
+
+    Returns
+    ----------
+    irradiation : Irradiation
+        Direct, diffuse and ground reflected irradiation on each surface
+    """
+
+    latitude, longitude, time_zone = _get_location(weather, location)
+    orientations = list(orientations)
+    declination, hour_angle, cos_zenith = calc_sun_position(
+        weather.get_column("time") + time_shift, latitude, longitude, time_zone
+    )
+    global_horizontal = np.maximum(weather.get_column("global_horizontal"), 0.0)
+    direct_normal = np.where(
+        cos_zenith > 0, np.maximum(weather.get_column("direct_normal"), 0.0), 0.0
+    )
+    diffuse_horizontal = np.maximum(weather.get_column("diffuse_horizontal"), 0.0)
+
+    orientation = np.array([key[0] for key in orientations], dtype=float)
+    tilt = np.radians(np.array([key[1] for key in orientations], dtype=float))
+    # azimuth as in IBPSA: 0 is south, 90 degree is west
+    azimuth = np.radians(np.where(orientation < 0, 0.0, orientation - 180.0))
+    latitude = np.radians(latitude)
+    declination = declination[:, None]
+    hour_angle = hour_angle[:, None]
+    cos_incidence = (
+        np.sin(declination) * np.sin(latitude) * np.cos(tilt)
+        - np.sin(declination) * np.cos(latitude) * np.sin(tilt) * np.cos(azimuth)
+        + np.cos(declination) * np.cos(latitude) * np.cos(tilt) * np.cos(hour_angle)
+        + np.cos(declination)
+        * np.sin(latitude)
+        * np.sin(tilt)
+        * np.cos(azimuth)
+        * np.cos(hour_angle)
+        + np.cos(declination) * np.sin(tilt) * np.sin(azimuth) * np.sin(hour_angle)
+    )
+    return Irradiation(
+        orientations,
+        direct=np.maximum(cos_incidence, 0.0) * direct_normal[:, None],
+        diffuse=0.5 * (1 + np.cos(tilt)) * diffuse_horizontal[:, None],
+        ground_reflected=0.5
+        * ground_reflectance
+        * (1 - np.cos(tilt))
+        * global_horizontal[:, None],
+    )
+
+
+def get_irradiation(
+    weather,
+    orientations,
+    location=None,
+    ground_reflectance=GROUND_REFLECTANCE,
+    time_shift=TIME_SHIFT,
+):
+    """Returns the irradiation on surfaces of several orientations, cached.
+
+    The irradiation is cached per weather data, location, ground
+    reflectance and time shift. Orientations that are not cached are
+    calculated in one pass with calc_irradiation(). See calc_irradiation()
+    for the parameters.
+
+    Parameters
+    ----------
+    weather : WeatherData or str
+        Weather data or the full path to a weather file, which is loaded
+        with weather_input.load_weather()
+
+    Returns
+    ----------
+    irradiation : Irradiation
+        Direct, diffuse and ground reflected irradiation on each surface
+    """
+
+    if not isinstance(weather, weather_input.WeatherData):
+        weather = weather_input.load_weather(weather)
+    key = (
+        _get_location(weather, location),
+        float(ground_reflectance),
+        float(time_shift),
+    )
+    cache = _irradiation_cache.setdefault(weather, {}).setdefault(key, {})
+    orientations = list(orientations)
+    missing = []
+    for orientation in orientations:
+        if orientation not in cache and orientation not in missing:
+            missing.append(orientation)
+    if missing:
+        irradiation = calc_irradiation(
+            weather,
+            missing,
+            location=key[0],
+            ground_reflectance=ground_reflectance,
+            time_shift=time_shift,
+        )
+        for i, orientation in enumerate(missing):
+            columns = (
+                irradiation.direct[:, i],
+                irradiation.diffuse[:, i],
+                irradiation.ground_reflected[:, i],
+            )
+            for column in columns:
+                column.setflags(write=False)
+            cache[orientation] = columns
+    components = np.empty((3, len(weather.table), len(orientations)))
+    for j, orientation in enumerate(orientations):
+        for i, column in enumerate(cache[orientation]):
+            components[i, :, j] = column
+    return Irradiation(orientations, *components)
+
+
+def calc_project_irradiation(project, weather=None, **kwargs):
+    """Returns the irradiation on all orientations of a project.
+
+    Parameters
+    ----------
+    project : Project
+        Project with buildings
+    weather : WeatherData or str
+        Weather data or the full path to a weather file, default is None,
+        which uses project.weather_file_path
+
+    Returns
+    ----------
+    irradiation : Irradiation
+        Direct, diffuse and ground reflected irradiation on each distinct
+        (orientation, tilt) of the outer elements of all buildings, see
+        get_irradiation() for further parameters
+    """
+
+    if weather is None:
+        weather = project.weather_file_path
+    return get_irradiation(
+        weather,
+        get_orientations(
+            [zone for bldg in project.buildings for zone in bldg.thermal_zones]
+        ),
+        **kwargs
+    )
+
+
+def clear_irradiation_cache():
+    """Deletes the irradiation of all weather data."""
+    _irradiation_cache.clear()
+
+
+def _get_location(weather, location):
+    """Returns (latitude, longitude, time_zone) of a location or weather."""
+    if location is None:
+        if weather.location is None:
+            raise ValueError(
+                "Weather file {} has no LOCATION, set the location".format(
+                    weather.path
+                )
+            )
+        location = (
+            weather.location.latitude,
+            weather.location.longitude,
+            weather.location.time_zone,
+        )
+    return tuple(float(value) for value in location)
@@ -3,11 +3,16 @@
 import warnings
 import os
 import re
+import contextlib
 import teaser.logic.utilities as utilities
+import teaser.logic.parallel as parallel
 import teaser.data.input.teaserjson_input as tjson_in
 import teaser.data.output.teaserjson_output as tjson_out
+import teaser.data.input.teaserbinary_input as tbin_in
+import teaser.data.output.teaserbinary_output as tbin_out
 import teaser.data.output.aixlib_output as aixlib_output
 import teaser.data.output.ibpsa_output as ibpsa_output
+import teaser.data.output.sinks as sinks
 from teaser.data.dataclass import DataClass
 from teaser.logic.archetypebuildings.bmvbs.office import Office
 from teaser.logic.archetypebuildings.bmvbs.custom.institute import Institute
@@ -129,7 +134,7 @@ class Project(object):
         """
         return DataClass()
 
-    def calc_all_buildings(self, raise_errors=False):
+    def calc_all_buildings(self, raise_errors=False, workers=None, executor=None):
         """Calculates values for all project buildings
 
         You need to set the following parameters in the Project class.
@@ -147,8 +152,26 @@ class Project(object):
         used_library_calc : str
             used library (AixLib and IBPSA are supported)
 
+        Parameters
+        ----------
+        raise_errors : bool
+            If True, errors during the calculation are raised. If False,
+            buildings that can't be calculated are removed from the
+            buildings list with a warning. Default is False
+        workers : int
+            Number of worker processes to distribute the buildings to. If
+            None (default) and no executor is given, all buildings are
+            calculated in the current process
+        executor : concurrent.futures.Executor
+            Optional executor (e.g. a ProcessPoolExecutor that is reused for
+            several calls) the buildings are distributed to. If given,
+            workers is ignored and the executor is not shut down
         """
-        if raise_errors is True:
+        if workers is not None or executor is not None:
+            self._calc_all_buildings_parallel(
+                raise_errors=raise_errors, workers=workers, executor=executor
+            )
+        elif raise_errors is True:
             for bldg in reversed(self.buildings):
                 bldg.calc_building_parameter(
                     number_of_elements=self._number_of_elements_calc,
@@ -172,6 +195,67 @@ class Project(object):
                     )
                     self.buildings.remove(bldg)
 
+    def _calc_all_buildings_parallel(self, raise_errors, workers, executor):
+        """Calculates all buildings in worker processes
+
+        The thermal zones of each building are calculated in a worker
+        process, the results are applied to the buildings of this project in
+        the same order as in calc_all_buildings().
+
+        Parameters
+        ----------
+        raise_errors : bool
+            see calc_all_buildings()
+        workers : int
+            see calc_all_buildings()
+        executor : concurrent.futures.Executor
+            see calc_all_buildings()
+        """
+        executor, shutdown = parallel.get_executor(
+            workers=workers, executor=executor
+        )
+        try:
+            futures = []
+            for bldg in reversed(self.buildings):
+                futures.append(
+                    (
+                        bldg,
+                        executor.submit(
+                            parallel.calc_building_zones,
+                            parallel.dump_building(bldg),
+                            number_of_elements=self._number_of_elements_calc,
+                            merge_windows=self._merge_windows_calc,
+                            t_bt=5,
+                        ),
+                    )
+                )
+
+            for bldg, future in futures:
+                try:
+                    results = future.result()
+                except (ZeroDivisionError, TypeError):
+                    if raise_errors is True:
+                        raise
+                    warnings.warn(
+                        "Following building can't be calculated and is "
+                        "removed from buildings list. Use raise_errors=True "
+                        "to get python errors and stop TEASER from deleting "
+                        "this building:" + bldg.name
+                    )
+                    self.buildings.remove(bldg)
+                    continue
+
+                bldg._number_of_elements_calc = self._number_of_elements_calc
+                bldg._merge_windows_calc = self._merge_windows_calc
+                bldg._used_library_calc = self._used_library_calc
+                parallel.apply_building_zones(bldg, results)
+                for zone in bldg.thermal_zones:
+                    bldg.sum_heat_load += zone.model_attr.heat_load
+                bldg.calc_library_attr()
+        finally:
+            if shutdown:
+                executor.shutdown()
+
     def retrofit_all_buildings(
         self,
         year_of_retrofit=None,
@@ -971,7 +1055,7 @@ class Project(object):
         )
         return type_bldg
 
-    def save_project(self, file_name=None, path=None):
+    def save_project(self, file_name=None, path=None, sink=None, compact=False):
         """Saves the project to a JSON file
 
         Calls the function save_teaser_json in data.output.teaserjson_output
@@ -984,6 +1068,12 @@ class Project(object):
         path : string
             if the Files should not be stored in OutputData, an alternative
             can be specified
+        sink : teaser.data.output.sinks.DirectorySink
+            optional target of the file, e.g. a MemorySink to save the
+            project into memory, default is None which writes the file
+        compact : bool
+            if True, the file is written without indentation, which is
+            smaller and faster to write and read, default is False
         """
         if file_name is None:
             name = self.name
@@ -995,9 +1085,9 @@ class Project(object):
         else:
             new_path = os.path.join(path, name)
 
-        tjson_out.save_teaser_json(new_path, self)
+        tjson_out.save_teaser_json(new_path, self, sink=sink, compact=compact)
 
-    def load_project(self, path):
+    def load_project(self, path, names=None, lazy=False):
         """Load the project from a json file (new format).
 
         Calls the function load_teaser_json.
@@ -1006,10 +1096,64 @@ class Project(object):
         ----------
         path : string
             full path to a json file
+        names : list
+            names of the buildings to load, default is None which loads all
+            buildings
+        lazy : bool
+            if True, buildings are created on first access of
+            self.buildings, which speeds up loading if only some buildings
+            are used, default is False
+
+        """
+
+        tjson_in.load_teaser_json(path, self, names=names, lazy=lazy)
+
+    def save_project_binary(self, file_name=None, path=None):
+        """Saves the project to a compact binary file
+
+        Calls the function save_teaser_binary in
+        data.output.teaserbinary_output. The file holds the same data as the
+        JSON file of save_project(), in columnar tables with shared
+        materials and constructions, and is much smaller and faster to load.
 
+        Parameters
+        ----------
+
+        file_name : string
+            name of the new file, the extension .teaserbin is added
+        path : string
+            if the Files should not be stored in OutputData, an alternative
+            can be specified
         """
+        if file_name is None:
+            name = self.name
+        else:
+            name = file_name
+
+        if path is None:
+            new_path = os.path.join(utilities.get_default_path(), name)
+        else:
+            new_path = os.path.join(path, name)
 
-        tjson_in.load_teaser_json(path, self)
+        tbin_out.save_teaser_binary(new_path, self)
+
+    def load_project_binary(self, path, names=None):
+        """Load the project from a binary file.
+
+        Calls the function load_teaser_binary in
+        data.input.teaserbinary_input.
+
+        Parameters
+        ----------
+        path : string
+            full path to a .teaserbin file
+        names : list
+            names of the buildings to load, default is None which loads all
+            buildings
+
+        """
+
+        tbin_in.load_teaser_binary(path, self, names=names)
 
     def export_aixlib(
         self,
@@ -1018,6 +1162,13 @@ class Project(object):
         corG=None,
         internal_id=None,
         path=None,
+        workers=None,
+        executor=None,
+        deduplicate=False,
+        incremental=False,
+        archive=None,
+        archive_format=None,
+        sink=None,
     ):
         """Exports values to a record file for Modelica simulation
 
@@ -1039,6 +1190,41 @@ class Project(object):
         path : string
             if the Files should not be stored in default output path of TEASER,
             an alternative path can be specified as a full path
+        workers : int
+            Number of worker processes to export the buildings in parallel.
+            If None (default) and no executor is given, all buildings are
+            exported sequentially in this process
+        executor : concurrent.futures.Executor
+            Optional executor (e.g. a ProcessPoolExecutor that is reused for
+            several exports). If given, workers is ignored and the executor
+            is not shut down
+        deduplicate : bool
+            If True, identical boundary condition tables and zone records of
+            all buildings are written once into the package SharedData of
+            the project and shared by the building models. Default is False
+        incremental : bool
+            If True, only buildings that changed since the last incremental
+            export into path are exported, based on a manifest of building
+            hashes in the exported package. Packages of buildings that are no
+            longer in the project are deleted. Default is False
+        archive : str or file object
+            Optional zip or tar archive (path or binary file object) to
+            stream the exported package into, instead of writing single
+            files. The package is stored as <project name>/... in the
+            archive, path is not used. Not possible with incremental
+        archive_format : str
+            Format of archive: 'zip', 'tar', 'gztar', 'bztar' or 'xztar'.
+            Default is None, which derives the format from the file name
+        sink : teaser.data.output.sinks.DirectorySink
+            Optional target of all exported files, e.g. a MemorySink to
+            export into memory. Files are written with the full path they
+            have in the exported package below path. The sink is flushed
+            but not closed. Not possible with archive
+
+        Returns
+        -------
+        path : str or file object
+            Path of the exported package, or archive if given
         """
 
         if building_model is not None or zone_model is not None or corG is not None:
@@ -1050,26 +1236,46 @@ class Project(object):
                 "version, consider rewriting your code."
             )
 
-        if path is None:
-            path = os.path.join(utilities.get_default_path(), self.name)
-        else:
-            path = os.path.join(path, self.name)
-
-        utilities.create_path(path)
-
-        if internal_id is None:
-            aixlib_output.export_multizone(
-                buildings=self.buildings, prj=self, path=path
-            )
-        else:
-            for bldg in self.buildings:
-                if bldg.internal_id == internal_id:
-                    aixlib_output.export_multizone(
-                        buildings=[bldg], prj=self, path=path
-                    )
+        with self._open_export_sink(
+            path=path, archive=archive, archive_format=archive_format, sink=sink
+        ) as (path, sink):
+            if internal_id is None:
+                aixlib_output.export_multizone(
+                    buildings=self.buildings,
+                    prj=self,
+                    path=path,
+                    workers=workers,
+                    executor=executor,
+                    deduplicate=deduplicate,
+                    incremental=incremental,
+                    sink=sink,
+                )
+            else:
+                for bldg in self.buildings:
+                    if bldg.internal_id == internal_id:
+                        aixlib_output.export_multizone(
+                            buildings=[bldg],
+                            prj=self,
+                            path=path,
+                            deduplicate=deduplicate,
+                            sink=sink,
+                        )
+        if archive is not None:
+            return archive
         return path
 
-    def export_ibpsa(self, library="AixLib", internal_id=None, path=None):
+    def export_ibpsa(
+        self,
+        library="AixLib",
+        internal_id=None,
+        path=None,
+        workers=None,
+        executor=None,
+        incremental=False,
+        archive=None,
+        archive_format=None,
+        sink=None,
+    ):
         """Exports values to a record file for Modelica simulation
 
         For Annex 60 Library
@@ -1089,6 +1295,37 @@ class Project(object):
         path : string
             if the Files should not be stored in default output path of TEASER,
             an alternative path can be specified as a full path
+        workers : int
+            Number of worker processes to export the buildings in parallel.
+            If None (default) and no executor is given, all buildings are
+            exported sequentially in this process
+        executor : concurrent.futures.Executor
+            Optional executor (e.g. a ProcessPoolExecutor that is reused for
+            several exports). If given, workers is ignored and the executor
+            is not shut down
+        incremental : bool
+            If True, only buildings that changed since the last incremental
+            export into path are exported, based on a manifest of building
+            hashes in the exported package. Packages of buildings that are no
+            longer in the project are deleted. Default is False
+        archive : str or file object
+            Optional zip or tar archive (path or binary file object) to
+            stream the exported package into, instead of writing single
+            files. The package is stored as <project name>/... in the
+            archive, path is not used. Not possible with incremental
+        archive_format : str
+            Format of archive: 'zip', 'tar', 'gztar', 'bztar' or 'xztar'.
+            Default is None, which derives the format from the file name
+        sink : teaser.data.output.sinks.DirectorySink
+            Optional target of all exported files, e.g. a MemorySink to
+            export into memory. Files are written with the full path they
+            have in the exported package below path. The sink is flushed
+            but not closed. Not possible with archive
+
+        Returns
+        -------
+        path : str or file object
+            Path of the exported package, or archive if given
         """
 
         ass_error_1 = (
@@ -1103,22 +1340,82 @@ class Project(object):
             "IDEAS",
         ], ass_error_1
 
+        with self._open_export_sink(
+            path=path, archive=archive, archive_format=archive_format, sink=sink
+        ) as (path, sink):
+            if internal_id is None:
+                ibpsa_output.export_ibpsa(
+                    buildings=self.buildings,
+                    prj=self,
+                    path=path,
+                    library=library,
+                    workers=workers,
+                    executor=executor,
+                    incremental=incremental,
+                    sink=sink,
+                )
+            else:
+                for bldg in self.buildings:
+                    if bldg.internal_id == internal_id:
+                        ibpsa_output.export_ibpsa(
+                            buildings=[bldg], prj=self, path=path, sink=sink
+                        )
+        if archive is not None:
+            return archive
+        return path
+
+    @contextlib.contextmanager
+    def _open_export_sink(self, path, archive, archive_format, sink):
+        """Yields the package path and the sink of a Modelica export
+
+        Sinks created here are closed at the end of the export, a given sink
+        is only flushed.
+
+        Parameters
+        ----------
+
+        path : string
+            directory of the exported package, default output path of TEASER
+            if None
+        archive : str or file object
+            optional archive to stream the package into
+        archive_format : str
+            format of archive, derived from its name if None
+        sink : teaser.data.output.sinks.DirectorySink
+            optional user defined target of all exported files
+
+        Yields
+        -------
+        path : str
+            path of the Modelica package of the project
+        sink : teaser.data.output.sinks.DirectorySink
+            target of all exported files
+        """
         if path is None:
             path = os.path.join(utilities.get_default_path(), self.name)
         else:
             path = os.path.join(path, self.name)
 
-        utilities.create_path(path)
-
-        if internal_id is None:
-            ibpsa_output.export_ibpsa(
-                buildings=self.buildings, prj=self, path=path, library=library
-            )
+        if sink is not None:
+            if archive is not None:
+                raise ValueError("Use either archive or sink")
+            sink.makedirs(path)
+            yield path, sink
+            sink.flush()
+            return
+
+        if archive is None:
+            utilities.create_path(path)
+            sink = sinks.DirectorySink(buffer_size=sinks.DEFAULT_BUFFER_SIZE)
         else:
-            for bldg in self.buildings:
-                if bldg.internal_id == internal_id:
-                    ibpsa_output.export_ibpsa(buildings=[bldg], prj=self, path=path)
-        return path
+            path = os.path.abspath(path)
+            sink = sinks.ArchiveSink(
+                archive=archive,
+                root=os.path.dirname(path),
+                archive_format=archive_format,
+            )
+        with sink:
+            yield path, sink
 
     def set_default(self, load_data=None):
         """Sets all attributes to default
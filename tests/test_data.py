@@ -8,6 +8,7 @@ from teaser.logic import utilities
 from teaser.project import Project
 import math
 import os
+import json
 import helptest
 import warnings as warnings
 
@@ -95,6 +96,380 @@ class Test_teaser(object):
         assert round(zone_attr.weightfactor_ow[1], 13) == 0.1324989973869
         assert round(zone_attr.weightfactor_win[0], 13) == 0.4047663456282
 
+    def test_simulation_vdi_room1(self):
+        """Simulation of room 1 with the loads of VDI 6007 test case 1"""
+        import numpy as np
+        import teaser.examples.verification.verification_VDI_6007_room1 as room1
+        import teaser.logic.simulation.reducedorder as reducedorder
+
+        result = room1.simulation_room1(days=10)
+        assert len(result.t_air) == 240
+        assert np.allclose(result.t_air[:6], 295.15)
+        assert all(np.diff(result.t_air[6:18]) > 0)
+        assert all(np.diff(result.t_air[18:24]) < 0)
+        assert result.heating_demand == 0.0
+
+        # reference: network of VDI 6007 with the parameters of Rouvel
+        zone = room1.parameter_room1().buildings[0].thermal_zones[0]
+        reference = room1.reference_test_case_1(room1.ROUVEL_ROOM1, zone, days=10)
+        assert np.abs(result.t_air - reference).max() < 0.1
+
+        zone_attr = zone.model_attr
+        network = reducedorder.ZoneNetwork(zone, infiltration_rate=0.0)
+        assert network.state_names == ["air", "ow", "iw"]
+
+        # steady state: the interior wall only couples air and outer wall
+        area_ow = sum(zone_attr.facade_areas)
+        r_total = (
+            1
+            / (
+                zone_attr.alpha_conv_inner_ow * area_ow
+                + 1
+                / (
+                    1 / (zone_attr.alpha_conv_inner_iw * zone_attr.area_iw)
+                    + 1 / (zone_attr.alpha_rad_inner_mean * area_ow)
+                )
+            )
+            + zone_attr.r1_ow
+            + zone_attr.r_rest_ow
+            + 1 / (zone_attr.alpha_comb_outer_ow * zone_attr.area_ow)
+        )
+        inputs = reducedorder.calc_inputs(
+            zone,
+            t_outdoor=np.full(2, 295.15),
+            internal_gains=(np.full(2, 1000.0), np.zeros(2)),
+        )
+        steady = network.simulate(inputs, time_step=1e10, t_start=295.15)
+        assert round(steady.t_air[-1] - 295.15, 6) == round(1000.0 * r_total, 6)
+        steady = network.simulate(
+            inputs, time_step=1e10, heating_setpoint=np.full(2, 373.15)
+        )
+        assert round(steady.q_heat[-1] + 1000.0, 6) == round(78.0 / r_total, 6)
+
+        # the discretization is exact for inputs that are constant per step
+        fine = network.simulate(
+            np.repeat(inputs, 60, axis=0), time_step=60, t_start=293.15
+        )
+        hourly = network.simulate(inputs, time_step=3600, t_start=293.15)
+        assert np.allclose(fine.t_air[59::60], hourly.t_air)
+
+    def test_simulation_vdi_room3(self):
+        """Simulation of room 3 with the loads of VDI 6007 test case 3"""
+        import numpy as np
+        import teaser.examples.verification.verification_VDI_6007_room3 as room3
+        import teaser.examples.verification.verification_VDI_6007_room1 as room1
+
+        result = room3.simulation_room3(days=10)
+        assert len(result.t_air) == 240
+        assert result.heating_demand == 0.0
+
+        # the inner wall parameters of TEASER deviate from Rouvel by up to 5 %
+        zone = room3.parameter_room3().buildings[0].thermal_zones[0]
+        reference = room1.reference_test_case_1(room3.ROUVEL_ROOM3, zone, days=10)
+        assert np.abs(result.t_air - reference).max() < 0.3
+
+        # the light room reacts faster than the heavy room 1
+        heavy = room1.simulation_room1(days=10)
+        assert result.t_air[6] - 295.15 > heavy.t_air[6] - 295.15 + 2
+
+    def test_simulation_ashrae_140(self):
+        """Simulation of ASHRAE 140 rooms 600 and 900 with all models"""
+        import numpy as np
+        import teaser.logic.simulation.reducedorder as reducedorder
+
+        hours = np.arange(24 * 20)
+        t_outdoor = 278.15 + 10 * np.sin(2 * np.pi * hours / 24)
+        solar = np.maximum(0, 500 * np.sin(2 * np.pi * (hours - 6) / 24))
+        swings = {}
+        for case in ["600", "900"]:
+            for number_of_elements in [1, 2, 3, 4]:
+                prj.set_default()
+                prj.load_project(
+                    utilities.get_full_path(
+                        "examples/examplefiles/ASHRAE140_{}.json".format(case)
+                    )
+                )
+                prj.buildings[0].calc_building_parameter(
+                    number_of_elements=number_of_elements,
+                    merge_windows=False,
+                    used_library="IBPSA",
+                )
+                zone = prj.buildings[0].thermal_zones[0]
+                zone_attr = zone.model_attr
+                zone.use_conditions.with_heating = False
+                result = reducedorder.simulate_zone(
+                    zone,
+                    t_outdoor=t_outdoor,
+                    solar_facade=np.outer(
+                        solar, np.ones(len(zone_attr.orientation_facade))
+                    ),
+                    solar_roof=solar if number_of_elements == 4 else None,
+                )
+                assert np.all(np.isfinite(result.t_air))
+                swings[case, number_of_elements] = np.ptp(result.t_air[-24:])
+
+                zone.use_conditions.with_heating = True
+                result = reducedorder.simulate_zone(zone, t_outdoor=t_outdoor)
+                setpoint = reducedorder.get_schedule(
+                    zone.use_conditions.heating_profile, len(hours)
+                )
+                assert np.all(result.t_air > setpoint - 1e-6)
+                assert result.heating_demand > 0
+                assert np.all(result.q_cool == 0)
+
+        # heavy construction damps the daily swing of the air temperature
+        for number_of_elements in [1, 2, 3, 4]:
+            assert swings["900", number_of_elements] < swings[
+                "600", number_of_elements
+            ]
+        prj.set_default()
+
+    def test_simulation_batch(self):
+        """Batched simulation of several zones equals single zone simulation"""
+        import numpy as np
+        import teaser.logic.simulation.batch as batch
+        import teaser.logic.simulation.reducedorder as reducedorder
+
+        prj.set_default()
+        prj.add_residential(
+            method="iwu",
+            usage="single_family_dwelling",
+            name="ResidentialBuilding",
+            year_of_construction=1988,
+            number_of_floors=2,
+            height_of_floors=3.2,
+            net_leased_area=200.0,
+        )
+        prj.add_non_residential(
+            method="bmvbs",
+            usage="office",
+            name="OfficeBuilding",
+            year_of_construction=1988,
+            number_of_floors=4,
+            height_of_floors=3.5,
+            net_leased_area=4500.0,
+        )
+        prj.calc_all_buildings()
+        zones = [zone for bldg in prj.buildings for zone in bldg.thermal_zones]
+        zones[1].use_conditions.with_cooling = True
+        # rotated zones add orientations, each zone maps only its own ones
+        for zone in prj.buildings[1].thermal_zones:
+            zone.model_attr.orientation_facade = [
+                orientation + 10.0 for orientation in zone.model_attr.orientation_facade
+            ]
+
+        hours = np.arange(24 * 14)
+        t_outdoor = 278.15 + 10 * np.sin(2 * np.pi * hours / 24)
+        irradiation = np.maximum(0, 500 * np.sin(2 * np.pi * (hours - 6) / 24))
+        network = batch.BatchNetwork(zones)
+        zone_features = max(
+            len(reducedorder.WEATHER)
+            + len(
+                set(zip(zone.model_attr.orientation_facade, zone.model_attr.tilt_facade))
+                | set(
+                    zip(
+                        getattr(zone.model_attr, "orientation_rt", []),
+                        getattr(zone.model_attr, "tilt_rt", []),
+                    )
+                )
+            )
+            for zone in zones
+        )
+        assert network.weather_map.shape[2] == zone_features
+        assert len(reducedorder.WEATHER) + len(network.orientations) > zone_features
+        solar = {
+            key: irradiation * (1 + index) / 4
+            for index, key in enumerate(network.orientations)
+        }
+        result = batch.simulate_project(prj, t_outdoor, solar=solar)
+        assert result.t_air.shape == (len(hours), len(zones))
+        assert result.heating_demand.shape == (len(zones),)
+
+        def assert_single_zones(result, max_heating, max_cooling):
+            for index, zone in enumerate(zones):
+                zone_attr = zone.model_attr
+                solar_roof = None
+                if getattr(zone_attr, "area_rt", 0) > 0:
+                    solar_roof = np.column_stack(
+                        [
+                            solar[key]
+                            for key in zip(zone_attr.orientation_rt, zone_attr.tilt_rt)
+                        ]
+                    )
+                single = reducedorder.simulate_zone(
+                    zone,
+                    t_outdoor=t_outdoor,
+                    solar_facade=np.column_stack(
+                        [
+                            solar[key]
+                            for key in zip(
+                                zone_attr.orientation_facade, zone_attr.tilt_facade
+                            )
+                        ]
+                    ),
+                    solar_roof=solar_roof,
+                    max_heating=max_heating[index],
+                    max_cooling=max_cooling[index],
+                )
+                assert np.allclose(result.t_air[:, index], single.t_air)
+                assert np.allclose(result.q_heat[:, index], single.q_heat)
+                assert np.allclose(result.q_cool[:, index], single.q_cool)
+                assert np.isclose(result.heating_demand[index], single.heating_demand)
+                assert np.isclose(result.cooling_demand[index], single.cooling_demand)
+
+        assert_single_zones(result, [None] * len(zones), [None] * len(zones))
+
+        # heating has priority over cooling with crossed set temperatures,
+        # heat flows are limited for all zones or per zone
+        use_conditions = zones[4].use_conditions
+        use_conditions.with_cooling = True
+        use_conditions.cooling_profile = [
+            value - 2 for value in use_conditions.heating_profile
+        ]
+        max_heating = [500.0 * (index + 1) for index in range(len(zones))]
+        max_cooling = [300.0] * len(zones)
+        limited = batch.simulate_project(
+            prj, t_outdoor, solar=solar, max_heating=max_heating, max_cooling=300.0
+        )
+        assert limited.q_heat[:, 4].max() > 0
+        assert limited.q_cool[:, 4].min() < 0
+        assert np.isclose(limited.q_heat.max(axis=0), max_heating).any()
+        assert limited.q_cool.min() >= -300.0 - 1e-9
+        assert_single_zones(limited, max_heating, max_cooling)
+        use_conditions.with_cooling = False
+        network = batch.BatchNetwork(zones)
+
+        demands = network.simulate(t_outdoor, solar=solar, time_series=False)
+        assert demands.t_air is None
+        assert np.allclose(demands.heating_demand, result.heating_demand)
+
+        try:
+            network.simulate(t_outdoor, solar={})
+        except KeyError:
+            pass
+        else:
+            raise AssertionError("KeyError not raised")
+        prj.set_default()
+
+    def test_discretization_cache(self):
+        """Equal networks are discretized once, with LRU eviction"""
+        import numpy as np
+        import teaser.examples.verification.verification_VDI_6007_room1 as room1
+        import teaser.logic.simulation.batch as batch
+        import teaser.logic.simulation.reducedorder as reducedorder
+
+        zone = room1.parameter_room1().buildings[0].thermal_zones[0]
+        network = batch.BatchNetwork([zone] * 5)
+        expected = reducedorder.discretize(
+            network.capacities, network.conductance, network.input_matrix, 3600
+        )
+
+        cache = reducedorder.DiscretizationCache(maxsize=1)
+        a_d, b_d = cache.discretize(
+            network.capacities, network.conductance, network.input_matrix, 3600
+        )
+        assert np.array_equal(a_d, expected[0])
+        assert np.array_equal(b_d, expected[1])
+        assert (cache.misses, cache.hits, len(cache)) == (1, 4, 1)
+
+        single = reducedorder.ZoneNetwork(zone)
+        a_d, b_d = cache.discretize(
+            single.capacities, single.conductance, single.input_matrix, 3600
+        )
+        assert a_d.shape == single.conductance.shape
+        assert np.array_equal(a_d, expected[0][0])
+        assert (cache.misses, cache.hits) == (1, 5)
+
+        # a new time step is a new system, the least recently used is evicted
+        cache.discretize(
+            single.capacities, single.conductance, single.input_matrix, 60
+        )
+        assert (cache.misses, len(cache)) == (2, 1)
+        cache.discretize(
+            single.capacities, single.conductance, single.input_matrix, 3600
+        )
+        assert cache.misses == 3
+
+        # parameters are compared with CACHE_DIGITS significant digits
+        cache.discretize(
+            single.capacities * (1 + 1e-13),
+            single.conductance,
+            single.input_matrix,
+            3600,
+        )
+        assert cache.misses == 3
+        cache.clear()
+        assert (cache.misses, cache.hits, len(cache)) == (0, 0, 0)
+
+    def test_solar_irradiation(self):
+        """Irradiation on tilted surfaces from the weather file"""
+        import numpy as np
+        import teaser.data.input.weather_input as weather_input
+        import teaser.logic.simulation.batch as batch
+        import teaser.logic.simulation.solar as solar
+
+        weather = weather_input.load_weather(
+            utilities.get_full_path(
+                "data/input/inputdata/weatherdata/"
+                "DEU_BW_Mannheim_107290_TRY2010_12_Jahr_BBSR.mos"
+            ),
+            sidecar=False,
+        )
+        hours = np.arange(8760) * 3600.0
+        declination, hour_angle, cos_zenith = solar.calc_sun_position(
+            hours, latitude=49.52, longitude=15.0, time_zone=1.0
+        )
+        assert round(np.degrees(declination.max()), 2) == 23.45
+        assert round(cos_zenith.max(), 2) == round(
+            np.cos(np.radians(49.52 - 23.45)), 2
+        )
+
+        orientations = [(-1, 0.0), (0.0, 90.0), (90.0, 90.0), (180.0, 90.0)]
+        irradiation = solar.calc_irradiation(weather, orientations)
+        total = irradiation.total.sum(axis=0)
+        assert abs(total[0] / weather.get_column("global_horizontal").sum() - 1) < 0.02
+        assert np.all(irradiation.ground_reflected[:, 0] == 0)
+        assert total[3] > total[2] > total[1]
+        for values in [
+            irradiation.direct,
+            irradiation.diffuse,
+            irradiation.ground_reflected,
+        ]:
+            assert np.all(values >= 0)
+        assert np.all(irradiation.direct[weather.get_column("direct_normal") == 0] == 0)
+
+        solar.clear_irradiation_cache()
+        cached = solar.get_irradiation(weather, orientations[2:])
+        cached = solar.get_irradiation(weather, orientations)
+        assert cached.orientations == orientations
+        assert np.allclose(cached.total, irradiation.total)
+        other = solar.get_irradiation(
+            weather, orientations, location=(30.0, 8.55, 1.0)
+        )
+        assert other.total[:, 3].sum() < irradiation.total[:, 3].sum()
+
+        prj.set_default()
+        prj.add_residential(
+            method="iwu",
+            usage="single_family_dwelling",
+            name="ResidentialBuilding",
+            year_of_construction=1988,
+            number_of_floors=2,
+            height_of_floors=3.2,
+            net_leased_area=200.0,
+        )
+        prj.calc_all_buildings()
+        project_irradiation = solar.calc_project_irradiation(prj)
+        assert set(project_irradiation.orientations) == set(
+            (element.orientation, element.tilt)
+            for zone in prj.buildings[0].thermal_zones
+            for element in zone.outer_walls + zone.rooftops + zone.windows
+        )
+        result = batch.simulate_project(prj, time_series=False)
+        assert result.heating_demand[0] > 0
+        solar.clear_irradiation_cache()
+        prj.set_default()
+
     # EBC Calculation Verification, with parameters from TEASER3
 
     def test_calc_ebc(self):
@@ -611,6 +986,228 @@ class Test_teaser(object):
         prj.name = "Project"
         prj.save_project(file_name="unitTest_new.json", path=None)
 
+    def test_save_project_compact(self):
+        """test of streamed save_project with and without compact mode"""
+        import json
+        import teaser.data.output.teaserjson_output as tjson_out
+        import teaser.data.output.sinks as sinks
+
+        prj.set_default(load_data=True)
+        prj.load_project(os.path.join(utilities.get_default_path(), "unitTest.json"))
+        sink = sinks.MemorySink(root=utilities.get_default_path())
+        prj.save_project(file_name="unitTestIndent", sink=sink)
+        prj.save_project(file_name="unitTestCompact", sink=sink, compact=True)
+        indent = sink.files["unitTestIndent.json"].decode("utf-8")
+        compact = sink.files["unitTestCompact.json"].decode("utf-8")
+
+        prj_out = tjson_out.get_project_data(prj)
+        for bldg in prj.buildings:
+            prj_out["project"]["buildings"][bldg.name] = tjson_out.get_building_data(
+                bldg
+            )
+        assert indent == json.dumps(prj_out, indent=4, separators=(",", ": "))
+        assert compact == json.dumps(prj_out, separators=(",", ":"))
+        assert len(compact) < len(indent)
+
+        prj.save_project(file_name="unitTestCompact", compact=True)
+        prj.set_default(load_data=True)
+        prj.load_project(
+            os.path.join(utilities.get_default_path(), "unitTestCompact.json")
+        )
+        assert prj.buildings[-1].name == "TestBuilding"
+        assert prj.buildings[-1].net_leased_area == 1988.0
+
+    def test_load_project_lazy(self):
+        """test of lazy, filtered and incremental loading of projects"""
+        import teaser.data.input.teaserjson_input as tjson_in
+
+        prj.set_default(load_data=True)
+        prj.load_project(os.path.join(utilities.get_default_path(), "unitTest.json"))
+        prj.buildings[-1].name = "LazyBuilding"
+        prj.load_project(os.path.join(utilities.get_default_path(), "unitTest.json"))
+        prj.save_project(file_name="unitTestLazy")
+        path = os.path.join(utilities.get_default_path(), "unitTestLazy.json")
+        prj.set_default(load_data=True)
+        prj.load_project(path)
+        names = [bldg.name for bldg in prj.buildings]
+        areas = [bldg.net_leased_area for bldg in prj.buildings]
+
+        prj.set_default(load_data=True)
+        prj.load_project(path, lazy=True)
+        assert isinstance(prj.buildings, tjson_in.LazyBuildings)
+        assert len(prj.buildings) == len(names)
+        assert not prj.buildings.is_loaded(len(names) - 1)
+        assert prj.buildings[-1].name == names[-1]
+        assert prj.buildings.is_loaded(len(names) - 1)
+        assert not prj.buildings.is_loaded(0)
+        assert [bldg.net_leased_area for bldg in prj.buildings] == areas
+        assert all(bldg.parent is prj for bldg in prj.buildings)
+
+        prj.set_default(load_data=True)
+        prj.load_project(path, names=[names[-1]])
+        assert [bldg.name for bldg in prj.buildings] == [names[-1]]
+
+        # lazy and unselected buildings are only scanned, not parsed
+        parsed = []
+        value = tjson_in._Scanner.value
+
+        def counted_value(scanner):
+            result = value(scanner)
+            parsed.append(result)
+            return result
+
+        tjson_in._Scanner.value = counted_value
+        try:
+            prj.set_default(load_data=True)
+            prj.load_project(path, lazy=True)
+            assert not any(isinstance(v, dict) and "thermal_zones" in v for v in parsed)
+            prj.set_default(load_data=True)
+            prj.load_project(path, names=[names[-1]])
+            assert sum(isinstance(v, dict) and "thermal_zones" in v for v in parsed) == 1
+        finally:
+            tjson_in._Scanner.value = value
+
+        text = '{"a": "x\\\\\\"}]", "b": [1, {"c": [true, null]}, "]"], "d": -1.5e3 }'
+        scanner = tjson_in._Scanner(text)
+        for key in scanner.members():
+            start = scanner.index
+            scanner.skip()
+            assert json.loads(text[start:scanner.index]) == json.loads(text)[key]
+
+        prj.set_default(load_data=True)
+        loaded = [bldg.name for bldg in tjson_in.iter_buildings(path, prj)]
+        assert loaded == names
+        assert prj.buildings == []
+        assert prj.name == "Project"
+        prj.set_default()
+
+    def test_save_load_project_binary(self):
+        """test of the binary project format and its conversion to json"""
+        import teaser.data.output.teaserjson_output as tjson_out
+        import teaser.data.output.teaserbinary_output as tbin_out
+        import teaser.data.input.teaserbinary_input as tbin_in
+
+        path = utilities.get_default_path()
+        prj.set_default(load_data=True)
+        prj.load_project(os.path.join(path, "unitTestLazy.json"))
+        expected = "".join(tjson_out.iter_teaser_json(prj))
+        names = [bldg.name for bldg in prj.buildings]
+        prj.save_project_binary(file_name="unitTestBinary")
+
+        prj.set_default(load_data=True)
+        prj.load_project_binary(os.path.join(path, "unitTestBinary.teaserbin"))
+        assert "".join(tjson_out.iter_teaser_json(prj)) == expected
+        prj.set_default(load_data=True)
+        prj.load_project_binary(
+            os.path.join(path, "unitTestBinary.teaserbin"), names=[names[-1]]
+        )
+        assert [bldg.name for bldg in prj.buildings] == [names[-1]]
+
+        with tbin_in.BinaryProjectFile(
+            os.path.join(path, "unitTestBinary.teaserbin")
+        ) as binary_file:
+            assert binary_file.building_names == names
+            assert len(binary_file.get_column("materials", "name")) < len(
+                binary_file.get_column("layers", "thickness")
+            )
+
+        tbin_out.convert_json_to_binary(
+            os.path.join(path, "unitTestLazy.json"),
+            os.path.join(path, "unitTestConvert"),
+        )
+        tbin_in.convert_binary_to_json(
+            os.path.join(path, "unitTestConvert.teaserbin"),
+            os.path.join(path, "unitTestConvert.json"),
+        )
+        with open(os.path.join(path, "unitTestLazy.json")) as json_file:
+            original = json_file.read()
+        with open(os.path.join(path, "unitTestConvert.json")) as json_file:
+            assert json_file.read() == original
+        assert os.path.getsize(
+            os.path.join(path, "unitTestConvert.teaserbin")
+        ) < len(original)
+
+        # attributes named like the bookkeeping of the tables (e.g. "name"
+        # of building elements) are kept
+        json_path = utilities.get_full_path("examples/examplefiles/unitTest.json")
+        tbin_out.convert_json_to_binary(
+            json_path, os.path.join(path, "unitTestConvert")
+        )
+        tbin_in.convert_binary_to_json(
+            os.path.join(path, "unitTestConvert.teaserbin"),
+            os.path.join(path, "unitTestConvert.json"),
+        )
+        with open(json_path) as json_file:
+            original = json.load(json_file)
+        with open(os.path.join(path, "unitTestConvert.json")) as json_file:
+            assert json.load(json_file) == original
+        prj.set_default()
+
+    def test_load_weather(self):
+        """test of the weather file reader and its memory mapped sidecar"""
+        import shutil
+        import numpy as np
+        import teaser.data.input.weather_input as weather_input
+
+        path = os.path.join(utilities.get_default_path(), "unitTestWeather.mos")
+        shutil.copyfile(
+            utilities.get_full_path(
+                "data/input/inputdata/weatherdata/"
+                "DEU_BW_Mannheim_107290_TRY2010_12_Jahr_BBSR.mos"
+            ),
+            path,
+        )
+        sidecar_path = weather_input.get_sidecar_path(path)
+        if os.path.exists(sidecar_path):
+            os.remove(sidecar_path)
+        weather_input.clear_weather_registry()
+
+        weather = weather_input.load_weather(path)
+        assert os.path.isfile(sidecar_path)
+        assert weather.table_name == "tab1"
+        assert weather.table.shape == (8760, 30)
+        assert weather.location.city == "Mannheim"
+        assert weather.location.latitude == 49.52
+        assert weather.location.longitude == 8.55
+        assert weather.location.time_zone == 1.0
+        assert weather.records["DATA PERIODS"][0] == "1"
+        assert weather.column_docs[1].startswith("Dry bulb temperature")
+        assert weather.get_column("time")[1] == 3600.0
+        assert weather.get_t_outdoor()[0] == 6.5 + 273.15
+        assert weather.get_t_sky().mean() < weather.get_t_outdoor().mean()
+        assert weather_input.load_weather(path) is weather
+
+        weather_input.clear_weather_registry()
+        mapped = weather_input.load_weather(path)
+        assert mapped is not weather
+        assert isinstance(mapped.table, np.memmap)
+        assert np.array_equal(mapped.table, weather.table)
+        parsed = weather_input.WeatherData(path, sidecar=False)
+        assert not isinstance(parsed.table, np.memmap)
+        assert np.array_equal(parsed.table, mapped.table)
+        assert not parsed.table.flags.writeable
+
+        # a changed weather file with an older modification time (e.g. after
+        # cp -p) does not use the sidecar of its old content
+        mtime = os.stat(sidecar_path).st_mtime_ns
+        with open(path, "r", encoding="latin-1") as f:
+            lines = f.readlines()
+        for number, line in enumerate(lines):
+            if not line.startswith(("#", "double")):
+                values = line.split("\t")
+                values[1] = str(float(values[1]) + 10)
+                lines[number] = "\t".join(values)
+        mapped = None
+        with open(path, "w", encoding="latin-1") as f:
+            f.writelines(lines)
+        os.utime(path, ns=(mtime - 10 ** 10, mtime - 10 ** 10))
+        weather_input.clear_weather_registry()
+        changed = weather_input.load_weather(path)
+        assert weather_input.get_sidecar_path(path) != sidecar_path
+        assert np.allclose(changed.get_t_outdoor(), weather.get_t_outdoor() + 10)
+        assert not os.path.exists(sidecar_path)
+        weather_input.clear_weather_registry()
+
     def test_calc_all_buildings(self):
         """test of calc_all_buildings, no calculation verification"""
 
@@ -625,6 +1222,339 @@ class Test_teaser(object):
         prj.used_library_calc = "AixLib"
         prj.calc_all_buildings(raise_errors=True)
 
+    def test_calc_all_buildings_parallel(self):
+        """test of calc_all_buildings with worker processes"""
+
+        projects = []
+        for count in range(2):
+            prj_parallel = Project(load_data=True)
+            for year in [1950, 1980, 2010]:
+                prj_parallel.add_residential(
+                    method="iwu",
+                    usage="single_family_dwelling",
+                    name="Residential" + str(year),
+                    year_of_construction=year,
+                    number_of_floors=2,
+                    height_of_floors=3.2,
+                    net_leased_area=219,
+                )
+            prj_parallel.buildings[0].thermal_zones[0].outer_walls[0]._area = 0.0
+            projects.append(prj_parallel)
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            projects[0].calc_all_buildings()
+            projects[1].calc_all_buildings(workers=2)
+
+        assert len(projects[1].buildings) == 2
+        for bldg_serial, bldg_parallel in zip(
+            projects[0].buildings, projects[1].buildings
+        ):
+            assert bldg_serial.name == bldg_parallel.name
+            assert bldg_serial.sum_heat_load == bldg_parallel.sum_heat_load
+            assert (
+                bldg_serial.library_attr.total_surface_area
+                == bldg_parallel.library_attr.total_surface_area
+            )
+            for zone_serial, zone_parallel in zip(
+                bldg_serial.thermal_zones, bldg_parallel.thermal_zones
+            ):
+                assert zone_parallel.model_attr.thermal_zone is zone_parallel
+                assert zone_serial.model_attr.r1_ow == zone_parallel.model_attr.r1_ow
+                assert zone_serial.model_attr.c1_iw == zone_parallel.model_attr.c1_iw
+                assert (
+                    zone_serial.outer_walls[0].r1 == zone_parallel.outer_walls[0].r1
+                )
+
+        projects[1].buildings[0].thermal_zones[0].outer_walls[0]._area = 0.0
+        try:
+            projects[1].calc_all_buildings(raise_errors=True, workers=2)
+        except ZeroDivisionError:
+            pass
+        else:
+            raise AssertionError("ZeroDivisionError not raised")
+
+    def test_export_parallel(self):
+        """test of parallel export, compares files with the serial export"""
+        import filecmp
+
+        for library in ["AixLib", "IBPSA"]:
+            prj_export = Project(load_data=True)
+            prj_export.name = "ParallelExport"
+            prj_export.used_library_calc = library
+            for year in [1950, 2010]:
+                prj_export.add_residential(
+                    method="iwu",
+                    usage="single_family_dwelling",
+                    name="Residential" + str(year),
+                    year_of_construction=year,
+                    number_of_floors=2,
+                    height_of_floors=3.2,
+                    net_leased_area=219,
+                )
+            prj_export.calc_all_buildings()
+
+            paths = []
+            for workers in [None, 2]:
+                path = os.path.join(
+                    utilities.get_default_path(),
+                    "unitTestExport" + library + str(workers),
+                )
+                if library == "AixLib":
+                    paths.append(prj_export.export_aixlib(path=path, workers=workers))
+                else:
+                    paths.append(prj_export.export_ibpsa(path=path, workers=workers))
+
+            for root, dirs, files in os.walk(paths[0]):
+                other = os.path.join(paths[1], os.path.relpath(root, paths[0]))
+                assert sorted(os.listdir(other)) == sorted(dirs + files)
+                match, mismatch, errors = filecmp.cmpfiles(
+                    root, other, files, shallow=False
+                )
+                assert mismatch == [] and errors == []
+
+    def test_export_deduplicate(self):
+        """test of AixLib export with shared tables and zone records"""
+        prj_export = Project(load_data=True)
+        prj_export.name = "DeduplicateExport"
+        prj_export.used_library_calc = "AixLib"
+        for count in range(3):
+            prj_export.add_residential(
+                method="iwu",
+                usage="single_family_dwelling",
+                name="Residential" + str(count),
+                year_of_construction=1950,
+                number_of_floors=2,
+                height_of_floors=3.2,
+                net_leased_area=219,
+            )
+        prj_export.calc_all_buildings()
+        path = prj_export.export_aixlib(
+            path=os.path.join(utilities.get_default_path(), "unitTestDeduplicate"),
+            deduplicate=True,
+        )
+
+        shared_path = os.path.join(path, "SharedData")
+        with open(os.path.join(path, "package.order")) as order:
+            assert order.read().split() == [
+                "SharedData",
+                "Residential0",
+                "Residential1",
+                "Residential2",
+            ]
+        with open(os.path.join(shared_path, "package.order")) as order:
+            records = order.read().split()
+        assert len(records) == 1
+        assert sorted(
+            file_name.split("_")[0] for file_name in os.listdir(shared_path)
+        ) == ["AHU", "InternalGains", "Tset", "Zone", "package.mo", "package.order"]
+        assert os.path.isfile(os.path.join(shared_path, records[0] + ".mo"))
+        for bldg in prj_export.buildings:
+            assert sorted(os.listdir(os.path.join(path, bldg.name))) == [
+                bldg.name + ".mo",
+                "package.mo",
+                "package.order",
+            ]
+            with open(os.path.join(path, bldg.name, bldg.name + ".mo")) as model:
+                model = model.read()
+            assert "SharedData." + records[0] + "()" in model
+            assert "modelica://DeduplicateExport/SharedData/AHU_" in model
+
+    def test_export_archive(self):
+        """test of export into archives, compares with the directory export"""
+        import io
+        import shutil
+        import tarfile
+        import zipfile
+        import teaser.data.output.sinks as sinks
+
+        prj_export = Project(load_data=True)
+        prj_export.name = "ArchiveExport"
+        prj_export.used_library_calc = "AixLib"
+        for year in [1950, 2010]:
+            prj_export.add_residential(
+                method="iwu",
+                usage="single_family_dwelling",
+                name="Residential" + str(year),
+                year_of_construction=year,
+                number_of_floors=2,
+                height_of_floors=3.2,
+                net_leased_area=219,
+            )
+        prj_export.calc_all_buildings()
+
+        for deduplicate in [False, True]:
+            path = os.path.join(utilities.get_default_path(), "unitTestArchive")
+            shutil.rmtree(path, ignore_errors=True)
+            path = prj_export.export_aixlib(path=path, deduplicate=deduplicate)
+            expected = {}
+            for root, dirs, files in os.walk(path):
+                for file_name in files:
+                    with open(os.path.join(root, file_name), "rb") as in_file:
+                        expected[
+                            os.path.relpath(
+                                os.path.join(root, file_name), os.path.dirname(path)
+                            ).replace(os.sep, "/")
+                        ] = in_file.read()
+
+            archive = io.BytesIO()
+            assert (
+                prj_export.export_aixlib(
+                    archive=archive, archive_format="zip", deduplicate=deduplicate
+                )
+                is archive
+            )
+            with zipfile.ZipFile(io.BytesIO(archive.getvalue())) as zip_file:
+                assert {
+                    name: zip_file.read(name) for name in zip_file.namelist()
+                } == expected
+
+            archive = os.path.join(utilities.get_default_path(), "unitTest.tar.gz")
+            prj_export.export_aixlib(
+                archive=archive, deduplicate=deduplicate, workers=2
+            )
+            with tarfile.open(archive) as tar_file:
+                assert {
+                    member.name: tar_file.extractfile(member).read()
+                    for member in tar_file.getmembers()
+                } == expected
+
+            memory_sink = sinks.MemorySink(root=os.path.dirname(path))
+            prj_export.export_aixlib(
+                path=os.path.dirname(path),
+                sink=memory_sink,
+                deduplicate=deduplicate,
+                workers=2 if deduplicate else None,
+            )
+            assert memory_sink.files == expected
+
+        try:
+            prj_export.export_aixlib(archive=io.BytesIO(), incremental=True)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("ValueError not raised")
+
+    def test_directory_sink_buffer(self):
+        """test of buffered writes of DirectorySink and save into memory"""
+        import shutil
+        import teaser.data.output.sinks as sinks
+
+        path = os.path.join(utilities.get_default_path(), "unitTestSink")
+        shutil.rmtree(path, ignore_errors=True)
+        sink = sinks.DirectorySink(buffer_size=10)
+        sink.makedirs(path)
+        sink.write(os.path.join(path, "a.txt"), "12345")
+        sink.write(os.path.join(path, "a.txt"), "1234")
+        sink.write_unique(os.path.join(path, "b.txt"), b"12")
+        sink.write_unique(os.path.join(path, "b.txt"), b"34")
+        assert os.listdir(path) == []
+        assert sink.listdir(path) == ["a.txt", "b.txt"]
+        assert sink.exists(os.path.join(path, "b.txt"))
+        sink.remove(os.path.join(path, "b.txt"))
+        sink.write(os.path.join(path, "c.txt"), "123456")
+        assert sorted(os.listdir(path)) == ["a.txt", "c.txt"]
+        sink.write(os.path.join(path, "d.txt"), "1")
+        sink.close()
+        with open(os.path.join(path, "a.txt")) as in_file:
+            assert in_file.read() == "1234"
+        assert sorted(os.listdir(path)) == ["a.txt", "c.txt", "d.txt"]
+
+        # unique files get the same permissions as other files
+        sink.write_unique(os.path.join(path, "e.txt"), b"12")
+        sink.close()
+        assert sorted(os.listdir(path)) == ["a.txt", "c.txt", "d.txt", "e.txt"]
+        assert os.stat(os.path.join(path, "e.txt")).st_mode == os.stat(
+            os.path.join(path, "a.txt")
+        ).st_mode
+
+        memory_sink = sinks.MemorySink(root=utilities.get_default_path())
+        prj.save_project(file_name="unitTestMemory", sink=memory_sink)
+        assert list(memory_sink.files) == ["unitTestMemory.json"]
+        assert memory_sink.read(
+            os.path.join(utilities.get_default_path(), "unitTestMemory.json")
+        ).startswith(b"{")
+
+    def test_export_incremental(self):
+        """test of incremental export, only changed buildings are exported"""
+        import json
+        import time
+
+        for library in ["AixLib", "IBPSA"]:
+            prj_export = Project(load_data=True)
+            prj_export.name = "IncrementalExport"
+            prj_export.used_library_calc = library
+            for count in range(3):
+                prj_export.add_residential(
+                    method="iwu",
+                    usage="single_family_dwelling",
+                    name="Residential" + str(count),
+                    year_of_construction=1950,
+                    number_of_floors=2,
+                    height_of_floors=3.2,
+                    net_leased_area=219,
+                )
+            prj_export.calc_all_buildings()
+
+            def export():
+                path = os.path.join(utilities.get_default_path(), "unitTestIncr")
+                if library == "AixLib":
+                    return prj_export.export_aixlib(path=path, incremental=True)
+                return prj_export.export_ibpsa(path=path, incremental=True)
+
+            def modified():
+                return {
+                    bldg.name: os.path.getmtime(
+                        os.path.join(path, bldg.name, "package.mo")
+                    )
+                    for bldg in prj_export.buildings
+                }
+
+            path = export()
+            with open(os.path.join(path, "teaser_manifest.json")) as manifest:
+                assert sorted(json.load(manifest)) == [
+                    "Residential0",
+                    "Residential1",
+                    "Residential2",
+                ]
+            before = modified()
+            time.sleep(0.05)
+            export()
+            assert modified() == before
+
+            zone = prj_export.buildings[1].thermal_zones[0]
+            zone.use_conditions.heating_profile = [290.15] * 24
+            export()
+            after = modified()
+            assert after["Residential0"] == before["Residential0"]
+            assert after["Residential1"] != before["Residential1"]
+            assert after["Residential2"] == before["Residential2"]
+
+            prj_export.buildings.pop(2)
+            export()
+            assert not os.path.exists(os.path.join(path, "Residential2"))
+            with open(os.path.join(path, "package.order")) as order:
+                assert order.read().split() == ["Residential0", "Residential1"]
+
+        # the manifest and stale packages are handled through the sink,
+        # including buffered files that are not written yet
+        import teaser.data.output.sinks as sinks
+        import teaser.data.output.export_manifest as export_manifest
+
+        sink = sinks.DirectorySink(buffer_size=1 << 30)
+        export_manifest.save_manifest(path, {"Stale": {"hash": ""}}, sink=sink)
+        sink.write(os.path.join(path, "Stale", "package.mo"), "within;")
+        assert sink.exists(os.path.join(path, "teaser_manifest.json"))
+        stale = export_manifest.remove_stale_buildings(
+            path, {"Stale": {}}, prj_export.buildings, sink=sink
+        )
+        assert stale == ["Stale"]
+        assert not sink.exists(os.path.join(path, "Stale", "package.mo"))
+        export_manifest.delete_manifest(path, sink=sink)
+        sink.close()
+        assert not os.path.exists(os.path.join(path, "teaser_manifest.json"))
+        assert not os.path.exists(os.path.join(path, "Stale"))
+
     def test_retrofit_all_buildings(self):
         """test of retrofit_all_buildings, no calculation verification"""
         prj.add_residential(
@@ -2235,6 +3165,235 @@ class Test_teaser(object):
             1988, "Kunststofffenster, Isolierverglasung", prj.data
         )
 
+    def test_find_type_elements(self):
+        """test of the type element index against a scan of element_bind"""
+        from teaser.data.dataclass import DataClass
+
+        data = DataClass(used_statistic="tabula_de")
+        for element_type in ["OuterWall", "Rooftop", "Window", "Floor"]:
+            for construction in [
+                "tabula_standard_1_SFH",
+                "tabula_retrofit_1_SFH",
+            ]:
+                for year in [1800, 1859, 1860, 1968, 1995, 2015]:
+                    expected = [
+                        key
+                        for key, element_in in data.element_bind.items()
+                        if key != "version"
+                        and element_in["building_age_group"][0]
+                        <= year
+                        <= element_in["building_age_group"][1]
+                        and element_in["construction_type"] == construction
+                        and key.startswith(element_type)
+                    ]
+                    found = data.find_type_elements(
+                        element_type=element_type,
+                        year=year,
+                        construction=construction,
+                    )
+                    assert [key for key, element_in in found] == expected
+
+        key = next(key for key in data.element_bind if key != "version")
+        element_in = data.element_bind[key]
+        data.writable_binding("element_bind")
+        del data.element_bind[key]
+        data.invalidate_element_index()
+        assert key not in [
+            found_key
+            for found_key, found_in in data.find_type_elements(
+                element_type=key.split("_")[0],
+                year=element_in["building_age_group"][0],
+                construction=element_in["construction_type"],
+            )
+        ]
+
+    def test_load_material_id(self):
+        """test of material lookup by id and name with prototypes"""
+        from teaser.data.dataclass import DataClass
+        from teaser.logic.buildingobjects.buildingphysics.material import Material
+
+        data = DataClass(used_statistic=None)
+        mat_id = next(key for key in data.material_bind if key != "version")
+        mat = data.material_bind[mat_id]
+
+        material_a = Material()
+        material_a.load_material_template(mat_name=mat["name"], data_class=data)
+        material_b = Material()
+        material_b.load_material_template(mat_name=mat["name"], data_class=data)
+        assert material_a.density == float(mat["density"])
+        assert material_a.thermal_conduc == float(mat["thermal_conduc"])
+        assert material_a.thickness_list == mat["thickness_list"]
+        assert material_a.thickness_list is not material_b.thickness_list
+        assert data.get_material_prototype(mat_id) is data.get_material_prototype(
+            mat_id
+        )
+        try:
+            data.get_material_prototype(mat_id).density = 0.0
+            assert False
+        except AttributeError:
+            pass
+
+        last_id = [
+            key
+            for key, check in data.material_bind.items()
+            if key != "version" and check["name"] == mat["name"]
+        ][-1]
+        assert data.find_material_id(mat["name"]) == last_id
+        assert data.find_material_id("not_a_material") is None
+
+        data.writable_binding("material_bind")
+        data.material_bind[last_id]["density"] = 1.0
+        data.invalidate_material_index()
+        material_c = Material()
+        material_c.load_material_template(mat_name=mat["name"], data_class=data)
+        assert material_c.material_id == last_id
+        assert material_c.density == 1.0
+
+    def test_shared_bindings(self):
+        """test of shared JSON bindings with copy-on-write"""
+        from teaser.data.dataclass import DataClass
+
+        data_a = DataClass(used_statistic="tabula_de")
+        data_b = DataClass(used_statistic="tabula_de")
+        assert data_a.element_bind is data_b.element_bind
+        assert data_a.material_bind is data_b.material_bind
+        assert data_a.conditions_bind is data_b.conditions_bind
+
+        key = next(key for key in data_a.element_bind if key != "version")
+        element_bind = data_a.writable_binding("element_bind")
+        assert element_bind is data_a.element_bind
+        assert element_bind is not data_b.element_bind
+        assert data_a.writable_binding("element_bind") is element_bind
+        del element_bind[key]
+        assert key in data_b.element_bind
+        assert key in DataClass(used_statistic="tabula_de").element_bind
+
+    def test_compiled_bindings(self):
+        """test of the compiled cache of JSON bindings"""
+        import json
+        import pickle
+        import shutil
+        from teaser.data import dataclass
+        from teaser.data.precompile import precompile
+
+        path = utilities.get_full_path("data/input/inputdata/unitTestUC.json")
+        shutil.copyfile(prj.data.path_uc, path)
+        compiled_path = dataclass.get_compiled_path(path)
+        assert precompile(paths=[path]) == [compiled_path]
+        assert os.path.isfile(compiled_path)
+
+        def load_without_json():
+            """Load the binding, parsing the JSON file raises an error"""
+            dataclass.clear_binding_registry()
+            loads = dataclass.json.loads
+
+            def fail(*args, **kwargs):
+                raise AssertionError("JSON parsed instead of the compiled cache")
+
+            dataclass.json.loads = fail
+            try:
+                return dataclass.load_json_binding(path)
+            finally:
+                dataclass.json.loads = loads
+
+        assert load_without_json() == dataclass.load_json_binding(prj.data.path_uc)
+
+        # broken or unsupported caches fall back to the JSON file
+        with open(compiled_path, "wb") as f:
+            f.write(b"\x80\xffbroken")
+        dataclass.clear_binding_registry()
+        assert dataclass.load_json_binding(path) == dataclass.load_json_binding(
+            prj.data.path_uc
+        )
+        with open(compiled_path, "wb") as f:
+            f.write(b"cteaser.data.dataclass\nMissingClass\n.")
+        dataclass.clear_binding_registry()
+        assert len(dataclass.load_json_binding(path)) > 1
+
+        precompile(paths=[path])
+        with open(path, "w") as f:
+            f.write('{"version": "0.7"}')
+        dataclass.clear_binding_registry()
+        assert list(dataclass.load_json_binding(path).keys()) == ["version"]
+        os.remove(path)
+        os.remove(compiled_path)
+
+        # caches are neither written nor used outside of the input data
+        path = os.path.join(utilities.get_default_path(), "unitTestUC.json")
+        with open(path, "w") as f:
+            json.dump({"version": "0.7"}, f)
+        try:
+            precompile(paths=[path])
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("ValueError not raised")
+        with open(dataclass.get_compiled_path(path), "wb") as f:
+            pickle.dump({"sha256": "", "binding": {"version": "0.0"}}, f)
+        dataclass.clear_binding_registry()
+        assert dataclass.load_json_binding(path)["version"] == "0.7"
+        os.remove(path)
+        os.remove(dataclass.get_compiled_path(path))
+        dataclass.clear_binding_registry()
+
+    def test_import_time(self):
+        """test of the import time of teaser.project, without heavy imports"""
+        import subprocess
+        import sys
+        import teaser
+
+        # cumulative import time [us] of teaser.project without numpy, best
+        # of up to three runs; about 0.1 s, 0.5 s with pandas and mako
+        # imported eagerly
+        budget = 300000
+        own_times = []
+        for run in range(3):
+            output = subprocess.run(
+                [sys.executable, "-X", "importtime", "-c", "import teaser.project"],
+                cwd=os.path.dirname(os.path.dirname(teaser.__file__)),
+                stderr=subprocess.PIPE,
+                universal_newlines=True,
+                check=True,
+            ).stderr
+            imported = {}
+            for line in output.splitlines():
+                if line.startswith("import time:") and "|" in line:
+                    self_us, cumulative_us, name = line[12:].split("|")
+                    if cumulative_us.strip().isdigit():
+                        imported[name.strip()] = int(cumulative_us)
+            for module in ["pandas", "mako", "mako.template", "scipy"]:
+                assert module not in imported
+            own_times.append(imported["teaser.project"] - imported.get("numpy", 0))
+            if own_times[-1] < budget:
+                break
+        assert min(own_times) < budget, "import of teaser.project took {} us".format(
+            min(own_times)
+        )
+
+    def test_template_cache(self):
+        """test of the shared cache of compiled Modelica templates"""
+        import shutil
+        import teaser.data.output.template_cache as template_cache
+
+        template = template_cache.get_template("AixLib/AixLib_Multizone")
+        assert template_cache.get_template("AixLib/AixLib_Multizone") is template
+        assert template.lookup is template_cache.get_template("package").lookup
+
+        module_directory = os.path.join(
+            utilities.get_default_path(), "unitTestTemplateModules"
+        )
+        shutil.rmtree(module_directory, ignore_errors=True)
+        try:
+            template_cache.set_module_directory(module_directory)
+            template_cache.get_template("IBPSA/IBPSA_TwoElements")
+            assert os.path.isfile(
+                os.path.join(module_directory, "IBPSA", "IBPSA_TwoElements.py")
+            )
+        finally:
+            template_cache.set_module_directory(None)
+            shutil.rmtree(module_directory, ignore_errors=True)
+        assert template_cache.get_template("AixLib/AixLib_Multizone") is not template
+
     def test_save_type_element(self):
         """test of save_type_element, no parameter checking"""
         import os
@@ -2280,6 +3439,83 @@ class Test_teaser(object):
         assert round(therm_zone.outer_walls[0].r3, 12) == 0.137027879186
         assert round(therm_zone.outer_walls[0].c1_korr, 6) == 111237.213205
 
+    def test_calc_equivalent_res_batch(self):
+        """test of vectorized calc_equivalent_res for several walls"""
+        from teaser.logic.buildingobjects.buildingphysics import equivalentres
+
+        prj.set_default()
+        helptest.building_test2(prj)
+        therm_zone = prj.buildings[-1].thermal_zones[-1]
+        walls = therm_zone.outer_walls + therm_zone.inner_walls
+        single = []
+        for wall in walls:
+            wall.calc_equivalent_res()
+            single.append((wall.r1, wall.r2, wall.r3, wall.c1, wall.c2,
+                           wall.c1_korr))
+            wall.set_calc_default()
+
+        equivalentres.unit_res_cache.clear()
+        equivalentres.calc_equivalent_res(elements=walls)
+
+        for wall, values in zip(walls, single):
+            batch = (wall.r1, wall.r2, wall.r3, wall.c1, wall.c2, wall.c1_korr)
+            for value_single, value_batch in zip(values, batch):
+                assert math.isclose(value_single, value_batch, rel_tol=1e-12)
+
+        # missing and zero areas raise errors instead of NaN values
+        for area, error in [(None, TypeError), (0.0, ZeroDivisionError)]:
+            walls[1]._area = area
+            try:
+                equivalentres.calc_equivalent_res(elements=walls)
+            except error:
+                pass
+            else:
+                raise AssertionError("{} not raised".format(error.__name__))
+
+        prj.set_default()
+        helptest.building_test2(prj)
+        helptest.building_test2(prj)
+        prj.buildings[-1].thermal_zones[-1].outer_walls[0]._area = None
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            prj.calc_all_buildings()
+        assert len(prj.buildings) == 1
+        prj.set_default()
+
+    def test_calc_equivalent_res_cache(self):
+        """test of unit area cache for calc_equivalent_res"""
+        from teaser.logic.buildingobjects.buildingphysics import equivalentres
+
+        prj.set_default()
+        helptest.building_test2(prj)
+        therm_zone = prj.buildings[-1].thermal_zones[-1]
+        wall = therm_zone.outer_walls[0]
+        cache = equivalentres.unit_res_cache
+        cache.clear()
+
+        wall.calc_equivalent_res()
+        assert cache.misses == 1
+        assert cache.hits == 0
+        r1 = wall.r1
+        c1 = wall.c1
+
+        wall.area = wall.area * 2
+        wall.calc_equivalent_res()
+        assert cache.hits == 1
+        assert math.isclose(wall.r1, r1 / 2, rel_tol=1e-12)
+        assert math.isclose(wall.c1, c1 * 2, rel_tol=1e-12)
+        wall.area = wall.area / 2
+
+        wall.calc_equivalent_res(t_bt=5)
+        assert cache.misses == 2
+
+        maxsize = cache.maxsize
+        cache.maxsize = 1
+        wall.calc_equivalent_res()
+        assert len(cache) == 1
+        cache.maxsize = maxsize
+        cache.clear()
+
     def test_insulate_wall(self):
         """test of insulate_wall"""
         therm_zone = prj.buildings[-1].thermal_zones[-1]
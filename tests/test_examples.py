@@ -67,3 +67,9 @@ class Test_examples(object):
         from teaser.examples import e8_change_boundary_conditions as e8
 
         prj = e8.example_change_boundary_conditions()
+
+    def test_e10_example_simulate_project(self):
+        """Tests the executability of example 10"""
+        from teaser.examples import e10_simulate_project as e10
+
+        result = e10.example_simulate_project(hours=168)
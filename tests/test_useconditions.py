@@ -142,3 +142,95 @@ class Test_useconditions(object):
         use_cond.with_ahu = False
         with pytest.raises(Exception):
             use_cond.with_ideal_thresholds = True
+
+    def test_lazy_schedules(self):
+        """Test that schedules are created from the base profiles on access."""
+        from teaser.logic.buildingobjects.buildingsystems.buildingahu import (
+            BuildingAHU,
+        )
+
+        prj.set_default()
+        helptest.building_test2(prj)
+        use_cond = prj.buildings[-1].thermal_zones[-1].use_conditions
+        use_cond.heating_profile = [290.15] * 24 + [295.15] * 24
+        assert use_cond._schedules is None
+        assert len(use_cond.schedules) == 8760
+        assert use_cond.schedules is use_cond.schedules
+        assert list(use_cond.schedules["heating_profile"][:48]) == (
+            [290.15] * 24 + [295.15] * 24
+        )
+        assert use_cond.schedules["heating_profile"].iloc[-1] == 290.15
+
+        use_cond.persons_profile = 0.5
+        assert use_cond._schedules is None
+        assert (use_cond.schedules["persons_profile"] == 0.5).all()
+
+        ahu = BuildingAHU(parent=prj.buildings[-1])
+        ahu.max_relative_humidity_profile = [0.7]
+        assert ahu.min_relative_humidity_profile == 25 * [0.45]
+        assert (ahu.schedules["max_relative_humidity_profile"] == 0.7).all()
+        assert (ahu.schedules["min_relative_humidity_profile"] == 0.45).all()
+
+    def test_interned_profiles(self):
+        """Test that zones with equal profiles share one Profile."""
+        import copy
+        from teaser.logic.buildingobjects.useconditions import UseConditions
+
+        use_cond_a = UseConditions()
+        use_cond_b = UseConditions()
+        use_cond_a.load_use_conditions("Living", data_class=prj.data)
+        use_cond_b.load_use_conditions("Living", data_class=prj.data)
+        assert use_cond_a._persons_profile is use_cond_b._persons_profile
+        assert use_cond_a._heating_profile is use_cond_b._heating_profile
+
+        persons_profile = use_cond_a.persons_profile
+        assert isinstance(persons_profile, list)
+        persons_profile[0] = 0.99
+        assert use_cond_a.persons_profile != persons_profile
+
+        use_cond_a.persons_profile = persons_profile
+        assert use_cond_a.persons_profile == persons_profile
+        assert use_cond_a._persons_profile is not use_cond_b._persons_profile
+        assert use_cond_b.persons_profile[0] != 0.99
+
+        use_cond_b.persons_profile = list(persons_profile)
+        assert use_cond_a._persons_profile is use_cond_b._persons_profile
+        assert (
+            use_cond_a.schedules["persons_profile"].values
+            == use_cond_b.schedules["persons_profile"].values
+        ).all()
+        assert (
+            copy.deepcopy(use_cond_a)._persons_profile is use_cond_a._persons_profile
+        )
+
+    def test_write_table(self):
+        """Test the Modelica table writer against the pandas output."""
+        import io
+        import pandas as pd
+        import teaser.logic.schedules as schedules
+        from teaser.logic.buildingobjects.useconditions import UseConditions
+
+        use_cond = UseConditions()
+        use_cond.load_use_conditions("Living", data_class=prj.data)
+        columns = [
+            use_cond.schedules["heating_profile"],
+            use_cond.schedules["persons_profile"] * 0.1,
+            [0, 1],
+        ]
+        path = os.path.join(utilities.get_default_path(), "unitTestTable.txt")
+        schedules.write_table(path=path, name="Test", columns=columns)
+
+        export = pd.DataFrame(
+            index=[(i + 1) * 3600 for i in range(8760)],
+            data={
+                "heating": columns[0].values,
+                "persons": columns[1].values,
+                "dummy": schedules.expand_profile(columns[2]),
+            },
+        )
+        expected = io.StringIO()
+        export.to_csv(expected, sep="\t", header=False, index_label=False)
+        with open(path) as f:
+            assert f.readline() == "#1\n"
+            assert f.readline() == "double Test(8760, 4)\n"
+            assert f.read() == expected.getvalue()